@@ -0,0 +1,129 @@
+# -----------------------------------------------------------------------------
+# Benchmark de Inicialização do Sistema de Controle da Aurora I
+# -----------------------------------------------------------------------------
+# Mede, em interpretadores novos (sem cache de módulos em memória):
+# - o tempo até o menu principal estar na tela (import de main.py + menu);
+# - o custo de importação de cada módulo de subsistema, no estilo de
+#   'python -X importtime', com as dependências mais caras de cada um.
+#
+# Uso:
+#   python benchmark_inicializacao.py [--repeticoes N] [--limite-menu-ms MS]
+# Com --limite-menu-ms, termina com código 1 se o tempo até o menu passar do limite.
+# -----------------------------------------------------------------------------
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DIRETORIO_PROJETO = os.path.dirname(os.path.abspath(__file__))
+
+MODULOS_SUBSISTEMAS = [
+    "modulo_pressurizacao",
+    "modulo_diagnostico",
+    "modulo_monitoramento_vital",
+    "modulo_painel_comando",
+]
+
+# Executado no processo filho: importa main e exibe o menu, sem entrar no loop
+CODIGO_ATE_MENU = (
+    "import time, io, contextlib\n"
+    "t0 = time.perf_counter()\n"
+    "import main\n"
+    "with contextlib.redirect_stdout(io.StringIO()):\n"
+    "    main.exibir_menu_principal()\n"
+    "print((time.perf_counter() - t0) * 1000.0)\n"
+)
+
+
+def _executar_python(argumentos):
+    return subprocess.run([sys.executable, *argumentos], cwd=DIRETORIO_PROJETO,
+                          capture_output=True, text=True, encoding="utf-8")
+
+
+def medir_tempo_ate_menu(repeticoes=5):
+    """Retorna listas (ms) do tempo interno até o menu e do tempo total do processo."""
+    tempos_internos, tempos_processo = [], []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = _executar_python(["-c", CODIGO_ATE_MENU])
+        duracao_processo = (time.perf_counter() - inicio) * 1000.0
+        if resultado.returncode != 0:
+            raise RuntimeError(f"Falha ao carregar o menu: {resultado.stderr.strip()}")
+        tempos_internos.append(float(resultado.stdout.strip().splitlines()[-1]))
+        tempos_processo.append(duracao_processo)
+    return tempos_internos, tempos_processo
+
+
+def _ler_importtime(saida_erro):
+    """Converte as linhas de '-X importtime' em lista de (modulo, proprio_us, acumulado_us)."""
+    registros = []
+    for linha in saida_erro.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        try:
+            _, dados = linha.split(":", 1)
+            proprio, acumulado, nome = dados.split("|")
+            registros.append((nome.strip(), int(proprio), int(acumulado)))
+        except ValueError:
+            continue
+    return registros
+
+
+def medir_importacao_modulo(nome_modulo, repeticoes=3, dependencias_exibidas=3):
+    """
+    Custo de importar o módulo (acumulado, em ms, menor das repetições) e as
+    dependências com maior custo próprio. Retorna (ms, dependencias, erro).
+    """
+    melhor_ms, dependencias, erro = None, [], None
+    for _ in range(repeticoes):
+        resultado = _executar_python(["-X", "importtime", "-c", f"import {nome_modulo}"])
+        if resultado.returncode != 0:
+            ultima_linha = resultado.stderr.strip().splitlines()[-1:] or ["erro desconhecido"]
+            return None, [], ultima_linha[0]
+        registros = _ler_importtime(resultado.stderr)
+        total = next((acumulado for nome, _, acumulado in registros if nome == nome_modulo), None)
+        if total is not None and (melhor_ms is None or total / 1000.0 < melhor_ms):
+            melhor_ms = total / 1000.0
+            dependencias = sorted((r for r in registros if r[0] != nome_modulo), key=lambda r: r[1], reverse=True)
+            dependencias = [(nome, proprio / 1000.0) for nome, proprio, _ in dependencias[:dependencias_exibidas]]
+    return melhor_ms, dependencias, erro
+
+
+def executar_benchmark(repeticoes=5, limite_menu_ms=None):
+    print("\n--- BENCHMARK DE INICIALIZAÇÃO - AURORA I ---")
+    internos, processo = medir_tempo_ate_menu(repeticoes)
+    mediana_menu = statistics.median(internos)
+    print(f"Tempo até o menu (import main + menu): mediana {mediana_menu:7.2f} ms | mínimo {min(internos):7.2f} ms")
+    print(f"Processo completo (interpretador + menu): mediana {statistics.median(processo):7.2f} ms")
+
+    print("\n-- Custo de importação por subsistema (carregado sob demanda) --")
+    for nome_modulo in MODULOS_SUBSISTEMAS:
+        custo_ms, dependencias, erro = medir_importacao_modulo(nome_modulo)
+        if erro:
+            print(f"  {nome_modulo:<28}: FALHA NA IMPORTAÇÃO ({erro})")
+            continue
+        print(f"  {nome_modulo:<28}: {custo_ms:7.2f} ms")
+        for nome_dep, proprio_ms in dependencias:
+            print(f"      - {nome_dep:<32} {proprio_ms:7.2f} ms (próprio)")
+    print("-------------------------------------------------")
+
+    if limite_menu_ms is not None and mediana_menu > limite_menu_ms:
+        print(f"[FALHA] Tempo até o menu ({mediana_menu:.2f} ms) acima do limite de {limite_menu_ms:.2f} ms.")
+        return False
+    return True
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização do main.py da Aurora I.")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Execuções para o tempo até o menu.")
+    parser.add_argument("--limite-menu-ms", type=float, default=None,
+                        help="Falha (código 1) se a mediana do tempo até o menu passar deste valor.")
+    opcoes = parser.parse_args()
+    try:
+        sys.exit(0 if executar_benchmark(opcoes.repeticoes, opcoes.limite_menu_ms) else 1)
+    except KeyboardInterrupt:
+        print("\n\nBenchmark interrompido pelo usuário.")
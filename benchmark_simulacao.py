@@ -0,0 +1,436 @@
+# -----------------------------------------------------------------------------
+# Benchmark dos Caminhos Críticos da Simulação da Aurora I
+# -----------------------------------------------------------------------------
+# Mede os trechos executados com mais frequência, sem esperas reais (relógio
+# em modo rápido) e sem saída no console (stdout descartado, input() roteirizado):
+# - monitorar_condicoes_atuais para vários tamanhos de tripulação, cada
+#   tripulante com linha de base própria (verificações e leituras por segundo);
+# - _verificar_status_parametro (chamadas por segundo);
+# - simular_passagem_tempo e o comando 'impulso' (passos por segundo);
+# - executar_diagnostico_completo (latência de uma varredura);
+# - geração de perfis de pressão da câmara de ar (sem cache e com cache).
+#
+# Uso:
+#   python benchmark_simulacao.py [--repeticoes N] [--filtro TEXTO]
+#                                 [--salvar-baseline ARQ.json]
+#                                 [--comparar ARQ.json] [--limite-regressao-pct P]
+# Com --comparar, termina com código 1 se algum resultado piorar mais que P%.
+# -----------------------------------------------------------------------------
+
+import argparse
+import builtins
+import contextlib
+import datetime
+import io
+import json
+import platform
+import sys
+import time
+
+import modulo_aleatorio
+import modulo_relogio_simulacao
+
+SEMENTE_PADRAO = 2031
+LIMITE_REGRESSAO_PADRAO_PCT = 10.0
+TAMANHOS_TRIPULACAO = (7, 50, 500, 5000)
+VELOCIDADE_CRUZEIRO_BENCHMARK_KMH = 1.0 # Lenta o bastante para não chegar a Marte
+RESERVA_CRUZEIRO_BENCHMARK_UAC = 1_000.0 # Folga para a perda de um evento além do consumo do passo
+FRACAO_MAXIMA_REINICIOS_BENCHMARK = 0.01 # Passos de voo que podem precisar restaurar o cruzeiro
+DISPERSAO_LINHA_BASE = 0.05 # Variação relativa das médias individuais na tripulação sintética
+VERSAO_FORMATO_BASELINE = 1
+TEMPO_MINIMO_AMOSTRA_S = 0.1 # Duração mínima de cada amostra cronometrada
+
+# Unidades: throughput (maior é melhor) ou latência (menor é melhor)
+UNIDADE_OPS_S = "ops/s"
+UNIDADE_MS = "ms"
+
+
+def _cronometrar(funcao, repeticoes, tempo_minimo_s=TEMPO_MINIMO_AMOSTRA_S):
+    """
+    Retorna o menor tempo (s) de UMA chamada de funcao(). Como no timeit, o
+    número de chamadas por amostra é calibrado (dobrando) até cada amostra
+    durar ao menos 'tempo_minimo_s'; a calibração também serve de aquecimento.
+    O mínimo entre as 'repeticoes' amostras é o valor menos sensível a ruído.
+    """
+    chamadas = 1
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(chamadas):
+            funcao()
+        if time.perf_counter() - inicio >= tempo_minimo_s:
+            break
+        chamadas *= 2
+
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for _ in range(chamadas):
+            funcao()
+        duracao = (time.perf_counter() - inicio) / chamadas
+        if melhor is None or duracao < melhor:
+            melhor = duracao
+    return melhor
+
+
+@contextlib.contextmanager
+def _sem_console(respostas_comandos=()):
+    """Descarta o stdout e responde input(): os comandos roteirizados vão para
+       o prompt de comandos do painel; qualquer outra pergunta recebe Enter."""
+    comandos = list(respostas_comandos)
+    input_original = builtins.input
+
+    def _input(prompt=""):
+        if prompt.startswith("Comandos") and comandos:
+            return comandos.pop(0)
+        return "sair" if prompt.startswith("Comandos") else ""
+
+    builtins.input = _input
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = input_original
+
+
+# --- Casos de Benchmark ---
+# Cada caso retorna uma lista de (nome, valor, unidade).
+
+def _catalogo_sintetico(tamanho):
+    """Catálogo com os parâmetros de tripulacao.json e 'tamanho' tripulantes,
+       cada um com média própria (±DISPERSAO_LINHA_BASE) em todo parâmetro vital."""
+    import modulo_monitoramento_vital as vital
+    import modulo_tripulacao
+    base = vital.CATALOGO_TRIPULACAO
+    sorteio = modulo_aleatorio.fluxo("benchmark_tripulacao")
+    tripulacao = [
+        {"id": f"Astronauta_{i+1:02d}",
+         "sim": {nome: [base.parametros[nome]["sim"][0] * (1.0 + sorteio.uniform(-DISPERSAO_LINHA_BASE, DISPERSAO_LINHA_BASE)),
+                        base.parametros[nome]["sim"][1]]
+                 for nome in base.vitais}}
+        for i in range(tamanho)]
+    return modulo_tripulacao.CatalogoTripulacao(base.parametros.values(), tripulacao)
+
+
+def medir_monitoramento(repeticoes):
+    import modulo_monitoramento_vital as vital
+    resultados = []
+    for tamanho in TAMANHOS_TRIPULACAO:
+        catalogo = _catalogo_sintetico(tamanho)
+        verificacoes = max(1, 700 // tamanho)
+        leituras_por_verificacao = len(catalogo.ambiente) + tamanho * len(catalogo.vitais)
+
+        def _rodada():
+            for _ in range(verificacoes):
+                vital.monitorar_condicoes_atuais(disparar_alarme=False, catalogo=catalogo)
+
+        duracao = _cronometrar(_rodada, repeticoes)
+        resultados.append((f"monitoramento.verificacoes_s.tripulacao_{tamanho}",
+                           verificacoes / duracao, UNIDADE_OPS_S))
+        resultados.append((f"monitoramento.leituras_s.tripulacao_{tamanho}",
+                           verificacoes * leituras_por_verificacao / duracao, UNIDADE_OPS_S))
+
+        # Atualização parcial (um sensor) no agregador incremental, após uma varredura completa
+        agregador = vital.AgregadorStatus(catalogo)
+        vital.monitorar_condicoes_atuais(disparar_alarme=False, agregador=agregador, catalogo=catalogo)
+        parametro = "Frequencia Cardiaca"
+        info = vital.PARAMETROS_MONITORADOS[parametro]
+        leituras = [(catalogo.ids[i % tamanho], vital._simular_leitura_sensor(info))
+                    for i in range(5_000)]
+
+        def _atualizacoes():
+            atualizar = agregador.atualizar_leitura
+            for tripulante, valor in leituras:
+                atualizar(tripulante, parametro, valor)
+
+        duracao = _cronometrar(_atualizacoes, repeticoes)
+        resultados.append((f"monitoramento.atualizacoes_parciais_s.tripulacao_{tamanho}",
+                           len(leituras) / duracao, UNIDADE_OPS_S))
+    return resultados
+
+
+def medir_verificacao_parametro(repeticoes):
+    import modulo_monitoramento_vital as vital
+    # Leituras pré-sorteadas para medir só a classificação
+    leituras = [(vital._simular_leitura_sensor(info), info)
+                for info in vital.PARAMETROS_MONITORADOS.values() for _ in range(2000)]
+    verificar = vital._verificar_status_parametro
+
+    def _rodada():
+        for valor, info in leituras:
+            verificar(valor, info)
+
+    duracao = _cronometrar(_rodada, repeticoes)
+    return [("monitoramento.verificar_status_parametro_s", len(leituras) / duracao, UNIDADE_OPS_S)]
+
+
+def medir_painel_voo(repeticoes):
+    import modulo_painel_comando as painel_mod
+    relogio = modulo_relogio_simulacao.RelogioSimulacao(modulo_relogio_simulacao.MODO_RAPIDO)
+    passos = 20_000
+    resultados = []
+
+    class _PainelEmCruzeiro(painel_mod.PainelComandosNave):
+        """Nave lenta o bastante para não chegar a Marte. Eventos como a
+           assistência gravitacional aceleram a nave e esgotam o combustível, e o
+           passo viraria um retorno antecipado. Por isso, só quando o próximo
+           passo sairia do cruzeiro (pouco combustível, chegada ou nave parada)
+           o estado é restaurado e contado em 'reinicios'."""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.velocidade_atual_kmh = VELOCIDADE_CRUZEIRO_BENCHMARK_KMH
+            self.reinicios = 0
+
+        def simular_passagem_tempo(self, horas_a_simular):
+            consumo_passo = painel_mod._consumo_por_hora(self.velocidade_atual_kmh, self.modo_eco_ativo) * horas_a_simular
+            if (self.combustivel_uac < consumo_passo + RESERVA_CRUZEIRO_BENCHMARK_UAC
+                    or self.distancia_marte_km <= self.velocidade_atual_kmh * horas_a_simular
+                    or self.velocidade_atual_kmh <= 0):
+                self.reinicios += 1
+                self.combustivel_uac = painel_mod.CAPACIDADE_TOTAL_UAC
+                self.distancia_marte_km = painel_mod.DISTANCIA_INICIAL_MARTE_KM
+                self.velocidade_atual_kmh = VELOCIDADE_CRUZEIRO_BENCHMARK_KMH
+            return super().simular_passagem_tempo(horas_a_simular)
+
+    def _conferir_cruzeiro(painel, passos_medidos, caso):
+        # Muitos reinícios = a medição deixou de ser o caminho normal de um passo de voo
+        if painel.reinicios > passos_medidos * FRACAO_MAXIMA_REINICIOS_BENCHMARK:
+            raise RuntimeError(f"Benchmark '{caso}' inválido: {painel.reinicios} de {passos_medidos} passos "
+                               f"precisaram restaurar o cruzeiro (máximo {FRACAO_MAXIMA_REINICIOS_BENCHMARK:.0%}).")
+
+    def _passos_diretos():
+        painel = _PainelEmCruzeiro(relogio=relogio, exibir_logs=False)
+        for _ in range(passos):
+            painel.simular_passagem_tempo(painel_mod.HORAS_SIMULADAS_POR_INTERVALO)
+        _conferir_cruzeiro(painel, passos, "painel.simular_passagem_tempo_s")
+
+    duracao = _cronometrar(_passos_diretos, repeticoes)
+    resultados.append(("painel.simular_passagem_tempo_s", passos / duracao, UNIDADE_OPS_S))
+
+    # Comando 'impulso N' pela interface, com input() roteirizado e sem console
+    passos_impulso = 5_000
+
+    def _impulso():
+        painel = _PainelEmCruzeiro(relogio=relogio, exibir_logs=False)
+        with _sem_console([f"impulso {passos_impulso}", "sair"]):
+            painel.iniciar_interface()
+        _conferir_cruzeiro(painel, passos_impulso, "painel.impulso_passos_s")
+
+    duracao = _cronometrar(_impulso, repeticoes)
+    resultados.append(("painel.impulso_passos_s", passos_impulso / duracao, UNIDADE_OPS_S))
+
+    # Projeções 'prever V': velocidades novas (fora do cache) e repetidas (em cache)
+    painel = painel_mod.PainelComandosNave(relogio=relogio, exibir_logs=False)
+    velocidades = [1_000.0 + 7.0 * i for i in range(1_000)]
+
+    def _previsoes_novas():
+        painel_mod.projetar_chegada.cache_clear()
+        for velocidade in velocidades:
+            painel.prever(velocidade)
+
+    def _previsoes_em_cache():
+        for velocidade in velocidades:
+            painel.prever(velocidade)
+
+    duracao = _cronometrar(_previsoes_novas, repeticoes)
+    resultados.append(("painel.prever_s", len(velocidades) / duracao, UNIDADE_OPS_S))
+    duracao = _cronometrar(_previsoes_em_cache, repeticoes)
+    resultados.append(("painel.prever_em_cache_s", len(velocidades) / duracao, UNIDADE_OPS_S))
+    return resultados
+
+
+def medir_sorteio_eventos(repeticoes):
+    import modulo_eventos_voo as eventos
+    import modulo_painel_comando as painel_mod
+    # Catálogo grande e desbalanceado: o custo por sorteio deve ser o mesmo do catálogo do arquivo
+    catalogo_grande = eventos.CatalogoEventos(
+        [{"id": f"evento_{i:04d}", "peso": 1.0 + (i % 97), "mensagem": "EVENTO"} for i in range(1_000)],
+        painel_mod.EFEITOS_EVENTO)
+    uniformes = [i / 20_000 for i in range(20_000)]
+    resultados = []
+    for rotulo, catalogo in (("catalogo_arquivo", painel_mod.CATALOGO_EVENTOS), ("catalogo_1000", catalogo_grande)):
+        def _sorteios(sortear=catalogo.sortear):
+            for u in uniformes:
+                sortear(u)
+
+        duracao = _cronometrar(_sorteios, repeticoes)
+        resultados.append((f"eventos.sorteios_s.{rotulo}", len(uniformes) / duracao, UNIDADE_OPS_S))
+    return resultados
+
+
+def medir_diagnostico(repeticoes):
+    import modulo_diagnostico as diag
+    relogio = modulo_relogio_simulacao.RelogioSimulacao(modulo_relogio_simulacao.MODO_RAPIDO)
+    registro_grande = diag.RegistroSubsistemas(
+        [{"id": f"componente_{i:05d}", "categoria": "outros"} for i in range(5_000)])
+    resultados = []
+    for rotulo, registro in (("registro_padrao", diag.REGISTRO), ("registro_5000", registro_grande)):
+        def _varredura(registro=registro):
+            with _sem_console():
+                diag.executar_diagnostico_completo(registro=registro, relogio=relogio)
+
+        duracao = _cronometrar(_varredura, repeticoes)
+        resultados.append((f"diagnostico.varredura_ms.{rotulo}", duracao * 1000.0, UNIDADE_MS))
+    return resultados
+
+
+def medir_perfis_camara(repeticoes):
+    import modulo_pressurizacao as press
+    gerar_sem_cache = press.gerar_perfil_pressao.__wrapped__
+    parametros = [(press.ModeloCamaraAr(volume_m3=3.0 + 0.01 * i), 15.0, 0.0, 5.0 + (i % 10))
+                  for i in range(300)]
+
+    def _sem_cache():
+        for args in parametros:
+            gerar_sem_cache(*args)
+
+    def _com_cache():
+        for args in parametros:
+            press.gerar_perfil_pressao(*args)
+
+    duracao_fria = _cronometrar(_sem_cache, repeticoes)
+    duracao_quente = _cronometrar(_com_cache, repeticoes)
+    return [
+        ("camara.perfis_gerados_s", len(parametros) / duracao_fria, UNIDADE_OPS_S),
+        ("camara.perfis_em_cache_s", len(parametros) / duracao_quente, UNIDADE_OPS_S),
+    ]
+
+
+def medir_confiabilidade(repeticoes):
+    import modulo_confiabilidade as confiabilidade
+    if confiabilidade.np is None:
+        return [] # Motor vetorizado só com NumPy
+    modelo = confiabilidade.compilar_modelo()
+    missoes = 200_000
+
+    def _simulacao():
+        confiabilidade.simular_confiabilidade(missoes, modelo=modelo)
+
+    duracao = _cronometrar(_simulacao, repeticoes)
+    return [("confiabilidade.missoes_s", missoes / duracao, UNIDADE_OPS_S)]
+
+
+CASOS_BENCHMARK = {
+    "monitoramento": medir_monitoramento,
+    "verificacao_parametro": medir_verificacao_parametro,
+    "painel_voo": medir_painel_voo,
+    "eventos": medir_sorteio_eventos,
+    "diagnostico": medir_diagnostico,
+    "camara": medir_perfis_camara,
+    "confiabilidade": medir_confiabilidade,
+}
+
+
+def executar_casos(repeticoes=5, filtro=None, semente=SEMENTE_PADRAO):
+    """Executa os casos (opcionalmente filtrados pelo nome) e retorna
+       {nome_resultado: {"valor": ..., "unidade": ...}}."""
+    resultados = {}
+    for nome_caso, caso in CASOS_BENCHMARK.items():
+        if filtro and filtro not in nome_caso:
+            continue
+        modulo_aleatorio.semear(semente) # Mesmas leituras e eventos a cada execução
+        for nome, valor, unidade in caso(repeticoes):
+            resultados[nome] = {"valor": valor, "unidade": unidade}
+    return resultados
+
+
+# --- Baselines ---
+
+def salvar_baseline(resultados, caminho):
+    dados = {
+        "versao": VERSAO_FORMATO_BASELINE,
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+
+
+def carregar_baseline(caminho):
+    with open(caminho, encoding="utf-8") as arquivo:
+        dados = json.load(arquivo)
+    if dados.get("versao") != VERSAO_FORMATO_BASELINE:
+        raise ValueError(f"Formato de baseline não suportado em '{caminho}'.")
+    return dados
+
+
+def comparar_resultados(atuais, baseline, limite_regressao_pct=LIMITE_REGRESSAO_PADRAO_PCT):
+    """
+    Compara com a baseline. A variação é sempre expressa como piora positiva:
+    queda de throughput (ops/s) ou aumento de latência (ms).
+    Retorna lista de (nome, valor_base, valor_atual, unidade, piora_pct, regrediu).
+    """
+    comparacoes = []
+    for nome, atual in atuais.items():
+        base = baseline.get(nome)
+        if base is None or base["unidade"] != atual["unidade"] or base["valor"] <= 0:
+            continue
+        if atual["unidade"] == UNIDADE_MS:
+            piora_pct = (atual["valor"] - base["valor"]) / base["valor"] * 100.0
+        else:
+            piora_pct = (base["valor"] - atual["valor"]) / base["valor"] * 100.0
+        comparacoes.append((nome, base["valor"], atual["valor"], atual["unidade"],
+                            piora_pct, piora_pct > limite_regressao_pct))
+    return comparacoes
+
+
+def exibir_resultados(resultados):
+    print("\n--- BENCHMARK DA SIMULAÇÃO - AURORA I ---")
+    largura = max((len(nome) for nome in resultados), default=0)
+    for nome, dado in resultados.items():
+        print(f"  {nome:<{largura}} : {dado['valor']:>14,.2f} {dado['unidade']}")
+    print("-----------------------------------------")
+
+
+def exibir_comparacao(comparacoes, limite_regressao_pct):
+    print(f"\n--- COMPARAÇÃO COM A BASELINE (limite de regressão: {limite_regressao_pct:.1f}%) ---")
+    largura = max((len(c[0]) for c in comparacoes), default=0)
+    for nome, base, atual, unidade, piora_pct, regrediu in comparacoes:
+        marcador = "[REGRESSÃO]" if regrediu else "[ OK ]"
+        print(f"{marcador:<12} {nome:<{largura}} : {base:>12,.2f} -> {atual:>12,.2f} {unidade} "
+              f"({-piora_pct:+.1f}%)")
+    print("-----------------------------------------")
+
+
+def executar_benchmark(repeticoes=5, filtro=None, caminho_baseline_saida=None,
+                       caminho_baseline_comparacao=None, limite_regressao_pct=LIMITE_REGRESSAO_PADRAO_PCT):
+    """Executa o benchmark; retorna False se houver regressão acima do limite."""
+    resultados = executar_casos(repeticoes, filtro)
+    exibir_resultados(resultados)
+
+    if caminho_baseline_saida:
+        salvar_baseline(resultados, caminho_baseline_saida)
+        print(f"Baseline salva em '{caminho_baseline_saida}'.")
+
+    if caminho_baseline_comparacao:
+        baseline = carregar_baseline(caminho_baseline_comparacao)
+        comparacoes = comparar_resultados(resultados, baseline["resultados"], limite_regressao_pct)
+        exibir_comparacao(comparacoes, limite_regressao_pct)
+        regressoes = [c for c in comparacoes if c[5]]
+        if regressoes:
+            print(f"[FALHA] {len(regressoes)} resultado(s) pioraram mais de {limite_regressao_pct:.1f}%.")
+            return False
+    return True
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dos caminhos críticos da simulação da Aurora I.")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Repetições por caso (usa o melhor tempo).")
+    parser.add_argument("--filtro", default=None, help="Executa só os casos cujo nome contém este texto.")
+    parser.add_argument("--salvar-baseline", default=None, metavar="ARQ", help="Grava os resultados em JSON.")
+    parser.add_argument("--comparar", default=None, metavar="ARQ", help="Compara com uma baseline JSON.")
+    parser.add_argument("--limite-regressao-pct", type=float, default=LIMITE_REGRESSAO_PADRAO_PCT,
+                        help="Piora máxima tolerada (%%) antes de falhar com código 1.")
+    opcoes = parser.parse_args()
+    try:
+        sucesso = executar_benchmark(opcoes.repeticoes, opcoes.filtro, opcoes.salvar_baseline,
+                                     opcoes.comparar, opcoes.limite_regressao_pct)
+        sys.exit(0 if sucesso else 1)
+    except KeyboardInterrupt:
+        print("\n\nBenchmark interrompido pelo usuário.")
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"\nErro no benchmark: {e}")
+        sys.exit(1)
@@ -9,25 +9,47 @@
 # - modulo_diagnostico.py
 # - modulo_monitoramento_vital.py
 # - modulo_painel_comando.py
+#
+# Os módulos dos subsistemas são carregados sob demanda, na primeira vez que a
+# opção correspondente é escolhida. Assim o menu aparece rápido e, se um módulo
+# estiver com defeito, os demais continuam acessíveis.
 # -----------------------------------------------------------------------------
 
-try:  # Importar os módulos dos subsistemas da espaçonave
-    import modulo_pressurizacao
-    import modulo_diagnostico
-    import modulo_monitoramento_vital
-    import modulo_painel_comando
-except ImportError as e:
-    print(f"!!! ERRO CRÍTICO DE INICIALIZAÇÃO !!!")
-    print(f"Não foi possível encontrar um dos módulos necessários: {e}")
-    print("Verifique se todos os arquivos .py estão no mesmo diretório que 'main.py'.")
-    print("O sistema não pode continuar.")
-    exit() # Encerra o programa se um módulo essencial faltar
-
 # Importar bibliotecas padrão necessárias
 import sys
 import os # Necessário se usar a alternativa os.system
 import time
 import datetime # Para exibir data/hora
+import importlib # Para carregar os subsistemas sob demanda
+
+import modulo_metricas # Leve: métricas, endpoint /metrics e captura de perfil sob demanda
+
+# --- Carregamento Sob Demanda dos Subsistemas ---
+
+# Opção do menu -> nome do módulo do subsistema
+MODULOS_SUBSISTEMAS = {
+    '1': "modulo_pressurizacao",
+    '2': "modulo_diagnostico",
+    '3': "modulo_monitoramento_vital",
+    '4': "modulo_painel_comando",
+}
+
+_modulos_carregados = {} # Cache dos módulos já importados com sucesso
+
+def carregar_modulo(nome_modulo):
+    """Importa o módulo do subsistema na primeira vez que é usado.
+       Retorna o módulo, ou None se ele não puder ser carregado."""
+    if nome_modulo in _modulos_carregados:
+        return _modulos_carregados[nome_modulo]
+    try:
+        modulo = importlib.import_module(nome_modulo)
+    except Exception as e: # ImportError, SyntaxError, erro na inicialização do módulo...
+        print(f"\n[ERRO] Não foi possível carregar o subsistema '{nome_modulo}': {e}")
+        print("   Verifique se o arquivo está no mesmo diretório que 'main.py'.")
+        print("   Os demais sistemas continuam disponíveis no Menu Principal.")
+        return None # Não fica em cache: uma nova tentativa é feita na próxima escolha
+    _modulos_carregados[nome_modulo] = modulo
+    return modulo
 
 def limpar_tela():
     """Limpa a tela do terminal usando códigos ANSI (preferencial)
@@ -55,6 +77,7 @@ def exibir_menu_principal():
     print("  3. Monitoramento Vital e Ambiental (Contínuo)")
     print("  4. Painel de Comandos de Voo")
     print("-" * 50)
+    print("  P. Iniciar/Encerrar Captura de Perfil (cProfile)")
     print("  0. Encerrar Sistema de Controle Principal")
     print("=" * 50)
 
@@ -66,12 +89,20 @@ def processar_escolha_menu(escolha):
     """
     pausar_antes_de_retornar = True # Controla se pede "Pressione Enter"
 
+    # Carrega o módulo do subsistema escolhido (só na primeira vez)
+    if escolha in MODULOS_SUBSISTEMAS:
+        modulo = carregar_modulo(MODULOS_SUBSISTEMAS[escolha])
+        if modulo is None:
+            print("-" * 30)
+            input("Pressione Enter para retornar ao Menu Principal...")
+            return True
+
     if escolha == '1':
         limpar_tela()
         # Função de limpar a tela
         print("\n>>> Acessando Módulo [1]: Controle de Pressão da Câmara de Ar...")
         # Chama a função principal do módulo de pressurização
-        sucesso = modulo_pressurizacao.simular_ciclo_pressurizacao()
+        sucesso = modulo.simular_ciclo_pressurizacao()
         if sucesso:
             print("\n[INFO] Ciclo de pressurização concluído.")
         else:
@@ -82,8 +113,8 @@ def processar_escolha_menu(escolha):
         # Função de limpar a tela
         print("\n>>> Acessando Módulo [2]: Diagnóstico Geral da Espaçonave...")
         # Chama as funções do módulo de diagnóstico
-        painel_status_atual = modulo_diagnostico.executar_diagnostico_completo()
-        modulo_diagnostico.exibir_painel_controle(painel_status_atual)
+        painel_status_atual = modulo.executar_diagnostico_completo()
+        modulo.exibir_painel_controle(painel_status_atual)
         print("\n[INFO] Diagnóstico finalizado.")
 
     elif escolha == '3':
@@ -95,7 +126,7 @@ def processar_escolha_menu(escolha):
         print("   pressionando [Ctrl] + [C] quando solicitado ou a qualquer momento.")
         input("\n   Pressione Enter para iniciar o monitoramento...")
         # Chama a função de monitoramento contínuo (que tem seu próprio loop)
-        modulo_monitoramento_vital.iniciar_monitoramento_periodico(intervalo_segundos=20) # Intervalo de 20s
+        modulo.iniciar_monitoramento_periodico(intervalo_segundos=20) # Intervalo de 20s
         print("\n[INFO] Monitoramento contínuo encerrado. Retornando ao Menu Principal.")
         pausar_antes_de_retornar = False # O módulo já lidou com a saída
 
@@ -109,7 +140,7 @@ def processar_escolha_menu(escolha):
 
         # --- CORREÇÃO AQUI ---
         # 1. Crie uma instância (objeto) da classe PainelComandosNave
-        painel_nave = modulo_painel_comando.PainelComandosNave()
+        painel_nave = modulo.PainelComandosNave()
         # 2. Chame o método iniciar_interface() A PARTIR do objeto criado
         painel_nave.iniciar_interface()
         # --- FIM DA CORREÇÃO ---
@@ -119,6 +150,11 @@ def processar_escolha_menu(escolha):
 
     # ... (resto do código: opção '0', 'else', etc.) ...
 
+    elif escolha.lower() == 'p':
+        # Liga/desliga o cProfile; ao encerrar, salva o .prof e mostra as funções mais custosas
+        print("\n>>> Comando [P]: Captura de Perfil...")
+        print(modulo_metricas.alternar_perfil())
+
     elif escolha == '0':
         print("\n>>> Comando [0]: Encerrar Sistema Principal...")
         confirmar = input("   Tem certeza que deseja encerrar o sistema principal? (s/N): ").strip().lower()
@@ -151,6 +187,12 @@ def iniciar_sistema_controle():
     print(f"                      {timestamp_inicio}")
     print("*"*60)
 
+    # Métricas/endpoint /metrics e sinal de perfil, se pedidos por variáveis de ambiente
+    servidor_metricas = modulo_metricas.configurar_pelo_ambiente()
+    if servidor_metricas is not None:
+        host, porta = servidor_metricas.server_address[:2]
+        print(f"Métricas disponíveis em http://{host}:{porta}/metrics")
+
     continuar_executando = True
     while continuar_executando:
         limpar_tela() # Aqui está uma das edições após os testes para limpar o log
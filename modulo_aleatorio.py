@@ -0,0 +1,170 @@
+import os
+import random
+
+# -----------------------------------------------------------------------------
+# Serviço de Números Aleatórios da Aurora I
+# -----------------------------------------------------------------------------
+# Cada módulo (e cada trabalhador paralelo) recebe um FLUXO próprio, derivado
+# da semente da missão e do NOME do fluxo, não da ordem em que foi pedido.
+# Assim a mesma semente reproduz a mesma missão, rodando em série ou em
+# processos paralelos, e um módulo sortear mais números não altera os demais.
+#
+# Com NumPy: SeedSequence(semente, spawn_key=nome[+trabalhador]) -> Generator.
+# Sem NumPy: random.Random semeado com um hash estável do mesmo par.
+#
+# Os fluxos guardam blocos pré-sorteados (uniformes e normais padrão); os laços
+# quentes só leem o próximo valor de uma lista, sem chamar o gerador por valor.
+#
+# A semente vem de semear(), ou de AURORA_SEMENTE; sem ela, usa entropia do SO.
+# O NumPy só é importado no primeiro sorteio, para não pesar na inicialização.
+# -----------------------------------------------------------------------------
+
+TAMANHO_BLOCO_PADRAO = 4096
+
+_np = None # Módulo numpy (carregado sob demanda), ou False se indisponível
+
+
+def _numpy():
+    global _np
+    if _np is None:
+        try: # NumPy é opcional: com ele, cada fluxo usa Generator/PCG64 e sorteia blocos vetorizados
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np
+
+
+def _chave_fluxo(nome, trabalhador):
+    """spawn_key estável: bytes do nome (+ índice do trabalhador)."""
+    chave = tuple(nome.encode("utf-8"))
+    return chave if trabalhador is None else chave + (0x10000 + int(trabalhador),)
+
+
+class FluxoAleatorio:
+    """Fluxo independente com blocos pré-sorteados. Interface no estilo de 'random'."""
+
+    __slots__ = ("nome", "trabalhador", "tamanho_bloco", "_semente", "_gerador",
+                 "_uniformes", "_i_uniforme", "_normais", "_i_normal")
+
+    def __init__(self, nome, semente, trabalhador=None, tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+        self.nome = nome
+        self.trabalhador = trabalhador
+        self.tamanho_bloco = tamanho_bloco
+        self.resemear(semente)
+
+    def resemear(self, semente):
+        """Reinicia o fluxo com a semente da missão (o gerador é criado no próximo sorteio)."""
+        self._semente = semente
+        self._gerador = None
+        self._uniformes, self._i_uniforme = [], 0
+        self._normais, self._i_normal = [], 0
+
+    def _obter_gerador(self):
+        if self._gerador is None:
+            chave = _chave_fluxo(self.nome, self.trabalhador)
+            np = _numpy()
+            if np:
+                self._gerador = np.random.Generator(np.random.PCG64(
+                    np.random.SeedSequence(self._semente, spawn_key=chave)))
+            else:
+                self._gerador = random.Random(hash((self._semente, chave)) if self._semente is not None else None)
+        return self._gerador
+
+    def _recarregar_uniformes(self):
+        self._uniformes = self.bloco_uniformes(self.tamanho_bloco)
+        if _np:
+            self._uniformes = self._uniformes.tolist() # Floats nativos: leitura por índice mais rápida
+        self._i_uniforme = 0
+
+    def _recarregar_normais(self):
+        self._normais = self.bloco_normais(self.tamanho_bloco)
+        if _np:
+            self._normais = self._normais.tolist()
+        self._i_normal = 0
+
+    def random(self):
+        """Uniforme em [0, 1)."""
+        if self._i_uniforme >= len(self._uniformes):
+            self._recarregar_uniformes()
+        valor = self._uniformes[self._i_uniforme]
+        self._i_uniforme += 1
+        return valor
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def gauss(self, media=0.0, desvio=1.0):
+        if self._i_normal >= len(self._normais):
+            self._recarregar_normais()
+        valor = self._normais[self._i_normal]
+        self._i_normal += 1
+        return media + desvio * valor
+
+    def choice(self, sequencia):
+        return sequencia[int(self.random() * len(sequencia))]
+
+    def bloco_uniformes(self, n):
+        """n uniformes de uma vez (array NumPy, se disponível) para código vetorizado."""
+        gerador = self._obter_gerador()
+        if _np:
+            return gerador.random(n)
+        return [gerador.random() for _ in range(n)]
+
+    def bloco_normais(self, n):
+        gerador = self._obter_gerador()
+        if _np:
+            return gerador.standard_normal(n)
+        return [gerador.gauss(0.0, 1.0) for _ in range(n)]
+
+
+class ServicoAleatorio:
+    """Distribui fluxos nomeados derivados de uma única semente de missão."""
+
+    def __init__(self, semente=None, trabalhador=None):
+        self.semente = semente
+        self.trabalhador = trabalhador
+        self._fluxos = {}
+
+    def fluxo(self, nome, tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+        """Fluxo do módulo 'nome' (o mesmo objeto em chamadas repetidas)."""
+        fluxo = self._fluxos.get(nome)
+        if fluxo is None:
+            fluxo = self._fluxos[nome] = FluxoAleatorio(nome, self.semente, self.trabalhador, tamanho_bloco)
+        return fluxo
+
+    def para_trabalhador(self, indice):
+        """Serviço filho de um trabalhador paralelo: fluxos independentes dos
+           demais trabalhadores e do serviço pai, com a mesma semente."""
+        return ServicoAleatorio(self.semente, indice)
+
+    def semear(self, semente, trabalhador=None):
+        """Troca a semente (e o índice do trabalhador) e reinicia, no lugar,
+           todos os fluxos já entregues."""
+        self.semente = semente
+        self.trabalhador = trabalhador
+        for fluxo in self._fluxos.values():
+            fluxo.trabalhador = trabalhador
+            fluxo.resemear(semente)
+
+
+def _semente_do_ambiente():
+    valor = os.environ.get("AURORA_SEMENTE", "").strip()
+    try:
+        return int(valor) if valor else None
+    except ValueError:
+        return None
+
+
+# Serviço do processo: os módulos pegam seus fluxos daqui na importação
+SERVICO = ServicoAleatorio(_semente_do_ambiente())
+
+
+def fluxo(nome):
+    return SERVICO.fluxo(nome)
+
+
+def semear(semente, trabalhador=None):
+    """Define a semente da missão neste processo e, numa execução em lote, o
+       índice da réplica/trabalhador. Todos os fluxos dos módulos são reiniciados."""
+    SERVICO.semear(semente, trabalhador)
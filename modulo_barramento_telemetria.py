@@ -0,0 +1,255 @@
+from collections import deque, namedtuple
+
+# -----------------------------------------------------------------------------
+# Barramento de Telemetria da Aurora I (publicação/assinatura em processo)
+# -----------------------------------------------------------------------------
+# Liga os subsistemas sem que um importe o outro:
+# - tópicos tipados: cada tópico aceita um único tipo de mensagem (namedtuple);
+# - cada assinante tem um buffer circular limitado; se encher, as mensagens
+#   MAIS ANTIGAS são descartadas (e contadas), e quem publica nunca bloqueia;
+# - lotes são guardados uma única vez: os assinantes recebem visões (VisaoLote)
+#   sobre a mesma tupla, sem cópia.
+# Assinantes com 'tratador' são atendidos em despachar(), fora da publicação,
+# para que uma reação não rode dentro do código de quem publicou.
+# -----------------------------------------------------------------------------
+
+CAPACIDADE_PADRAO = 1024 # Mensagens por assinante
+
+
+class Topico(namedtuple("Topico", ["nome", "tipo"])):
+    """Tópico do barramento: nome e tipo (classe) das mensagens aceitas."""
+    __slots__ = ()
+
+
+# --- Tipos de Mensagem e Tópicos da Nave ---
+
+# Evento aleatório de voo (painel): tipo (id no catálogo de eventos, ex.: 'micrometeorito'),
+# sistema afetado (ou None) e grandeza associada (ex.: UAC perdidos)
+EventoVoo = namedtuple("EventoVoo", ["tipo", "mensagem", "sistema_afetado", "valor", "instante_s"])
+# Leitura ambiental da cabine (monitoramento)
+LeituraAmbiente = namedtuple("LeituraAmbiente", ["parametro", "valor", "unidade", "status", "instante_s"])
+# Resultado da verificação de um subsistema (diagnóstico)
+StatusSubsistema = namedtuple("StatusSubsistema", ["id", "nome", "status", "instante_s"])
+
+TOPICO_EVENTOS_VOO = Topico("voo.eventos", EventoVoo)
+TOPICO_LEITURAS_AMBIENTE = Topico("cabine.leituras", LeituraAmbiente)
+TOPICO_STATUS_SUBSISTEMAS = Topico("diagnostico.status", StatusSubsistema)
+
+
+class VisaoLote:
+    """Visão somente leitura de um trecho de um lote publicado (sem cópia)."""
+
+    __slots__ = ("_lote", "_inicio", "_fim")
+
+    def __init__(self, lote, inicio=0, fim=None):
+        self._lote = lote
+        self._inicio = inicio
+        self._fim = len(lote) if fim is None else fim
+
+    def __len__(self):
+        return self._fim - self._inicio
+
+    def __iter__(self):
+        lote = self._lote
+        for i in range(self._inicio, self._fim):
+            yield lote[i]
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            inicio, fim, passo = indice.indices(len(self))
+            if passo != 1:
+                raise ValueError("VisaoLote só aceita fatias contíguas.")
+            return VisaoLote(self._lote, self._inicio + inicio, self._inicio + max(inicio, fim))
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice fora da visão do lote.")
+        return self._lote[self._inicio + indice]
+
+    def __repr__(self):
+        return f"VisaoLote({len(self)} mensagens)"
+
+
+class Assinatura:
+    """Buffer circular de um assinante, com descarte das mensagens mais antigas."""
+
+    def __init__(self, barramento, topico, capacidade=CAPACIDADE_PADRAO, tratador=None):
+        if capacidade <= 0:
+            raise ValueError("A capacidade de uma assinatura deve ser > 0.")
+        self.barramento = barramento
+        self.topico = topico
+        self.capacidade = capacidade
+        self.tratador = tratador # tratador(mensagem) chamado em Barramento.despachar()
+        self.descartadas = 0     # Mensagens perdidas por buffer cheio
+        self.recebidas = 0
+        self._visoes = deque()
+        self._pendentes = 0
+
+    def __len__(self):
+        return self._pendentes
+
+    def _enfileirar(self, visao):
+        n = len(visao)
+        if n > self.capacidade: # Lote maior que o buffer: só cabe o final dele
+            self.descartadas += n - self.capacidade
+            visao = visao[n - self.capacidade:]
+            n = self.capacidade
+        excesso = self._pendentes + n - self.capacidade
+        while excesso > 0: # Descarta as mais antigas (visões inteiras ou o começo de uma)
+            antiga = self._visoes[0]
+            if len(antiga) <= excesso:
+                self._visoes.popleft()
+                descartar = len(antiga)
+            else:
+                self._visoes[0] = antiga[excesso:]
+                descartar = excesso
+            self._pendentes -= descartar
+            self.descartadas += descartar
+            excesso -= descartar
+        self._visoes.append(visao)
+        self._pendentes += n
+        self.recebidas += n
+
+    def receber(self, max_mensagens=None):
+        """Retira e retorna as visões pendentes (até 'max_mensagens' mensagens)."""
+        visoes = []
+        restante = self._pendentes if max_mensagens is None else min(max_mensagens, self._pendentes)
+        while restante > 0:
+            visao = self._visoes[0]
+            if len(visao) <= restante:
+                self._visoes.popleft()
+            else:
+                self._visoes[0] = visao[restante:]
+                visao = visao[:restante]
+            visoes.append(visao)
+            self._pendentes -= len(visao)
+            restante -= len(visao)
+        return visoes
+
+    def _retirar_visao(self):
+        """Retira só a visão pendente mais antiga (usado no despacho aos tratadores)."""
+        visao = self._visoes.popleft()
+        self._pendentes -= len(visao)
+        return visao
+
+    def _devolver(self, visao):
+        """Recoloca à frente mensagens retiradas e não entregues (ex.: o tratador
+           falhou no meio da visão). Se o buffer encheu nesse meio tempo, elas,
+           por serem as mais antigas, são as descartadas."""
+        n = min(len(visao), self.capacidade - self._pendentes)
+        if n < len(visao):
+            self.descartadas += len(visao) - max(n, 0)
+        if n > 0:
+            self._visoes.appendleft(visao[len(visao) - n:])
+            self._pendentes += n
+
+    def mensagens(self, max_mensagens=None):
+        """Retira as pendentes e itera mensagem a mensagem."""
+        for visao in self.receber(max_mensagens):
+            yield from visao
+
+    def cancelar(self):
+        self.barramento.cancelar(self)
+
+
+class Barramento:
+    """
+    Barramento de publicação/assinatura em processo.
+    'agendar_despacho(funcao)', se informado, é chamado quando há mensagens
+    para assinantes com tratador (ex.: agenda despachar() no escalonador).
+    """
+
+    def __init__(self, agendar_despacho=None):
+        self._assinaturas = {} # nome do tópico -> lista de assinaturas
+        self._tipos = {}       # nome do tópico -> tipo registrado
+        self._agendar_despacho = agendar_despacho
+        self._despacho_agendado = False
+        self.publicadas = 0
+
+    def _validar_topico(self, topico):
+        tipo = self._tipos.setdefault(topico.nome, topico.tipo)
+        if tipo is not topico.tipo:
+            raise TypeError(f"Tópico '{topico.nome}' já registrado com o tipo {tipo.__name__}.")
+
+    def assinar(self, topico, capacidade=CAPACIDADE_PADRAO, tratador=None):
+        self._validar_topico(topico)
+        assinatura = Assinatura(self, topico, capacidade, tratador)
+        self._assinaturas.setdefault(topico.nome, []).append(assinatura)
+        return assinatura
+
+    def cancelar(self, assinatura):
+        lista = self._assinaturas.get(assinatura.topico.nome, [])
+        if assinatura in lista:
+            lista.remove(assinatura)
+
+    def publicar(self, topico, mensagem):
+        """Publica uma mensagem (deve ser do tipo do tópico)."""
+        self.publicar_lote(topico, (mensagem,))
+
+    def publicar_lote(self, topico, mensagens):
+        """Publica várias mensagens de uma vez. O lote é guardado uma única vez
+           (como tupla) e cada assinante recebe uma visão sobre ele."""
+        self._validar_topico(topico)
+        lote = mensagens if isinstance(mensagens, tuple) else tuple(mensagens)
+        tipo = topico.tipo
+        for mensagem in lote:
+            if not isinstance(mensagem, tipo):
+                raise TypeError(f"Tópico '{topico.nome}' aceita {tipo.__name__}, "
+                                f"recebeu {type(mensagem).__name__}.")
+        if not lote:
+            return
+        self.publicadas += len(lote)
+        assinaturas = self._assinaturas.get(topico.nome)
+        if not assinaturas:
+            return
+        visao = VisaoLote(lote)
+        com_tratador = False
+        for assinatura in assinaturas:
+            assinatura._enfileirar(visao)
+            com_tratador = com_tratador or assinatura.tratador is not None
+        if com_tratador and self._agendar_despacho is not None and not self._despacho_agendado:
+            self._despacho_agendado = True
+            self._agendar_despacho(self.despachar)
+
+    def despachar(self):
+        """Entrega as mensagens pendentes aos tratadores. Mensagens publicadas
+           pelos próprios tratadores também são entregues nesta chamada.
+           Se um tratador levantar exceção, ela é propagada; as mensagens ainda
+           não entregues continuam pendentes e, com agendar_despacho, ganham um
+           novo despacho. Retorna o número de mensagens entregues."""
+        self._despacho_agendado = True # Publicações feitas pelos tratadores entram neste laço
+        entregues = 0
+        concluido = False
+        try:
+            houve_pendentes = True
+            while houve_pendentes:
+                houve_pendentes = False
+                for assinaturas in list(self._assinaturas.values()):
+                    for assinatura in list(assinaturas):
+                        if assinatura.tratador is None:
+                            continue
+                        # Uma visão por vez: se o tratador falhar, o resto dela volta para o buffer
+                        while assinatura._pendentes:
+                            houve_pendentes = True
+                            visao = assinatura._retirar_visao()
+                            entregues_visao = 0
+                            try:
+                                for mensagem in visao:
+                                    entregues_visao += 1 # A mensagem que falhar conta como entregue (não é repetida)
+                                    assinatura.tratador(mensagem)
+                            finally:
+                                entregues += entregues_visao
+                                if entregues_visao < len(visao):
+                                    assinatura._devolver(visao[entregues_visao:])
+            concluido = True
+        finally:
+            self._despacho_agendado = False
+            # Se um tratador falhou, as mensagens restantes ganham um novo despacho
+            if not concluido and self._agendar_despacho is not None and self._ha_pendentes_com_tratador():
+                self._despacho_agendado = True
+                self._agendar_despacho(self.despachar)
+        return entregues
+
+    def _ha_pendentes_com_tratador(self):
+        return any(assinatura.tratador is not None and assinatura._pendentes
+                   for assinaturas in self._assinaturas.values() for assinatura in assinaturas)
@@ -0,0 +1,231 @@
+import sys
+import time
+import argparse
+from collections import namedtuple
+
+import modulo_aleatorio
+import modulo_diagnostico
+from modulo_diagnostico import STATUS_OPERACIONAL, STATUS_ALERTA, STATUS_CRITICO
+
+try: # NumPy faz a simulação vetorizada de milhões de missões
+    import numpy as np
+except ImportError:
+    np = None
+
+# -----------------------------------------------------------------------------
+# Confiabilidade dos Subsistemas ao Longo da Missão
+# -----------------------------------------------------------------------------
+# Em vez das chances fixas de 85/10/5 do diagnóstico, cada subsistema tem um
+# modelo de falhas (parâmetros em subsistemas.json, chave "confiabilidade"):
+# - desgaste: Weibull (forma β, escala η), condicionada à idade já acumulada;
+#   ao atingir o desgaste, o subsistema fica em ALERTA (degradado) e falha
+#   depois de um tempo exponencial com média 'degradacao_media_h';
+# - falhas aleatórias: taxa constante λ, falha súbita direto para CRÍTICO.
+# Grupos de redundância (ex.: computador de voo principal + backup) só ficam
+# CRÍTICOS quando restam menos de 'minimo' membros funcionando; perder um
+# membro deixa o grupo em ALERTA.
+#
+# Cada lote de missões é sorteado de uma vez com NumPy (matriz missões x
+# subsistemas), e as linhas do tempo saem de contagens por intervalo
+# (searchsorted + bincount), sem laços Python por missão.
+# -----------------------------------------------------------------------------
+
+ALEATORIO = modulo_aleatorio.fluxo("confiabilidade")
+
+# Parâmetros usados quando nem o subsistema nem "padroes" os definem
+PARAMETROS_PADRAO = {
+    "weibull_forma": 2.0,            # β > 1: taxa de falha cresce com o uso (desgaste)
+    "weibull_escala_h": 150_000.0,   # η: vida característica (63,2% desgastados)
+    "taxa_falha_aleatoria_h": 5e-7,  # λ: falhas súbitas por hora
+    "degradacao_media_h": 500.0,     # Tempo médio entre o ALERTA por desgaste e a falha
+    "idade_h": 0.0,                  # Horas de operação antes do início da missão
+}
+
+DURACAO_MISSAO_PADRAO_H = 15_000.0 # Viagem até Marte na velocidade inicial do painel (~625 dias)
+PONTOS_LINHA_TEMPO = 25
+MISSOES_POR_LOTE = 50_000          # Limita a memória: ~3 matrizes de lote x subsistemas
+
+ESTADOS = (STATUS_OPERACIONAL, STATUS_ALERTA, STATUS_CRITICO)
+
+# Modelo compilado: arrays por subsistema e grupos como (id, índices dos membros, mínimo).
+# 'unidades' são os subsistemas seguidos dos grupos; 'essenciais' indexa as unidades
+# cuja falha perde a missão (criticidade ALTA, representadas pelo grupo quando redundantes).
+ModeloConfiabilidade = namedtuple("ModeloConfiabilidade", [
+    "ids", "forma", "escala_h", "inverso_taxa_h", "degradacao_h", "idade_h",
+    "grupos", "unidades", "nomes", "essenciais"])
+
+ResultadoConfiabilidade = namedtuple("ResultadoConfiabilidade", [
+    "missoes", "duracao_h", "instantes_h",
+    "probabilidades",      # unidade -> {status: probabilidade ao fim da missão}
+    "curvas_falha",        # unidade -> P(CRÍTICO até t) em cada instante
+    "prob_perda_missao",   # P(alguma unidade essencial CRÍTICA até o fim)
+    "curva_perda_missao",  # P(perda da missão até t) em cada instante
+    "duracao_real_s"])
+
+
+def _exigir_numpy():
+    if np is None:
+        raise ImportError("A simulação de confiabilidade requer NumPy (pip install numpy).")
+
+
+def _parametros_subsistema(entrada):
+    parametros = {**PARAMETROS_PADRAO, **entrada.get("confiabilidade", {})}
+    desconhecidos = set(parametros) - set(PARAMETROS_PADRAO)
+    if desconhecidos:
+        raise ValueError(f"Parâmetros de confiabilidade desconhecidos em '{entrada['id']}': "
+                         f"{', '.join(sorted(desconhecidos))}.")
+    parametros = {chave: float(valor) for chave, valor in parametros.items()}
+    if parametros["weibull_forma"] <= 0 or parametros["weibull_escala_h"] <= 0:
+        raise ValueError(f"Weibull de '{entrada['id']}' exige forma e escala > 0.")
+    if min(parametros["taxa_falha_aleatoria_h"], parametros["degradacao_media_h"], parametros["idade_h"]) < 0:
+        raise ValueError(f"Taxa, degradação e idade de '{entrada['id']}' devem ser >= 0.")
+    return parametros
+
+
+def compilar_modelo(registro=None):
+    """Converte o registro de subsistemas em arrays para a simulação vetorizada."""
+    _exigir_numpy()
+    registro = registro or modulo_diagnostico.REGISTRO
+    entradas = list(registro)
+    parametros = [_parametros_subsistema(entrada) for entrada in entradas]
+    coluna = lambda chave: np.array([p[chave] for p in parametros])
+    taxa = coluna("taxa_falha_aleatoria_h")
+    with np.errstate(divide="ignore"):
+        inverso_taxa = np.where(taxa > 0, 1.0 / np.where(taxa > 0, taxa, 1.0), np.inf)
+
+    ids = tuple(entrada["id"] for entrada in entradas)
+    indice = {id_sub: i for i, id_sub in enumerate(ids)}
+    nomes = {entrada["id"]: entrada["nome"] for entrada in entradas}
+    agrupados = set()
+    grupos = []
+    essenciais = []
+    for grupo in registro.grupos_redundancia.values():
+        membros = np.array([indice[membro] for membro in grupo["membros"]])
+        grupos.append((grupo["id"], membros, grupo["minimo"]))
+        nomes[grupo["id"]] = grupo["nome"]
+        agrupados.update(grupo["membros"])
+        if any(registro.por_id[membro]["criticidade"] == "ALTA" for membro in grupo["membros"]):
+            essenciais.append(len(ids) + len(grupos) - 1)
+    essenciais.extend(i for i, entrada in enumerate(entradas)
+                      if entrada["criticidade"] == "ALTA" and entrada["id"] not in agrupados)
+
+    return ModeloConfiabilidade(
+        ids, coluna("weibull_forma"), coluna("weibull_escala_h"), inverso_taxa, coluna("degradacao_media_h"),
+        coluna("idade_h"), tuple(grupos), ids + tuple(g[0] for g in grupos), nomes, np.array(sorted(essenciais)))
+
+
+def _sortear_lote(modelo, missoes, fluxo):
+    """Instantes (h, desde o início da missão) de entrada em ALERTA e em
+       CRÍTICO de cada unidade, para um lote de missões: matrizes missões x unidades."""
+    k = len(modelo.ids)
+    u = np.asarray(fluxo.bloco_uniformes(3 * missoes * k)).reshape(3, missoes, k)
+    exponenciais = -np.log1p(-u) # Exponenciais padrão (inversa da CDF)
+
+    # Weibull condicionada à sobrevivência até a idade a: H(t) = (t/η)^β,
+    # T = η·(H(a) + E)^(1/β) - a
+    idade, escala, forma = modelo.idade_h, modelo.escala_h, modelo.forma
+    desgaste = escala * ((idade / escala) ** forma + exponenciais[0]) ** (1.0 / forma) - idade
+    with np.errstate(invalid="ignore"): # 0·inf (taxa nula) vira NaN, ignorado por fmin
+        aleatoria = exponenciais[1] * modelo.inverso_taxa_h
+    alerta = np.fmin(desgaste, aleatoria)
+    falha = np.fmin(desgaste + modelo.degradacao_h * exponenciais[2], aleatoria)
+
+    if modelo.grupos:
+        alertas, falhas = [alerta], [falha]
+        for _, membros, minimo in modelo.grupos:
+            # O grupo falha na (n - mínimo + 1)-ésima falha de membro; qualquer membro fora entra em ALERTA
+            falhas.append(np.sort(falha[:, membros], axis=1)[:, len(membros) - minimo, None])
+            alertas.append(alerta[:, membros].min(axis=1, keepdims=True))
+        alerta, falha = np.hstack(alertas), np.hstack(falhas)
+    return alerta, falha
+
+
+def _contar_por_instante(tempos, instantes):
+    """Para cada coluna, quantas linhas têm tempo <= cada instante (matriz colunas x instantes)."""
+    linhas, colunas = tempos.shape
+    pontos = len(instantes)
+    faixa = np.searchsorted(instantes, tempos) # Primeiro instante >= tempo (pontos = nunca)
+    faixa += np.arange(colunas) * (pontos + 1)
+    contagens = np.bincount(faixa.ravel(), minlength=colunas * (pontos + 1)).reshape(colunas, pontos + 1)
+    return np.cumsum(contagens[:, :pontos], axis=1)
+
+
+def simular_confiabilidade(missoes=100_000, duracao_h=DURACAO_MISSAO_PADRAO_H, registro=None,
+                           pontos=PONTOS_LINHA_TEMPO, lote=MISSOES_POR_LOTE, fluxo=None, modelo=None):
+    """
+    Simula 'missoes' missões independentes de 'duracao_h' horas e retorna as
+    probabilidades de cada estado por subsistema e grupo ao fim da missão, as
+    curvas de falha ao longo do tempo e a probabilidade de perder a missão.
+    """
+    _exigir_numpy()
+    inicio = time.perf_counter()
+    modelo = modelo or compilar_modelo(registro)
+    fluxo = fluxo or ALEATORIO
+    instantes = np.linspace(duracao_h / pontos, duracao_h, pontos)
+    unidades = len(modelo.unidades)
+    criticos = np.zeros(unidades, dtype=np.int64)
+    em_alerta = np.zeros(unidades, dtype=np.int64)
+    curvas = np.zeros((unidades, pontos), dtype=np.int64)
+    curva_perda = np.zeros(pontos, dtype=np.int64)
+
+    restantes = missoes
+    while restantes > 0:
+        n = min(lote, restantes)
+        restantes -= n
+        alerta, falha = _sortear_lote(modelo, n, fluxo)
+        critico = falha <= duracao_h
+        criticos += critico.sum(axis=0)
+        em_alerta += ((alerta <= duracao_h) & ~critico).sum(axis=0)
+        curvas += _contar_por_instante(falha, instantes)
+        if len(modelo.essenciais):
+            perda = falha[:, modelo.essenciais].min(axis=1, keepdims=True)
+            curva_perda += _contar_por_instante(perda, instantes)[0]
+
+    probabilidades = {}
+    for i, unidade in enumerate(modelo.unidades):
+        p_critico, p_alerta = int(criticos[i]) / missoes, int(em_alerta[i]) / missoes
+        probabilidades[unidade] = {STATUS_OPERACIONAL: 1.0 - p_critico - p_alerta,
+                                   STATUS_ALERTA: p_alerta, STATUS_CRITICO: p_critico}
+    return ResultadoConfiabilidade(
+        missoes, duracao_h, tuple(instantes.tolist()), probabilidades,
+        {unidade: tuple((curvas[i] / missoes).tolist()) for i, unidade in enumerate(modelo.unidades)},
+        int(curva_perda[-1]) / missoes, tuple((curva_perda / missoes).tolist()), time.perf_counter() - inicio)
+
+
+def exibir_resultado(resultado, modelo, linhas=15):
+    """Mostra as unidades com maior chance de falha e a curva de perda da missão."""
+    print(f"\n--- CONFIABILIDADE DA MISSÃO ({resultado.missoes:,} missões de "
+          f"{resultado.duracao_h / 24:.0f} dias, {resultado.duracao_real_s:.2f}s) ---")
+    largura = max(len(nome) for nome in modelo.nomes.values())
+    print(f"  {'Subsistema / Grupo':<{largura}}  {'OPERAC.':>8} {'ALERTA':>8} {'CRÍTICO':>8}")
+    ordem = sorted(resultado.probabilidades, key=lambda u: -resultado.probabilidades[u][STATUS_CRITICO])
+    grupos = {g[0] for g in modelo.grupos}
+    for unidade in ordem[:linhas]:
+        p = resultado.probabilidades[unidade]
+        marca = " (grupo)" if unidade in grupos else ""
+        print(f"  {modelo.nomes[unidade]:<{largura}}  {p[STATUS_OPERACIONAL]:8.2%} {p[STATUS_ALERTA]:8.2%} "
+              f"{p[STATUS_CRITICO]:8.2%}{marca}")
+    print(f"\n  Probabilidade de perder a missão (subsistema essencial CRÍTICO): {resultado.prob_perda_missao:.3%}")
+    passo = max(1, len(resultado.instantes_h) // 5)
+    marcos = [(t, p) for t, p in zip(resultado.instantes_h, resultado.curva_perda_missao)][passo - 1::passo]
+    print("  Ao longo da missão: " + " | ".join(f"dia {t / 24:.0f}: {p:.3%}" for t, p in marcos))
+    print("-------------------------------------------------")
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simula a confiabilidade dos subsistemas ao longo da missão.")
+    parser.add_argument("--missoes", type=int, default=1_000_000, help="Número de missões simuladas.")
+    parser.add_argument("--horas", type=float, default=DURACAO_MISSAO_PADRAO_H, help="Duração da missão, em horas.")
+    parser.add_argument("--semente", type=int, default=None, help="Semente (mesma semente, mesmo resultado).")
+    opcoes = parser.parse_args()
+    try:
+        if opcoes.semente is not None:
+            modulo_aleatorio.semear(opcoes.semente)
+        modelo_missao = compilar_modelo()
+        exibir_resultado(simular_confiabilidade(opcoes.missoes, opcoes.horas, modelo=modelo_missao), modelo_missao)
+    except KeyboardInterrupt:
+        print("\n\nSimulação interrompida pelo usuário.")
+    except Exception as e:
+        print(f"\nOcorreu um erro inesperado na simulação: {e}")
+        sys.exit(1)
@@ -1,6 +1,12 @@
-import random
 import time
 import sys
+import os
+import json
+
+import modulo_relogio_simulacao
+import modulo_metricas
+import modulo_aleatorio
+from modulo_barramento_telemetria import TOPICO_EVENTOS_VOO, TOPICO_STATUS_SUBSISTEMAS, StatusSubsistema
 
 # --- Constantes de Status ---
 # Usar constantes torna o código mais legível e fácil de manter
@@ -10,165 +16,497 @@ STATUS_CRITICO = "CRÍTICO"
 STATUS_VERIFICANDO = "VERIFICANDO..."
 STATUS_DESCONHECIDO = "DESCONHECIDO"
 
-# --- Definição dos Subsistemas da Espaçonave ---
-# Lista expandida para maior realismo
-SUBSISTEMAS_PARA_VERIFICAR = [
-    # Propulsão
-    "Propulsor Principal (Motor Nuclear Térmico)",
-    "Propulsores RCS (Controle de Atitude e Manobras)",
-    "Tanques de Propelente",
-    # Estrutura e Mecanismos
-    "Integridade Estrutural (Casco)",
-    "Escotilhas e Selos",
-    "Trem de Pouso (se aplicável à fase)",
-    "Braço Robótico (se houver)",
-    # Energia
-    "Geração de Energia (Reator/Painéis Solares)",
-    "Baterias Principais",
-    "Distribuição de Energia (Linhas e Conversores)",
-    # Suporte à Vida (ECLSS)
-    "Controle Atmosférico (O2/CO2/Umidade)",
-    "Sistema de Gerenciamento de Água",
-    "Controle de Temperatura Interna",
-    "Monitoramento de Pressão da Cabine",
-    # Comunicações
-    "Antena de Alto Ganho (Comunicação Terra)",
-    "Antena de Baixo Ganho (Backup/Proximidade)",
-    "Sistema de Comunicação Interna (Intercom)",
-    # Navegação, Guiagem e Controle (GNC)
-    "Computador Principal de Voo",
-    "Computador de Voo de Backup",
-    "Sensores de Navegação (Estelar, Solar, IMU)",
-    "Algoritmos de Guiagem e Controle",
-    # Sistemas Térmicos
-    "Sistema de Controle Térmico Externo (Radiadores)",
-    "Sistema de Controle Térmico Interno (Loops de Fluido)",
-    # Outros
-    "Computadores de Bordo e Rede de Dados",
-    "Sistema de Detecção e Supressão de Incêndio",
-    "Proteção Contra Radiação Cósmica",
-    "Sistema de Gerenciamento de Resíduos"
-]
+# --- Registro de Subsistemas da Espaçonave ---
+# Os subsistemas não ficam mais fixos no código: são carregados de um arquivo
+# de configuração (JSON ou TOML) com id, categoria, criticidade e parâmetros
+# de verificação. O registro mantém índices por id, por categoria e por status
+# atual, e pré-calcula a ordem de exibição para que o painel seja montado em
+# uma única passada, mesmo com dezenas de milhares de componentes.
+ARQUIVO_SUBSISTEMAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "subsistemas.json")
+
+CRITICIDADES_VALIDAS = ("ALTA", "MEDIA", "BAIXA")
+
+# Ordem em que os grupos aparecem no painel
+ORDEM_STATUS_PAINEL = (STATUS_CRITICO, STATUS_ALERTA, STATUS_OPERACIONAL, STATUS_DESCONHECIDO)
+
+# Status resumidos por categoria no fim do painel
+STATUS_RESUMO_CATEGORIA = (STATUS_CRITICO, STATUS_ALERTA)
+
+# Fluxo de sorteios próprio do módulo (semeável e com blocos pré-sorteados)
+ALEATORIO = modulo_aleatorio.fluxo("diagnostico")
+
+# Parâmetros usados quando o arquivo não define "padroes"
+VERIFICACAO_PADRAO = {
+    "probabilidades": {STATUS_OPERACIONAL: 0.85, STATUS_ALERTA: 0.10, STATUS_CRITICO: 0.05},
+    "atraso_s": (0.1, 0.3),
+}
+
+
+class RegistroSubsistemas:
+    """Catálogo indexado dos subsistemas verificados pelo diagnóstico."""
+
+    def __init__(self, subsistemas, categorias=None, padroes=None, grupos_redundancia=None):
+        padroes = padroes or {}
+        criticidade_padrao = padroes.get("criticidade", "MEDIA")
+        verificacao_padrao = {**VERIFICACAO_PADRAO, **padroes.get("verificacao", {})}
+        confiabilidade_padrao = dict(padroes.get("confiabilidade", {}))
+
+        self.categorias = dict(categorias or {})
+        self.por_id = {}        # id -> entrada (na ordem do arquivo)
+        self.por_categoria = {} # categoria -> lista de ids
+        self.id_por_nome = {}   # nome de exibição -> id
+        self.status = {}        # id -> status atual
+        # Índice por status: status -> dict usado como conjunto ordenado de ids
+        self.por_status = {status: {} for status in ORDEM_STATUS_PAINEL}
+
+        for item in subsistemas:
+            entrada = self._normalizar_entrada(item, criticidade_padrao, verificacao_padrao, confiabilidade_padrao)
+            id_sub = entrada["id"]
+            if id_sub in self.por_id:
+                raise ValueError(f"Subsistema duplicado no registro: '{id_sub}'.")
+            if entrada["nome"] in self.id_por_nome:
+                raise ValueError(f"Nome de subsistema duplicado no registro: '{entrada['nome']}'.")
+            self.por_id[id_sub] = entrada
+            self.id_por_nome[entrada["nome"]] = id_sub
+            self.por_categoria.setdefault(entrada["categoria"], []).append(id_sub)
+            self.status[id_sub] = STATUS_DESCONHECIDO
+            self.por_status[STATUS_DESCONHECIDO][id_sub] = None
+
+        # Grupos redundantes (ex.: computador de voo principal + backup): o grupo
+        # só falha quando restam menos de 'minimo' membros funcionando
+        self.grupos_redundancia = {}
+        for grupo in grupos_redundancia or ():
+            self._adicionar_grupo(grupo)
+
+        # Pré-calculados uma única vez: ordem alfabética e largura da coluna de nomes
+        self.nomes_ordenados = tuple(sorted(self.id_por_nome))
+        self.max_len_nome = max((len(nome) for nome in self.nomes_ordenados), default=0)
+
+    def _adicionar_grupo(self, grupo):
+        try:
+            id_grupo = str(grupo["id"])
+            membros = tuple(str(membro) for membro in grupo["membros"])
+        except (KeyError, TypeError):
+            raise ValueError(f"Grupo de redundância inválido (exige 'id' e 'membros'): {grupo!r}")
+        desconhecidos = [membro for membro in membros if membro not in self.por_id]
+        if desconhecidos:
+            raise ValueError(f"Grupo '{id_grupo}' cita subsistemas fora do registro: {', '.join(desconhecidos)}.")
+        minimo = int(grupo.get("minimo", 1))
+        if not 1 <= minimo <= len(membros):
+            raise ValueError(f"Grupo '{id_grupo}': 'minimo' deve estar entre 1 e {len(membros)}.")
+        if id_grupo in self.grupos_redundancia or id_grupo in self.por_id:
+            raise ValueError(f"Grupo de redundância duplicado: '{id_grupo}'.")
+        self.grupos_redundancia[id_grupo] = {
+            "id": id_grupo, "nome": str(grupo.get("nome", id_grupo)), "membros": membros, "minimo": minimo}
+
+    @staticmethod
+    def _normalizar_entrada(item, criticidade_padrao, verificacao_padrao, confiabilidade_padrao=None):
+        """Valida uma entrada do arquivo e pré-calcula os limiares de sorteio."""
+        try:
+            id_sub = str(item["id"])
+            nome = str(item.get("nome", id_sub))
+        except (KeyError, TypeError, AttributeError):
+            raise ValueError(f"Entrada de subsistema inválida (sem 'id'): {item!r}")
+
+        criticidade = str(item.get("criticidade", criticidade_padrao)).upper()
+        if criticidade not in CRITICIDADES_VALIDAS:
+            raise ValueError(f"Criticidade '{criticidade}' inválida para '{id_sub}'.")
+
+        verificacao = {**verificacao_padrao, **item.get("verificacao", {})}
+        probabilidades = verificacao["probabilidades"]
+        prob_operacional = float(probabilidades.get(STATUS_OPERACIONAL, 0.0))
+        prob_alerta = float(probabilidades.get(STATUS_ALERTA, 0.0))
+        prob_critico = float(probabilidades.get(STATUS_CRITICO, 0.0))
+        if abs(prob_operacional + prob_alerta + prob_critico - 1.0) > 1e-6:
+            raise ValueError(f"Probabilidades de '{id_sub}' não somam 1.")
+        atraso_min, atraso_max = verificacao["atraso_s"]
+
+        return {
+            "id": id_sub,
+            "nome": nome,
+            "categoria": str(item.get("categoria", "outros")),
+            "criticidade": criticidade,
+            # Limiares acumulados: evita somar probabilidades a cada verificação
+            "limiares": (prob_operacional, prob_operacional + prob_alerta),
+            "atraso_s": (float(atraso_min), float(atraso_max)),
+            # Parâmetros do modelo de falhas (interpretados por modulo_confiabilidade)
+            "confiabilidade": {**(confiabilidade_padrao or {}), **item.get("confiabilidade", {})},
+        }
+
+    def __len__(self):
+        return len(self.por_id)
+
+    def __iter__(self):
+        """Itera sobre as entradas na ordem do arquivo de configuração."""
+        return iter(self.por_id.values())
+
+    def nomes(self):
+        """Nomes de exibição na ordem do arquivo de configuração."""
+        return [entrada["nome"] for entrada in self.por_id.values()]
+
+    def ids_da_categoria(self, categoria):
+        return self.por_categoria.get(categoria, [])
+
+    def nome_categoria(self, categoria):
+        """Nome de exibição da categoria ("categorias" do arquivo); sem ele, o próprio id."""
+        return self.categorias.get(categoria, categoria)
+
+    def ids_com_status(self, status):
+        return list(self.por_status.get(status, ()))
+
+    def contagem_por_status(self):
+        return {status: len(ids) for status, ids in self.por_status.items()}
+
+    def atualizar_status(self, id_sub, status):
+        """Atualiza o status atual de um subsistema e o índice por status (O(1))."""
+        anterior = self.status[id_sub]
+        self.por_status[anterior if anterior in self.por_status else STATUS_DESCONHECIDO].pop(id_sub, None)
+        self.status[id_sub] = status
+        self.por_status[status if status in self.por_status else STATUS_DESCONHECIDO][id_sub] = None
+
+    def painel_status(self):
+        """Retorna o painel {nome: status} a partir do status atual do registro."""
+        return {entrada["nome"]: self.status[id_sub] for id_sub, entrada in self.por_id.items()}
+
+
+def carregar_registro(caminho=ARQUIVO_SUBSISTEMAS):
+    """Carrega o registro de subsistemas de um arquivo JSON ou TOML."""
+    if caminho.lower().endswith(".toml"):
+        try:
+            import tomllib # Disponível a partir do Python 3.11
+        except ImportError:
+            raise ValueError("Leitura de TOML requer Python 3.11+ (tomllib). Use um arquivo JSON.")
+        with open(caminho, "rb") as arquivo:
+            dados = tomllib.load(arquivo)
+    else:
+        with open(caminho, encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+
+    return RegistroSubsistemas(
+        dados.get("subsistemas", []),
+        categorias=dados.get("categorias"),
+        padroes=dados.get("padroes"),
+        grupos_redundancia=dados.get("grupos_redundancia"),
+    )
+
+
+REGISTRO = carregar_registro()
+
+# Mantido para compatibilidade: nomes de exibição na ordem do arquivo
+SUBSISTEMAS_PARA_VERIFICAR = REGISTRO.nomes()
+
+# --- Métricas (custo só com modulo_metricas.ATIVO) ---
+METRICA_VARREDURAS = modulo_metricas.histograma(
+    "aurora_diagnostico_varredura_segundos", "Duração de uma varredura completa de subsistemas.",
+    limites=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0))
+METRICA_VERIFICACOES = modulo_metricas.contador(
+    "aurora_diagnostico_verificacoes_total", "Subsistemas verificados, por status obtido.", rotulos=("status",))
+
+
+def _registrar_metricas_varredura(painel, duracao_s):
+    METRICA_VARREDURAS.observar(duracao_s)
+    for status in painel.values():
+        METRICA_VERIFICACOES.inc(1, status)
 
 # --- Simulação de Verificação ---
 
-def _simular_verificacao_subsistema(nome_subsistema):
+def _resolver_entrada(subsistema):
+    """Aceita uma entrada do registro ou, por compatibilidade, o nome do subsistema."""
+    if isinstance(subsistema, str):
+        id_sub = REGISTRO.id_por_nome.get(subsistema)
+        if id_sub:
+            return REGISTRO.por_id[id_sub]
+        return RegistroSubsistemas._normalizar_entrada({"id": subsistema}, "MEDIA", VERIFICACAO_PADRAO)
+    return subsistema
+
+def _sortear_status(subsistema, resultado_random):
+    """Converte um sorteio em [0, 1) no status, usando os limiares da entrada."""
+    limiar_operacional, limiar_alerta = subsistema["limiares"]
+    if resultado_random < limiar_operacional:
+        return STATUS_OPERACIONAL
+    elif resultado_random < limiar_alerta:
+        return STATUS_ALERTA
+    else:
+        return STATUS_CRITICO
+
+def _simular_verificacao_subsistema(subsistema, relogio=None):
     """
     Simula a verificação de um único subsistema, retornando um status aleatório
-    com probabilidades definidas.
+    com as probabilidades definidas no registro (padrão: 85% / 10% / 5%).
+    O atraso da verificação passa pelo relógio de simulação (padrão: tempo real).
     """
-    # Probabilidades: Mais chance de estar OK, menos de Crítico
-    prob_operacional = 0.85  # 85%
-    prob_alerta = 0.10       # 10%
-    prob_critico = 0.05      # 5%
+    subsistema = _resolver_entrada(subsistema)
+    relogio = relogio or modulo_relogio_simulacao.RELOGIO_PADRAO
 
     # Sorteia um número entre 0 e 1
-    resultado_random = random.random()
+    resultado_random = ALEATORIO.random()
 
     # Simula um pequeno atraso para a verificação
-    time.sleep(random.uniform(0.1, 0.3))
+    relogio.dormir(ALEATORIO.uniform(*subsistema["atraso_s"]))
 
     # Determina o status com base no sorteio e probabilidades
-    if resultado_random < prob_operacional:
-        return STATUS_OPERACIONAL
-    elif resultado_random < prob_operacional + prob_alerta:
-        return STATUS_ALERTA
-    else:
-        return STATUS_CRITICO
+    return _sortear_status(subsistema, resultado_random)
 
 # --- Funções Principais do Módulo ---
 
-def executar_diagnostico_completo():
+def executar_diagnostico_completo(registro=None, provedor=None, max_em_voo=256, relogio=None):
     """
-    Executa a verificação de todos os subsistemas listados e
-    retorna o painel de controle (dicionário) com os status.
+    Executa a verificação de todos os subsistemas do registro e
+    retorna o painel de controle (dicionário nome -> status).
+    O status atual de cada subsistema também fica indexado no registro.
+
+    Sem 'provedor', usa o simulador aleatório (padrão), um subsistema por vez.
+    Com um provedor de 'modulo_provedores_diagnostico' (telemetria TCP/UDP,
+    diretório, subprocesso), até 'max_em_voo' verificações correm em paralelo.
+    O simulador usa o relógio de simulação informado (padrão: tempo real), e a
+    duração exibida é a simulada.
     """
+    registro = registro or REGISTRO
+    relogio = relogio or modulo_relogio_simulacao.RELOGIO_PADRAO
     print("\n--- INICIANDO DIAGNÓSTICO GERAL DA AURORA I ---")
     painel_controle_status = {}
     tempo_inicio = time.time()
+    tempo_inicio_simulado = relogio.agora()
+    total = len(registro)
 
-    for i, subsistema in enumerate(SUBSISTEMAS_PARA_VERIFICAR):
-        # Mostra o progresso
-        progresso = f"[{i+1}/{len(SUBSISTEMAS_PARA_VERIFICAR)}]"
-        print(f"{progresso} Verificando: {subsistema} ...", end=" ")
-        sys.stdout.flush() # Força a escrita no terminal
+    if provedor is not None:
+        import asyncio
+        import modulo_provedores_diagnostico # Carregado só quando um provedor é usado
 
-        status_atual = _simular_verificacao_subsistema(subsistema)
-        painel_controle_status[subsistema] = status_atual
+        concluidos = 0
+        def _ao_concluir(entrada, status_atual):
+            nonlocal concluidos
+            concluidos += 1
+            painel_controle_status[entrada["nome"]] = status_atual
+            registro.atualizar_status(entrada["id"], status_atual)
+            print(f"[{concluidos}/{total}] Verificado : {entrada['nome']} - Status: {status_atual}")
 
-        # Limpa a parte do "..." e escreve o status final na mesma linha
-        print(f"\r{progresso} Verificado : {subsistema} - Status: {status_atual}{' '*10}") # Espaços limpam a linha
+        asyncio.run(modulo_provedores_diagnostico.diagnosticar_com_provedor(
+            list(registro), provedor, max_em_voo=max_em_voo, ao_concluir=_ao_concluir))
+        # Mantém a ordem do registro no painel retornado
+        painel_controle_status = {e["nome"]: painel_controle_status[e["nome"]] for e in registro}
+    else:
+        for i, entrada in enumerate(registro):
+            subsistema = entrada["nome"]
+            # Mostra o progresso
+            progresso = f"[{i+1}/{total}]"
+            print(f"{progresso} Verificando: {subsistema} ...", end=" ")
+            sys.stdout.flush() # Força a escrita no terminal
+
+            status_atual = _simular_verificacao_subsistema(entrada, relogio)
+            painel_controle_status[subsistema] = status_atual
+            registro.atualizar_status(entrada["id"], status_atual)
+
+            # Limpa a parte do "..." e escreve o status final na mesma linha
+            print(f"\r{progresso} Verificado : {subsistema} - Status: {status_atual}{' '*10}") # Espaços limpam a linha
 
     tempo_fim = time.time()
-    duracao = tempo_fim - tempo_inicio
+    # Provedores externos medem tempo de parede; o simulador, tempo simulado
+    duracao = tempo_fim - tempo_inicio if provedor is not None else relogio.agora() - tempo_inicio_simulado
+    if modulo_metricas.ATIVO:
+        _registrar_metricas_varredura(painel_controle_status, duracao)
     print("-------------------------------------------------")
     print(f"Diagnóstico Completo Concluído em {duracao:.2f} segundos.")
     print("-------------------------------------------------")
 
     return painel_controle_status
 
-def exibir_painel_controle(painel_status):
+# Define um indicador visual simples
+INDICADORES_STATUS = {
+    STATUS_CRITICO: "[ X ]",
+    STATUS_ALERTA:  "[ ! ]",
+    STATUS_OPERACIONAL: "[ OK ]",
+    STATUS_DESCONHECIDO:"[ ? ]"
+}
+
+TITULOS_GRUPOS = {
+    STATUS_CRITICO: ("\n--- STATUS CRÍTICO (Ação Imediata!) ---", "Nenhum sistema em estado crítico."),
+    STATUS_ALERTA: ("\n--- STATUS DE ALERTA (Monitorar/Manutenção) ---", "Nenhum sistema em alerta."),
+    STATUS_OPERACIONAL: ("\n--- STATUS OPERACIONAL ---", "Nenhum sistema operacional reportado (verificar diagnóstico)."),
+    STATUS_DESCONHECIDO: ("\n--- STATUS DESCONHECIDO ---", None), # Só aparece se houver itens
+}
+
+def exibir_painel_controle(painel_status, registro=None):
     """
     Exibe de forma organizada o status de cada subsistema no painel de controle.
+    Usa a ordem alfabética e a largura de coluna pré-calculadas no registro,
+    agrupando por status em uma única passada. Ao final, resume as falhas por
+    categoria, com os nomes de exibição declarados em "categorias".
     """
     print("\n--- PAINEL DE CONTROLE DE STATUS DA ESPAÇONAVE ---")
     if not painel_status:
         print("Nenhum dado de diagnóstico disponível.")
         return
 
-    # Agrupa sistemas por status para melhor visualização
-    sistemas_por_status = {
-        STATUS_CRITICO: [],
-        STATUS_ALERTA: [],
-        STATUS_OPERACIONAL: [],
-        STATUS_DESCONHECIDO: []
-    }
-
-    max_len_nome = 0
-    for subsistema, status in painel_status.items():
-        if status in sistemas_por_status:
-            sistemas_por_status[status].append(subsistema)
+    registro = registro or REGISTRO
+    sistemas_por_status = {status: [] for status in ORDEM_STATUS_PAINEL}
+    falhas_por_categoria = {} # categoria -> {status: quantidade}
+
+    # Passada única sobre a ordem pré-calculada: cada grupo já sai ordenado
+    encontrados = 0
+    for subsistema in registro.nomes_ordenados:
+        status = painel_status.get(subsistema)
+        if status is None:
+            continue
+        encontrados += 1
+        grupo = status if status in sistemas_por_status else STATUS_DESCONHECIDO
+        sistemas_por_status[grupo].append(subsistema)
+        if grupo in STATUS_RESUMO_CATEGORIA:
+            categoria = registro.por_id[registro.id_por_nome[subsistema]]["categoria"]
+            contagem = falhas_por_categoria.setdefault(categoria, {})
+            contagem[grupo] = contagem.get(grupo, 0) + 1
+
+    # Subsistemas fora do registro (raro): ordenados à parte
+    max_len_nome = registro.max_len_nome
+    if encontrados < len(painel_status):
+        extras = sorted(nome for nome in painel_status if nome not in registro.id_por_nome)
+        grupos_afetados = set()
+        for subsistema in extras:
+            status = painel_status[subsistema]
+            grupo = status if status in sistemas_por_status else STATUS_DESCONHECIDO
+            sistemas_por_status[grupo].append(subsistema)
+            grupos_afetados.add(grupo)
+            max_len_nome = max(max_len_nome, len(subsistema))
+        for grupo in grupos_afetados:
+            sistemas_por_status[grupo].sort()
+
+    # Monta todas as linhas e imprime de uma vez (mais rápido para catálogos grandes)
+    linhas = []
+    for status in ORDEM_STATUS_PAINEL:
+        titulo, msg_vazio = TITULOS_GRUPOS[status]
+        itens = sistemas_por_status[status]
+        if not itens and msg_vazio is None:
+            continue
+        linhas.append(titulo)
+        if itens:
+            indicador = INDICADORES_STATUS[status]
+            linhas.extend(f"{indicador} {item:<{max_len_nome}} : {status}" for item in itens)
         else:
-            # Caso algum status inesperado apareça
-            sistemas_por_status[STATUS_DESCONHECIDO].append(subsistema)
-        if len(subsistema) > max_len_nome:
-             max_len_nome = len(subsistema)
-
-    # Define um indicador visual simples
-    indicadores = {
-        STATUS_CRITICO: "[ X ]",
-        STATUS_ALERTA:  "[ ! ]",
-        STATUS_OPERACIONAL: "[ OK ]",
-        STATUS_DESCONHECIDO:"[ ? ]"
-    }
-
-    print("\n--- STATUS CRÍTICO (Ação Imediata!) ---")
-    if sistemas_por_status[STATUS_CRITICO]:
-        for item in sorted(sistemas_por_status[STATUS_CRITICO]):
-             print(f"{indicadores[STATUS_CRITICO]} {item:<{max_len_nome}} : {STATUS_CRITICO}")
-    else:
-        print("Nenhum sistema em estado crítico.")
+            linhas.append(msg_vazio)
 
-    print("\n--- STATUS DE ALERTA (Monitorar/Manutenção) ---")
-    if sistemas_por_status[STATUS_ALERTA]:
-        for item in sorted(sistemas_por_status[STATUS_ALERTA]):
-            print(f"{indicadores[STATUS_ALERTA]} {item:<{max_len_nome}} : {STATUS_ALERTA}")
-    else:
-        print("Nenhum sistema em alerta.")
+    if falhas_por_categoria:
+        linhas.append("\nFalhas por Categoria:")
+        # Na ordem das categorias do registro (a do arquivo de configuração)
+        for categoria in registro.por_categoria:
+            contagem = falhas_por_categoria.get(categoria)
+            if contagem:
+                resumo = ", ".join(f"{contagem[status]} {status}" for status in STATUS_RESUMO_CATEGORIA if status in contagem)
+                linhas.append(f"  {registro.nome_categoria(categoria)}: {resumo}")
 
-    print("\n--- STATUS OPERACIONAL ---")
-    if sistemas_por_status[STATUS_OPERACIONAL]:
-        for item in sorted(sistemas_por_status[STATUS_OPERACIONAL]):
-            print(f"{indicadores[STATUS_OPERACIONAL]} {item:<{max_len_nome}} : {STATUS_OPERACIONAL}")
-    else:
-        print("Nenhum sistema operacional reportado (verificar diagnóstico).")
+    linhas.append("-------------------------------------------------")
+    print("\n".join(linhas))
 
-    if sistemas_por_status[STATUS_DESCONHECIDO]:
-         print("\n--- STATUS DESCONHECIDO ---")
-         for item in sorted(sistemas_por_status[STATUS_DESCONHECIDO]):
-             print(f"{indicadores[STATUS_DESCONHECIDO]} {item:<{max_len_nome}} : {STATUS_DESCONHECIDO}")
+# --- Diagnóstico Orientado a Eventos ---
 
-    print("-------------------------------------------------")
+def varrer_subsistemas(registro=None):
+    """
+    Varredura silenciosa (sem impressão e sem espera): sorteia o status de cada
+    subsistema e soma os atrasos de verificação. Retorna (painel, duracao_s),
+    onde duracao_s é o tempo simulado que a varredura sequencial levaria.
+    """
+    registro = registro or REGISTRO
+    painel = {}
+    duracao_s = 0.0
+    for entrada in registro:
+        painel[entrada["nome"]] = _sortear_status(entrada, ALEATORIO.random())
+        duracao_s += ALEATORIO.uniform(*entrada["atraso_s"])
+    if modulo_metricas.ATIVO:
+        _registrar_metricas_varredura(painel, duracao_s)
+    return painel, duracao_s
+
+
+def _publicar_status(barramento, registro, painel, instante_s):
+    barramento.publicar_lote(TOPICO_STATUS_SUBSISTEMAS, tuple(
+        StatusSubsistema(registro.id_por_nome[nome], nome, status, instante_s) for nome, status in painel.items()))
+
+
+def agendar_diagnostico_periodico(escalonador, intervalo_s, registro=None, ao_concluir=None, barramento=None):
+    """
+    Agenda varreduras periódicas no escalonador de eventos compartilhado.
+    Cada varredura começa a cada 'intervalo_s' simulados e é concluída depois
+    do tempo que as verificações levariam; então o registro é atualizado e
+    ao_concluir(painel, instante_s) é chamado. Com um barramento, o resultado
+    também é publicado em lote no tópico de status. Retorna o evento periódico.
+    """
+    registro = registro or REGISTRO
+
+    def _concluir(painel):
+        for nome, status in painel.items():
+            registro.atualizar_status(registro.id_por_nome[nome], status)
+        if barramento is not None:
+            _publicar_status(barramento, registro, painel, escalonador.relogio.agora())
+        if ao_concluir is not None:
+            ao_concluir(painel, escalonador.relogio.agora())
+
+    def _iniciar():
+        painel, duracao_s = varrer_subsistemas(registro)
+        escalonador.agendar(duracao_s, _concluir, painel)
+
+    return escalonador.agendar_periodico(intervalo_s, _iniciar)
+
+# --- Diagnóstico Direcionado por Eventos de Voo ---
+
+# Subsistemas verificados em resposta a cada tipo de evento do painel de voo
+SUBSISTEMAS_POR_EVENTO_VOO = {
+    "micrometeorito": ("casco", "escotilhas_selos", "tanques_propelente"),
+    "tempestade_solar": ("antena_alto_ganho", "antena_baixo_ganho", "protecao_radiacao", "rede_dados"),
+}
+# Anomalias menores: sistema citado no evento -> subsistema do registro
+SUBSISTEMAS_POR_SISTEMA_AFETADO = {
+    "Sensor Navegação": ("sensores_navegacao",),
+    "Bomba Refrigerante": ("loops_fluido",),
+    "Regulador Tensão": ("distribuicao_energia",),
+    "Antena Baixo Ganho": ("antena_baixo_ganho",),
+    "Filtro CO2": ("controle_atmosferico",),
+    "Interface Diagnóstico": ("rede_dados",),
+}
+
+
+def verificar_subsistemas(ids, registro=None):
+    """
+    Verificação direcionada e silenciosa de alguns subsistemas (por id):
+    atualiza o registro e retorna (painel, duracao_s), como varrer_subsistemas.
+    Ids fora do registro são ignorados.
+    """
+    registro = registro or REGISTRO
+    painel = {}
+    duracao_s = 0.0
+    for id_sub in ids:
+        entrada = registro.por_id.get(id_sub)
+        if entrada is None:
+            continue
+        status = _sortear_status(entrada, ALEATORIO.random())
+        registro.atualizar_status(id_sub, status)
+        painel[entrada["nome"]] = status
+        duracao_s += ALEATORIO.uniform(*entrada["atraso_s"])
+    return painel, duracao_s
+
+
+def reagir_a_eventos_voo(barramento, registro=None, ao_concluir=None, capacidade=256):
+    """
+    Assina os eventos de voo e, para cada um, verifica só os subsistemas
+    afetados (ex.: micrometeorito -> casco, escotilhas e tanques), em vez de
+    esperar a próxima varredura completa. O resultado é publicado no tópico
+    de status e passado a ao_concluir(evento, painel, instante_s).
+    Retorna a assinatura.
+    """
+    registro = registro or REGISTRO
+
+    def _tratar(evento):
+        ids = SUBSISTEMAS_POR_EVENTO_VOO.get(evento.tipo) or \
+            SUBSISTEMAS_POR_SISTEMA_AFETADO.get(evento.sistema_afetado, ())
+        if not ids and evento.sistema_afetado: # Eventos do catálogo podem citar o subsistema pelo nome ou id do registro
+            id_sub = registro.id_por_nome.get(evento.sistema_afetado, evento.sistema_afetado)
+            ids = (id_sub,) if id_sub in registro.por_id else ()
+        if not ids:
+            return
+        painel, duracao_s = verificar_subsistemas(ids, registro)
+        instante_s = evento.instante_s + duracao_s
+        _publicar_status(barramento, registro, painel, instante_s)
+        if ao_concluir is not None:
+            ao_concluir(evento, painel, instante_s)
+
+    return barramento.assinar(TOPICO_EVENTOS_VOO, capacidade, tratador=_tratar)
 
 # --- Bloco de Execução Principal (para teste) ---
 if __name__ == "__main__":
@@ -0,0 +1,171 @@
+import os
+import sys
+import json
+import string
+from collections import namedtuple
+
+# -----------------------------------------------------------------------------
+# Catálogo de Eventos Aleatórios de Voo da Aurora I
+# -----------------------------------------------------------------------------
+# Os eventos de voo não ficam mais fixos no painel: vêm de um arquivo (JSON ou
+# TOML) com id, peso relativo, mensagem e efeitos. Na carga, o catálogo é
+# compilado uma única vez:
+# - os pesos viram um amostrador pelo método de alias (Walker/Vose): cada
+#   sorteio custa O(1), com 3 ou com milhares de tipos de evento;
+# - cada efeito é ligado ao seu tratador (tabela nome -> função) e tem os
+#   parâmetros convertidos para tuplas, sem consulta por texto durante o voo.
+#
+# Exemplo de entrada:
+#   {"id": "micrometeorito", "peso": 1.0,
+#    "mensagem": "EVENTO: Impacto de micrometeorito! Perda de {combustivel:.2f} UAC.",
+#    "efeitos": {"combustivel": {"perda_uac": [50, 250]}}}
+# Os campos da mensagem são os nomes dos efeitos (valor produzido por cada um).
+# -----------------------------------------------------------------------------
+
+ARQUIVO_EVENTOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "eventos_voo.json")
+
+# Evento compilado: 'efeitos' é uma tupla de (nome, tratador, parametros)
+EventoCatalogo = namedtuple("EventoCatalogo", ["id", "peso", "mensagem", "efeitos"])
+
+
+class AmostradorAlias:
+    """Sorteio ponderado em O(1) pelo método de alias (variante de Vose)."""
+
+    __slots__ = ("n", "_probabilidades", "_alias")
+
+    def __init__(self, pesos):
+        pesos = [float(peso) for peso in pesos]
+        if not pesos:
+            raise ValueError("O amostrador precisa de pelo menos um peso.")
+        if any(peso < 0 for peso in pesos) or sum(pesos) <= 0:
+            raise ValueError("Os pesos devem ser >= 0, com soma positiva.")
+        n = len(pesos)
+        total = sum(pesos)
+        escalados = [peso * n / total for peso in pesos] # Média 1 por coluna
+        probabilidades = [1.0] * n
+        alias = list(range(n))
+        pequenos = [i for i, valor in enumerate(escalados) if valor < 1.0]
+        grandes = [i for i, valor in enumerate(escalados) if valor >= 1.0]
+        while pequenos and grandes:
+            pequeno, grande = pequenos.pop(), grandes.pop()
+            probabilidades[pequeno] = escalados[pequeno]
+            alias[pequeno] = grande
+            escalados[grande] -= 1.0 - escalados[pequeno]
+            (pequenos if escalados[grande] < 1.0 else grandes).append(grande)
+        # Sobras (só por arredondamento) ficam com probabilidade 1
+        self.n = n
+        self._probabilidades = probabilidades
+        self._alias = alias
+
+    def sortear(self, u):
+        """Índice sorteado a partir de um único uniforme u em [0, 1):
+           a parte inteira de u*n escolhe a coluna, a fração decide coluna ou alias."""
+        x = u * self.n
+        coluna = int(x)
+        if coluna >= self.n: # Proteção contra u arredondado para 1.0
+            coluna = self.n - 1
+        return coluna if x - coluna < self._probabilidades[coluna] else self._alias[coluna]
+
+
+def _converter_parametros(parametros):
+    """Listas viram tuplas de float (faixas [mín, máx]); o resto é mantido."""
+    convertidos = {}
+    for chave, valor in dict(parametros or {}).items():
+        if isinstance(valor, (list, tuple)):
+            valor = tuple(float(v) if isinstance(v, (int, float)) else v for v in valor)
+        convertidos[chave] = valor
+    return convertidos
+
+
+def _campos_mensagem(mensagem):
+    return {campo.split(".")[0].split("[")[0]
+            for _, campo, _, _ in string.Formatter().parse(mensagem) if campo}
+
+
+class CatalogoEventos:
+    """Catálogo compilado: eventos na ordem do arquivo e amostrador de alias."""
+
+    def __init__(self, itens, tratadores):
+        self.eventos = []
+        self.por_id = {}
+        for item in itens:
+            evento = self._compilar_evento(item, tratadores)
+            if evento.id in self.por_id:
+                raise ValueError(f"Evento duplicado no catálogo: '{evento.id}'.")
+            self.por_id[evento.id] = evento
+            self.eventos.append(evento)
+        if not self.eventos:
+            raise ValueError("O catálogo de eventos está vazio.")
+        self.eventos = tuple(self.eventos)
+        self._amostrador = AmostradorAlias(evento.peso for evento in self.eventos)
+
+    @staticmethod
+    def _compilar_evento(item, tratadores):
+        try:
+            id_evento = str(item["id"])
+            mensagem = str(item["mensagem"])
+        except (KeyError, TypeError):
+            raise ValueError(f"Entrada de evento inválida (exige 'id' e 'mensagem'): {item!r}")
+        peso = float(item.get("peso", 1.0))
+        if peso <= 0:
+            raise ValueError(f"Peso do evento '{id_evento}' deve ser > 0.")
+        efeitos = []
+        for nome, parametros in dict(item.get("efeitos", {})).items():
+            tratador = tratadores.get(nome)
+            if tratador is None:
+                raise ValueError(f"Efeito desconhecido '{nome}' no evento '{id_evento}'. "
+                                 f"Válidos: {', '.join(sorted(tratadores))}.")
+            efeitos.append((nome, tratador, _converter_parametros(parametros)))
+        faltando = _campos_mensagem(mensagem) - {nome for nome, _, _ in efeitos}
+        if faltando:
+            raise ValueError(f"Mensagem do evento '{id_evento}' usa campos sem efeito: {', '.join(sorted(faltando))}.")
+        return EventoCatalogo(id_evento, peso, mensagem, tuple(efeitos))
+
+    def __len__(self):
+        return len(self.eventos)
+
+    def __iter__(self):
+        return iter(self.eventos)
+
+    def sortear(self, u):
+        """Evento correspondente ao uniforme u em [0, 1), proporcional aos pesos."""
+        return self.eventos[self._amostrador.sortear(u)]
+
+
+def carregar_catalogo(tratadores, caminho=ARQUIVO_EVENTOS):
+    """Carrega e compila o catálogo de um arquivo JSON ou TOML.
+       'tratadores' mapeia o nome de cada efeito à função que o aplica."""
+    if caminho.lower().endswith(".toml"):
+        try:
+            import tomllib # Disponível a partir do Python 3.11
+        except ImportError:
+            raise ValueError("Leitura de TOML requer Python 3.11+ (tomllib). Use um arquivo JSON.")
+        with open(caminho, "rb") as arquivo:
+            dados = tomllib.load(arquivo)
+    else:
+        with open(caminho, encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+    return CatalogoEventos(dados.get("eventos", []), tratadores)
+
+
+# --- Bloco de Execução Principal (para teste) ---
+if __name__ == "__main__":
+    try:
+        import modulo_painel_comando
+        catalogo = modulo_painel_comando.CATALOGO_EVENTOS
+        amostras = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+        contagens = {evento.id: 0 for evento in catalogo}
+        sorteio = modulo_painel_comando.ALEATORIO
+        for _ in range(amostras):
+            contagens[catalogo.sortear(sorteio.random()).id] += 1
+        peso_total = sum(evento.peso for evento in catalogo)
+        print(f"\n--- CATÁLOGO DE EVENTOS DE VOO ({len(catalogo)} tipos, {amostras:,} sorteios) ---")
+        for evento in catalogo:
+            esperado = evento.peso / peso_total * 100.0
+            obtido = contagens[evento.id] / amostras * 100.0
+            efeitos = ", ".join(nome for nome, _, _ in evento.efeitos) or "-"
+            print(f"  {evento.id:<26} esperado {esperado:5.2f}% | obtido {obtido:5.2f}% | efeitos: {efeitos}")
+    except KeyboardInterrupt:
+        print("\n\nTeste do catálogo interrompido pelo usuário.")
+    except Exception as e:
+        print(f"\nOcorreu um erro inesperado: {e}")
@@ -0,0 +1,319 @@
+import bisect
+import os
+import sys
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+# Métricas e Perfilamento da Aurora I
+# -----------------------------------------------------------------------------
+# Instrumentação leve para os laços de monitoramento, a varredura de
+# diagnóstico e os passos do painel de voo:
+# - contadores, histogramas de latência e medidores (gauges);
+# - endpoint HTTP local opcional '/metrics' no formato texto do Prometheus;
+# - captura de perfil (cProfile) sob demanda numa sessão em execução.
+#
+# Desativadas (padrão), as métricas custam só a leitura de ATIVO nos pontos
+# instrumentados: cada ponto faz 'if modulo_metricas.ATIVO:' antes de medir.
+#
+# Ativação por variáveis de ambiente (lidas em configurar_pelo_ambiente()):
+#   AURORA_METRICAS=1             liga a coleta
+#   AURORA_METRICAS_PORTA=9464    liga a coleta e serve http://127.0.0.1:9464/metrics
+#   AURORA_PERFIL_SINAL=1         'kill -USR1 <pid>' liga/desliga o cProfile (POSIX)
+# -----------------------------------------------------------------------------
+
+ATIVO = False # Interruptor global lido pelos pontos instrumentados
+
+HOST_METRICAS = "127.0.0.1" # Só local: o endpoint não tem autenticação
+PORTA_METRICAS_PADRAO = 9464
+
+# Limites (segundos) dos histogramas de latência
+LIMITES_LATENCIA_S = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01,
+                      0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+_registro = {}            # nome -> métrica, na ordem de criação
+_trava_registro = threading.Lock()
+
+
+def ativar(ligado=True):
+    """Liga (ou desliga) a coleta em todos os pontos instrumentados."""
+    global ATIVO
+    ATIVO = bool(ligado)
+
+
+# --- Tipos de Métrica ---
+
+def _formatar_rotulos(nomes, valores, extra=None):
+    pares = [f'{nome}="{valor}"' for nome, valor in zip(nomes, valores)]
+    if extra:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _formatar_valor(valor):
+    if valor == float("inf"):
+        return "+Inf"
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+class _Metrica:
+    tipo = "untyped"
+
+    def __init__(self, nome, ajuda, rotulos=()):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.rotulos = tuple(rotulos)
+
+    def _chave(self, valores_rotulos):
+        if len(valores_rotulos) != len(self.rotulos):
+            raise ValueError(f"Métrica '{self.nome}' espera rótulos {self.rotulos}.")
+        return tuple(valores_rotulos)
+
+    def exportar(self):
+        linhas = [f"# HELP {self.nome} {self.ajuda}", f"# TYPE {self.nome} {self.tipo}"]
+        linhas.extend(self._amostras())
+        return linhas
+
+
+class Contador(_Metrica):
+    """Valor que só cresce (ex.: passos simulados, alarmes)."""
+    tipo = "counter"
+
+    def __init__(self, nome, ajuda, rotulos=()):
+        super().__init__(nome, ajuda, rotulos)
+        self._valores = {} if self.rotulos else {(): 0.0}
+
+    def inc(self, quantidade=1.0, *valores_rotulos):
+        if quantidade < 0:
+            raise ValueError("Um contador não pode diminuir.")
+        chave = self._chave(valores_rotulos)
+        self._valores[chave] = self._valores.get(chave, 0.0) + quantidade
+
+    def valor(self, *valores_rotulos):
+        return self._valores.get(tuple(valores_rotulos), 0.0)
+
+    def _amostras(self):
+        return [f"{self.nome}{_formatar_rotulos(self.rotulos, chave)} {_formatar_valor(valor)}"
+                for chave, valor in dict(self._valores).items()]
+
+
+class Medidor(_Metrica):
+    """Valor instantâneo que sobe e desce (ex.: combustível restante)."""
+    tipo = "gauge"
+
+    def __init__(self, nome, ajuda, rotulos=()):
+        super().__init__(nome, ajuda, rotulos)
+        self._valores = {} if self.rotulos else {(): 0.0}
+
+    def definir(self, valor, *valores_rotulos):
+        self._valores[self._chave(valores_rotulos)] = float(valor)
+
+    def valor(self, *valores_rotulos):
+        return self._valores.get(tuple(valores_rotulos), 0.0)
+
+    _amostras = Contador._amostras
+
+
+class Histograma(_Metrica):
+    """Distribuição em faixas cumulativas (ex.: latência de uma verificação)."""
+    tipo = "histogram"
+
+    def __init__(self, nome, ajuda, limites=LIMITES_LATENCIA_S):
+        super().__init__(nome, ajuda)
+        self.limites = tuple(sorted(limites))
+        self._contagens = [0] * (len(self.limites) + 1) # Última faixa: +Inf
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, valor):
+        self._contagens[bisect.bisect_left(self.limites, valor)] += 1
+        self.soma += valor
+        self.total += 1
+
+    def _amostras(self):
+        contagens = list(self._contagens)
+        linhas, acumulado = [], 0
+        for limite, contagem in zip(self.limites + (float("inf"),), contagens):
+            acumulado += contagem
+            linhas.append(f'{self.nome}_bucket{{le="{_formatar_valor(float(limite))}"}} {acumulado}')
+        linhas.append(f"{self.nome}_sum {_formatar_valor(self.soma)}")
+        linhas.append(f"{self.nome}_count {acumulado}")
+        return linhas
+
+
+def _obter(classe, nome, *argumentos, **opcoes):
+    """Cria a métrica na primeira chamada; depois devolve a mesma instância."""
+    with _trava_registro:
+        metrica = _registro.get(nome)
+        if metrica is None:
+            metrica = _registro[nome] = classe(nome, *argumentos, **opcoes)
+        elif not isinstance(metrica, classe):
+            raise ValueError(f"Métrica '{nome}' já registrada como {metrica.tipo}.")
+        return metrica
+
+
+def contador(nome, ajuda, rotulos=()):
+    return _obter(Contador, nome, ajuda, rotulos)
+
+
+def medidor(nome, ajuda, rotulos=()):
+    return _obter(Medidor, nome, ajuda, rotulos)
+
+
+def histograma(nome, ajuda, limites=LIMITES_LATENCIA_S):
+    return _obter(Histograma, nome, ajuda, limites)
+
+
+def exportar_prometheus():
+    """Texto de todas as métricas no formato de exposição do Prometheus."""
+    with _trava_registro:
+        metricas = list(_registro.values())
+    linhas = []
+    for metrica in metricas:
+        linhas.extend(metrica.exportar())
+    return "\n".join(linhas) + "\n"
+
+
+# --- Endpoint HTTP /metrics ---
+
+_servidor = None
+
+
+def iniciar_servidor_metricas(porta=PORTA_METRICAS_PADRAO, host=HOST_METRICAS):
+    """
+    Serve '/metrics' numa thread em segundo plano e liga a coleta.
+    Retorna o servidor (porta real em servidor.server_address[1]).
+    """
+    global _servidor
+    if _servidor is not None:
+        return _servidor
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _ManipuladorMetricas(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404, "Use /metrics")
+                return
+            corpo = exportar_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, formato, *argumentos): # Não polui o console da simulação
+            pass
+
+    _servidor = ThreadingHTTPServer((host, porta), _ManipuladorMetricas)
+    _servidor.daemon_threads = True
+    threading.Thread(target=_servidor.serve_forever, name="servidor-metricas", daemon=True).start()
+    ativar(True)
+    return _servidor
+
+
+def parar_servidor_metricas():
+    global _servidor
+    if _servidor is not None:
+        _servidor.shutdown()
+        _servidor.server_close()
+        _servidor = None
+
+
+# --- Captura de Perfil (cProfile) Sob Demanda ---
+
+_perfil = None
+_inicio_perfil = None
+
+
+def perfil_ativo():
+    return _perfil is not None
+
+
+def iniciar_perfil():
+    """Começa a perfilar a thread atual (a sessão interativa roda na principal)."""
+    global _perfil, _inicio_perfil
+    if _perfil is not None:
+        return False
+    import cProfile
+    _perfil = cProfile.Profile()
+    _inicio_perfil = time.perf_counter()
+    _perfil.enable()
+    return True
+
+
+def parar_perfil(caminho=None, linhas=15):
+    """
+    Encerra a captura. Grava o perfil (formato pstats) em 'caminho', se
+    informado, e retorna um resumo das funções com maior tempo acumulado.
+    """
+    global _perfil
+    if _perfil is None:
+        return "Nenhuma captura de perfil em andamento."
+    import io
+    import pstats
+    perfil, _perfil = _perfil, None
+    perfil.disable()
+    duracao = time.perf_counter() - _inicio_perfil
+    if caminho:
+        perfil.dump_stats(caminho)
+    saida = io.StringIO()
+    pstats.Stats(perfil, stream=saida).sort_stats("cumulative").print_stats(linhas)
+    cabecalho = f"Perfil capturado por {duracao:.1f}s" + (f" (salvo em '{caminho}')" if caminho else "")
+    return cabecalho + "\n" + saida.getvalue()
+
+
+def alternar_perfil(diretorio="."):
+    """Liga a captura se estiver desligada; senão, encerra e salva em
+       aurora_perfil_<data>.prof. Retorna a mensagem para exibir."""
+    if iniciar_perfil():
+        return "Captura de perfil (cProfile) INICIADA. Repita o comando para encerrar."
+    caminho = os.path.join(diretorio, time.strftime("aurora_perfil_%Y%m%d_%H%M%S.prof"))
+    return parar_perfil(caminho)
+
+
+def instalar_sinal_perfil():
+    """No POSIX, SIGUSR1 liga/desliga a captura na sessão em execução
+       (o tratador roda na thread principal). Retorna False se indisponível."""
+    import signal
+    if not hasattr(signal, "SIGUSR1"):
+        return False
+
+    def _tratador(_sinal, _quadro):
+        print(f"\n[PERFIL] {alternar_perfil()}", file=sys.stderr)
+
+    signal.signal(signal.SIGUSR1, _tratador)
+    return True
+
+
+def configurar_pelo_ambiente(ambiente=None):
+    """Aplica AURORA_METRICAS, AURORA_METRICAS_PORTA e AURORA_PERFIL_SINAL.
+       Retorna o servidor de métricas, se algum foi iniciado."""
+    ambiente = os.environ if ambiente is None else ambiente
+    servidor = None
+    if ambiente.get("AURORA_METRICAS", "").strip() in ("1", "sim", "true"):
+        ativar(True)
+    porta = ambiente.get("AURORA_METRICAS_PORTA", "").strip()
+    if porta:
+        try:
+            servidor = iniciar_servidor_metricas(int(porta))
+        except (ValueError, OSError) as e:
+            print(f"[METRICAS] Não foi possível iniciar o endpoint na porta '{porta}': {e}")
+    if ambiente.get("AURORA_PERFIL_SINAL", "").strip() in ("1", "sim", "true"):
+        instalar_sinal_perfil()
+    return servidor
+
+
+# --- Bloco de Execução Principal (para teste) ---
+if __name__ == "__main__":
+    try:
+        porta = int(sys.argv[1]) if len(sys.argv) > 1 else PORTA_METRICAS_PADRAO
+        servidor = iniciar_servidor_metricas(porta)
+        print(f"Métricas em http://{HOST_METRICAS}:{servidor.server_address[1]}/metrics")
+        print("Rodando a simulação de um dia de missão em laço (Ctrl+C para sair)...")
+        import modulo_missao
+        while True:
+            modulo_missao.simular_dia_missao()
+    except KeyboardInterrupt:
+        print("\n\nServidor de métricas encerrado pelo usuário.")
+    except Exception as e:
+        print(f"\nOcorreu um erro inesperado: {e}")
@@ -0,0 +1,217 @@
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import modulo_aleatorio
+import modulo_relogio_simulacao
+import modulo_barramento_telemetria
+import modulo_diagnostico
+import modulo_monitoramento_vital
+import modulo_painel_comando
+import modulo_pressurizacao
+
+# -----------------------------------------------------------------------------
+# Simulação de um Dia de Missão da Aurora I
+# -----------------------------------------------------------------------------
+# Coloca os quatro subsistemas no mesmo escalonador de eventos, com um único
+# relógio simulado. No modo rápido, um dia inteiro de missão roda em
+# milissegundos; nos modos real/escalado, o mesmo roteiro segue o relógio.
+# Os subsistemas conversam pelo barramento de telemetria: eventos de voo
+# disparam diagnósticos direcionados e a pressão da cabine medida pelo
+# monitoramento vira o alvo de repressurização da câmara de ar.
+# Com uma semente, a missão é reprodutível; simular_missoes() repete várias
+# réplicas (em série ou em processos paralelos) com os mesmos resultados.
+# -----------------------------------------------------------------------------
+
+DURACAO_DIA_S = 86_400.0
+INTERVALO_MONITORAMENTO_S = 30.0       # Verificação vital a cada 30 s
+INTERVALO_DIAGNOSTICO_S = 3_600.0      # Varredura de subsistemas a cada hora
+INTERVALO_VOO_S = 3_600.0              # Um passo de voo por hora de missão
+INTERVALO_CICLO_CAMARA_S = 6 * 3_600.0 # Um ciclo da câmara de ar a cada 6 horas
+
+
+NOMES_FASES_CAMARA = {
+    modulo_pressurizacao.FASE_DESPRESSURIZACAO: "despressurização concluída",
+    modulo_pressurizacao.FASE_MANUTENCAO: "manutenção em 0 PSI concluída",
+    modulo_pressurizacao.FASE_REPRESSURIZACAO: "repressurização concluída",
+}
+
+
+def simular_dia_missao(duracao_s=DURACAO_DIA_S, modo=modulo_relogio_simulacao.MODO_RAPIDO, escala_tempo=1.0,
+                       ao_atualizar=None):
+    """
+    Executa 'duracao_s' segundos de missão com todos os subsistemas no mesmo
+    relógio. Retorna um dicionário com o resumo do dia.
+    ao_atualizar(campos), se informado, recebe o estado ao vivo como um
+    dicionário plano campo -> valor (ex.: "painel.combustivel_pct").
+    """
+    publicar = ao_atualizar or (lambda campos: None)
+    relogio = modulo_relogio_simulacao.RelogioSimulacao(modo, escala_tempo)
+    escalonador = modulo_relogio_simulacao.EscalonadorEventos(relogio)
+    barramento = modulo_barramento_telemetria.Barramento(
+        agendar_despacho=lambda despachar: escalonador.agendar(0.0, despachar))
+    painel = modulo_painel_comando.PainelComandosNave(relogio=relogio, exibir_logs=False, barramento=barramento)
+    cabine = modulo_pressurizacao.PressaoCabineAtual(barramento)
+
+    resumo = {
+        "verificacoes_vitais": 0,
+        "alarmes_vitais": 0,
+        "pior_status_nave": modulo_monitoramento_vital.STATUS_NORMAL,
+        "varreduras_diagnostico": 0,
+        "subsistemas_criticos": 0,
+        "ciclos_camara": 0,
+        "verificacoes_direcionadas": 0,
+        "pressoes_cabine_usadas_psi": [],
+        "eventos_voo": [],
+    }
+    gravidade = {modulo_monitoramento_vital.STATUS_NORMAL: 0,
+                 modulo_monitoramento_vital.STATUS_ATENCAO: 1,
+                 modulo_monitoramento_vital.STATUS_CRITICO: 2}
+
+    def _ao_verificar(status_nave, tripulantes, ambiente, alarmes, instante_s):
+        resumo["verificacoes_vitais"] += 1
+        resumo["alarmes_vitais"] += len(alarmes)
+        if gravidade.get(status_nave, 0) > gravidade.get(resumo["pior_status_nave"], 0):
+            resumo["pior_status_nave"] = status_nave
+        if ao_atualizar is not None:
+            campos = {"missao.tempo_h": round(instante_s / 3600.0, 2),
+                      "monitor.status_nave": status_nave, "monitor.alarmes": len(alarmes)}
+            for tripulante, dados in tripulantes.items():
+                campos[f"tripulacao.{tripulante}"] = dados["status_geral"]
+            for parametro, dados in ambiente.items():
+                campos[f"cabine.{parametro}"] = f"{dados['valor']} {dados['unidade']} [{dados['status']}]"
+            publicar(campos)
+
+    def _publicar_diagnostico(painel_status):
+        publicar({f"diagnostico.{nome}": status for nome, status in painel_status.items()})
+
+    def _ao_concluir_diagnostico(painel_status, _instante_s):
+        resumo["varreduras_diagnostico"] += 1
+        resumo["subsistemas_criticos"] += sum(1 for s in painel_status.values()
+                                              if s == modulo_diagnostico.STATUS_CRITICO)
+        _publicar_diagnostico(painel_status)
+
+    def _ao_concluir_fase(fase, _instante_s, pressao_psi):
+        if fase == modulo_pressurizacao.FASE_REPRESSURIZACAO:
+            resumo["ciclos_camara"] += 1
+        publicar({"camara.fase": NOMES_FASES_CAMARA[fase], "camara.pressao_psi": round(pressao_psi, 2),
+                  "camara.ciclos": resumo["ciclos_camara"]})
+
+    def _iniciar_ciclo_camara():
+        pressao_cabine_psi = cabine.atualizar() # Última leitura do monitoramento
+        resumo["pressoes_cabine_usadas_psi"].append(pressao_cabine_psi)
+        modulo_pressurizacao.agendar_ciclo_camara(escalonador, pressao_interna_psi=pressao_cabine_psi,
+                                                  ao_concluir_fase=_ao_concluir_fase)
+
+    def _ao_diagnostico_direcionado(_evento, painel_status, _instante_s):
+        resumo["verificacoes_direcionadas"] += len(painel_status)
+        _publicar_diagnostico(painel_status)
+
+    def _ao_evento_voo(mensagem, instante_s):
+        resumo["eventos_voo"].append((instante_s, mensagem))
+        publicar({"painel.ultimo_evento": f"[{instante_s / 3600.0:.1f} h] {mensagem}"})
+
+    def _publicar_painel():
+        publicar({"painel.combustivel_pct": round(painel.get_combustivel_percentual(), 2),
+                  "painel.distancia_marte_km": int(painel.distancia_marte_km),
+                  "painel.velocidade_kmh": int(painel.velocidade_atual_kmh),
+                  "painel.em_viagem": painel.em_viagem})
+
+    modulo_monitoramento_vital.agendar_monitoramento(escalonador, INTERVALO_MONITORAMENTO_S, _ao_verificar,
+                                                     barramento=barramento)
+    modulo_diagnostico.agendar_diagnostico_periodico(escalonador, INTERVALO_DIAGNOSTICO_S,
+                                                     ao_concluir=_ao_concluir_diagnostico, barramento=barramento)
+    modulo_diagnostico.reagir_a_eventos_voo(barramento, ao_concluir=_ao_diagnostico_direcionado)
+    modulo_painel_comando.agendar_voo(escalonador, painel, INTERVALO_VOO_S, _ao_evento_voo)
+    escalonador.agendar_periodico(INTERVALO_CICLO_CAMARA_S, _iniciar_ciclo_camara)
+    if ao_atualizar is not None: # Depois de cada passo de voo (mesmo instante, agendado depois)
+        _publicar_painel()
+        escalonador.agendar_periodico(INTERVALO_VOO_S, _publicar_painel)
+
+    inicio_real = time.perf_counter()
+    escalonador.executar(ate_s=duracao_s)
+    resumo["duracao_real_s"] = time.perf_counter() - inicio_real
+    resumo["tempo_simulado_s"] = relogio.agora()
+    resumo["eventos_executados"] = escalonador.eventos_executados
+    resumo["distancia_marte_km"] = painel.distancia_marte_km
+    resumo["combustivel_pct"] = painel.get_combustivel_percentual()
+    resumo["mensagens_barramento"] = barramento.publicadas
+    return resumo
+
+
+def _simular_replica(semente, indice, duracao_s):
+    """Uma réplica da missão: fluxos aleatórios próprios, derivados de (semente, índice)."""
+    modulo_aleatorio.semear(semente, trabalhador=indice)
+    return simular_dia_missao(duracao_s)
+
+
+def simular_missoes(quantidade, semente, duracao_s=DURACAO_DIA_S, paralelo=False, processos=None):
+    """
+    Executa 'quantidade' réplicas do dia de missão no modo rápido. A réplica i
+    depende só de (semente, i): o resultado é o mesmo em série ou em paralelo.
+    Retorna a lista de resumos, na ordem das réplicas.
+    """
+    indices = range(quantidade)
+    if not paralelo:
+        return [_simular_replica(semente, i, duracao_s) for i in indices]
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        return list(executor.map(_simular_replica, [semente] * quantidade, indices, [duracao_s] * quantidade))
+
+
+def exibir_resumo_missao(resumo):
+    print("\n--- RESUMO DO DIA DE MISSÃO - AURORA I ---")
+    print(f"Tempo simulado            : {resumo['tempo_simulado_s'] / 3600.0:.1f} h")
+    print(f"Tempo real de execução    : {resumo['duracao_real_s'] * 1000.0:.1f} ms")
+    print(f"Eventos executados        : {resumo['eventos_executados']:,}")
+    print(f"Verificações vitais       : {resumo['verificacoes_vitais']:,} ({resumo['alarmes_vitais']} alarmes)")
+    print(f"Pior status da nave       : {resumo['pior_status_nave']}")
+    print(f"Varreduras de diagnóstico : {resumo['varreduras_diagnostico']} "
+          f"({resumo['subsistemas_criticos']} leituras CRÍTICAS)")
+    print(f"Diagnósticos direcionados : {resumo['verificacoes_direcionadas']} subsistemas (por eventos de voo)")
+    print(f"Ciclos da câmara de ar    : {resumo['ciclos_camara']}")
+    if resumo["pressoes_cabine_usadas_psi"]:
+        pressoes = ", ".join(f"{p:.1f}" for p in resumo["pressoes_cabine_usadas_psi"])
+        print(f"Alvo de repressurização   : {pressoes} PSI (pressão da cabine)")
+    print(f"Mensagens no barramento   : {resumo['mensagens_barramento']:,}")
+    print(f"Distância até Marte       : {int(resumo['distancia_marte_km']):,} km")
+    print(f"Combustível restante      : {resumo['combustivel_pct']:.2f}%")
+    for instante_s, mensagem in resumo["eventos_voo"]:
+        print(f"  [{instante_s / 3600.0:5.1f} h] {mensagem}")
+    print("------------------------------------------")
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simula um dia de missão com todos os subsistemas.")
+    parser.add_argument("--horas", type=float, default=24.0, help="Duração simulada, em horas.")
+    parser.add_argument("--modo", choices=[modulo_relogio_simulacao.MODO_RAPIDO,
+                                           modulo_relogio_simulacao.MODO_ESCALADO,
+                                           modulo_relogio_simulacao.MODO_TEMPO_REAL],
+                        default=modulo_relogio_simulacao.MODO_RAPIDO)
+    parser.add_argument("--escala", type=float, default=0.001,
+                        help="Segundos reais por segundo simulado (modo escalado).")
+    parser.add_argument("--semente", type=int, default=None,
+                        help="Semente da missão (mesma semente, mesma missão).")
+    parser.add_argument("--replicas", type=int, default=0,
+                        help="Executa N réplicas no modo rápido e mostra um resumo de cada.")
+    parser.add_argument("--paralelo", action="store_true", help="Distribui as réplicas entre processos.")
+    opcoes = parser.parse_args()
+    try:
+        if opcoes.replicas > 0:
+            inicio = time.perf_counter()
+            resumos = simular_missoes(opcoes.replicas, opcoes.semente, opcoes.horas * 3600.0, opcoes.paralelo)
+            for i, resumo in enumerate(resumos):
+                print(f"Réplica {i:>3}: {resumo['verificacoes_vitais']:,} verificações | "
+                      f"{resumo['alarmes_vitais']} alarmes | pior status {resumo['pior_status_nave']} | "
+                      f"combustível {resumo['combustivel_pct']:.2f}%")
+            print(f"{len(resumos)} réplicas em {time.perf_counter() - inicio:.2f}s")
+        else:
+            if opcoes.semente is not None:
+                modulo_aleatorio.semear(opcoes.semente)
+            exibir_resumo_missao(simular_dia_missao(opcoes.horas * 3600.0, opcoes.modo, opcoes.escala))
+    except KeyboardInterrupt:
+        print("\n\nSimulação interrompida pelo usuário.")
+    except Exception as e:
+        print(f"\nOcorreu um erro inesperado na simulação: {e}")
+        sys.exit(1)
@@ -1,94 +1,105 @@
-import random
 import time
 import datetime
 import sys
-import winsound # Para alarme sonoro no Windows (requer instação se não padrão)
 import os # Para alarme sonoro em Linux/Mac
 
+import modulo_relogio_simulacao
+import modulo_metricas
+import modulo_aleatorio
+import modulo_tripulacao
+from modulo_barramento_telemetria import TOPICO_LEITURAS_AMBIENTE, LeituraAmbiente
+
+try: # winsound só existe no Windows; nos demais sistemas o alarme usa comandos do SO
+    import winsound # Para alarme sonoro no Windows
+except ImportError:
+    winsound = None
+
 # --- Constantes de Status ---
 STATUS_NORMAL = "NORMAL"
 STATUS_ATENCAO = "ATENÇÃO"
 STATUS_CRITICO = "CRÍTICO"
 
-# --- Tripulação (7 membros como na história) ---
-TRIPULANTES_IDS = [f"Astronauta_{i+1:02d}" for i in range(7)] # Ex: Astronauta_01, ..., Astronauta_07
-
-# --- Definição de Parâmetros, Unidades e Limites (Valores Exemplo) ---
-# Chave: Nome do Parâmetro
-# Valor: Dicionário com unidade, limites (normal, atencao_baixo, atencao_alto, critico_baixo, critico_alto),
-#        e parâmetros para simulação (media, desvio_padrao)
-PARAMETROS_MONITORADOS = {
-    # Vitals (por tripulante)
-    "Frequencia Cardiaca":    {"unidade": "BPM",      "limites": (60, 100, 50, 110, 40, 120), "sim": (75, 8)},
-    "Pressao Sistolica":      {"unidade": "mmHg",     "limites": (90, 120, 85, 140, 80, 160), "sim": (110, 10)},
-    "Pressao Diastolica":     {"unidade": "mmHg",     "limites": (60, 80,  55, 90,  50, 100), "sim": (70, 8)},
-    "Temperatura Corporal":   {"unidade": "°C",       "limites": (36.1, 37.2, 35.5, 37.8, 35.0, 38.5), "sim": (36.8, 0.3)},
-    "Taxa Respiratoria":      {"unidade": "resp/min", "limites": (12, 20, 10, 24, 8, 30),   "sim": (16, 2)},
-    "SpO2":                   {"unidade": "%",        "limites": (95, 100, 90, 94.9, 0, 89.9), "sim": (98, 1)}, # Atenção/Crítico só abaixo de 95
-    # Ambiente (ECLSS)
-    "Pressao Cabine":         {"unidade": "psi",      "limites": (14.5, 14.9, 14.0, 15.1, 13.5, 15.5), "sim": (14.7, 0.1)},
-    "Nivel O2":               {"unidade": "%",        "limites": (20.0, 21.5, 19.0, 22.5, 18.0, 23.5), "sim": (20.9, 0.2)},
-    "Nivel CO2":              {"unidade": "ppm",      "limites": (400, 1000, 1001, 3000, 0, 5000),  "sim": (800, 200)}, # Atenção/Crítico só acima de 1000/3000
-    "Temperatura Ar Cabine":  {"unidade": "°C",       "limites": (20, 24, 18, 26, 16, 28),   "sim": (22, 1)},
-    "Umidade Relativa Cabine":{"unidade": "%",        "limites": (40, 60, 30, 70, 20, 80),   "sim": (50, 5)},
-}
+# --- Tripulação e Parâmetros Monitorados ---
+# Carregados de tripulacao.json (ver modulo_tripulacao): escopo vital/cabine,
+# unidade, limites (normal, atencao_baixo, atencao_alto, critico_baixo, critico_alto),
+# simulação (media, desvio_padrao) e, por tripulante, linha de base e limites próprios
+CATALOGO_TRIPULACAO = modulo_tripulacao.carregar_catalogo()
+
+# Mantidos para compatibilidade: ids da tripulação e {parâmetro: definição padrão}
+TRIPULANTES_IDS = list(CATALOGO_TRIPULACAO.ids)
+PARAMETROS_MONITORADOS = CATALOGO_TRIPULACAO.parametros
+
+# Fluxo de sorteios próprio do módulo (semeável e com blocos pré-sorteados)
+ALEATORIO = modulo_aleatorio.fluxo("monitoramento_vital")
 
 # Probabilidade de gerar um valor FORA da faixa normal na simulação
 PROB_FALHA_SIMULADA = 0.03 # 3% de chance para cada parâmetro gerar leitura anômala
 
+# --- Métricas (custo só com modulo_metricas.ATIVO) ---
+METRICA_VERIFICACOES = modulo_metricas.contador(
+    "aurora_monitoramento_verificacoes_total", "Verificações completas de condições vitais e ambientais.")
+METRICA_LEITURAS = modulo_metricas.contador(
+    "aurora_monitoramento_leituras_total", "Leituras de sensores classificadas (use rate() para leituras/s).")
+METRICA_ALARMES = modulo_metricas.contador(
+    "aurora_monitoramento_alarmes_total", "Alarmes críticos gerados pelo monitoramento.")
+METRICA_LATENCIA_VERIFICACAO = modulo_metricas.histograma(
+    "aurora_monitoramento_verificacao_segundos", "Duração de uma verificação completa.")
+METRICA_STATUS_NAVE = modulo_metricas.medidor(
+    "aurora_monitoramento_status_nave", "Status geral da nave na última verificação (0=NORMAL, 1=ATENÇÃO, 2=CRÍTICO).")
+NIVEL_STATUS = {STATUS_NORMAL: 0, STATUS_ATENCAO: 1, STATUS_CRITICO: 2}
+
 # --- Funções Auxiliares ---
 
-def _simular_leitura_sensor(param_info):
+def _sortear_valor(media, std_dev, limites, casas_decimais):
     """Simula a leitura de um sensor com base na média e desvio padrão."""
-    media, std_dev = param_info["sim"]
     # Simula leitura com distribuição normal (Gaussiana) para realismo
-    valor = random.gauss(media, std_dev)
+    valor = ALEATORIO.gauss(media, std_dev)
 
     # Introduz chance de erro simulado (Atenção ou Crítico)
     # Isso força o sistema a lidar com anomalias ocasionalmente
-    if random.random() < PROB_FALHA_SIMULADA:
-        # ... (lógica para gerar valor na faixa de Atenção ou Crítico) ...
+    if ALEATORIO.random() < PROB_FALHA_SIMULADA:
         # Decide se será Atenção ou Crítico e gera valor na faixa correspondente
-        if random.random() < 0.6: # 60% chance de ser Atenção, 40% Crítico
-            faixa = "atencao"
-            lim_norm_min, lim_norm_max, lim_att_min, lim_att_max, _, _ = param_info["limites"]
+        lim_norm_min, lim_norm_max, lim_att_min, lim_att_max, lim_crit_min, lim_crit_max = limites
+        if ALEATORIO.random() < 0.6: # 60% chance de ser Atenção, 40% Crítico
             # Gera valor entre limite critico e normal (abaixo ou acima)
-            valor = random.uniform(lim_att_min, lim_norm_min) if random.random() < 0.5 else random.uniform(lim_norm_max, lim_att_max)
+            valor = ALEATORIO.uniform(lim_att_min, lim_norm_min) if ALEATORIO.random() < 0.5 else ALEATORIO.uniform(lim_norm_max, lim_att_max)
         else:
-            faixa = "critico"
-            _, _, lim_att_min, lim_att_max, lim_crit_min, lim_crit_max = param_info["limites"]
-             # Gera valor fora do limite de atenção (abaixo ou acima)
-            valor = random.uniform(lim_crit_min, lim_att_min) if random.random() < 0.5 else random.uniform(lim_att_max, lim_crit_max)
-
-    # Arredondamento para deixar mais simples
-    unidade = param_info["unidade"]
-    if unidade in ["°C", "psi", "%"]: # Manter 1 casa decimal para estes
-        return round(valor, 1)
-    else: # BPM, mmHg, resp/min, ppm - arredondar para inteiro
-        return round(valor)
+            # Gera valor fora do limite de atenção (abaixo ou acima)
+            valor = ALEATORIO.uniform(lim_crit_min, lim_att_min) if ALEATORIO.random() < 0.5 else ALEATORIO.uniform(lim_att_max, lim_crit_max)
 
-def _verificar_status_parametro(valor, param_info):
+    # Arredondamento para deixar mais simples (casas decimais definidas no catálogo)
+    return round(valor, casas_decimais) if casas_decimais else round(valor)
+
+def _simular_leitura_sensor(param_info):
+    """Simula a leitura de um sensor com a linha de base padrão do parâmetro."""
+    media, std_dev = param_info["sim"]
+    return _sortear_valor(media, std_dev, param_info["limites"], param_info["casas_decimais"])
+
+def _classificar_valor(valor, limites, sentido):
     """Avalia o valor lido e retorna o status (NORMAL, ATENCAO, CRITICO)."""
-    norm_min, norm_max, att_min, att_max, crit_min, crit_max = param_info["limites"]
+    norm_min, norm_max, att_min, att_max, crit_min, crit_max = limites
 
     if norm_min <= valor <= norm_max:
         return STATUS_NORMAL
     # Verifica Crítico primeiro (mais importante)
-    # Atenção especial para SpO2 e CO2 que só têm limite crítico/atenção em uma direção
-    elif (param_info["unidade"] == "%" and param_info["sim"][0] > 90 and valor <= crit_max) or \
-         (param_info["unidade"] == "ppm" and valor >= crit_max) or \
-         (param_info["unidade"] not in ["%", "ppm"] and (valor <= crit_min or valor >= crit_max)):
-         return STATUS_CRITICO
-    # Verifica Atenção
-    elif (param_info["unidade"] == "%" and param_info["sim"][0] > 90 and att_min <= valor <= att_max) or \
-         (param_info["unidade"] == "ppm" and att_min <= valor <= att_max) or \
-         (param_info["unidade"] not in ["%", "ppm"] and (att_min <= valor < norm_min or norm_max < valor <= att_max)):
-        return STATUS_ATENCAO
+    # Parâmetros com alarme em um só sentido (ex.: SpO2 baixo, CO2 alto) usam só o limite daquele lado
+    if sentido == modulo_tripulacao.SENTIDO_AMBOS:
+        if valor <= crit_min or valor >= crit_max:
+            return STATUS_CRITICO
+        if att_min <= valor < norm_min or norm_max < valor <= att_max:
+            return STATUS_ATENCAO
     else:
-        # Caso raro de cair fora de todas as faixas definidas (pode indicar erro nos limites)
-        # Por segurança, classificar como ATENCAO
-        # print(f"Debug: Valor {valor} {param_info['unidade']} fora das faixas definidas para {param_info['sim']}.")
-        return STATUS_ATENCAO
+        if (valor <= crit_max) if sentido == modulo_tripulacao.SENTIDO_BAIXO else (valor >= crit_max):
+            return STATUS_CRITICO
+        if att_min <= valor <= att_max:
+            return STATUS_ATENCAO
+    # Caso raro de cair fora de todas as faixas definidas (pode indicar erro nos limites)
+    # Por segurança, classificar como ATENCAO
+    return STATUS_ATENCAO
+
+def _verificar_status_parametro(valor, param_info):
+    """Avalia o valor lido com os limites padrão do parâmetro."""
+    return _classificar_valor(valor, param_info["limites"], param_info["sentido"])
 
 
 def _disparar_alarme(mensagens_criticas):
@@ -102,7 +113,7 @@ def _disparar_alarme(mensagens_criticas):
 
     # Tentativa de alarme sonoro (opcional e dependente do sistema)
     try:
-         if sys.platform == "win32":
+         if sys.platform == "win32" and winsound is not None:
              winsound.Beep(1000, 1500) # Frequência 1000Hz por 1.5 segundos
              time.sleep(0.5)
              winsound.Beep(1000, 1500)
@@ -115,54 +126,156 @@ def _disparar_alarme(mensagens_criticas):
           print(f"(Não foi possível disparar alarme sonoro: {e})")
 
 
+# --- Agregação Incremental de Status ---
+
+ESCOPO_CABINE = "Cabine" # Escopo das leituras ambientais (os demais escopos são tripulantes)
+
+
+def _status_das_contagens(contagens):
+    """Status mais grave presente em [n_normal, n_atencao, n_critico]."""
+    if contagens[2]:
+        return STATUS_CRITICO
+    return STATUS_ATENCAO if contagens[1] else STATUS_NORMAL
+
+
+class AgregadorStatus:
+    """
+    Mantém, por escopo (cabine ou tripulante) e para a nave toda, quantas
+    leituras estão em NORMAL, ATENÇÃO e CRÍTICO. Cada leitura nova só move a
+    sua célula de uma contagem para outra: o status do tripulante e o da nave
+    são atualizados em O(1), sem reler a matriz tripulação x parâmetros.
+    Permite monitoramento por eventos, com sensores que só reportam mudanças.
+    """
+
+    def __init__(self, catalogo=None):
+        self._catalogo = catalogo or CATALOGO_TRIPULACAO # Limites de cada tripulante
+        self._regras = {}          # (escopo, parâmetro) -> (limites, sentido), consultados uma vez no catálogo
+        self._celulas = {}         # (escopo, parâmetro) -> nível do status (0, 1, 2)
+        self._valores = {}         # (escopo, parâmetro) -> último valor lido
+        self._por_escopo = {}      # escopo -> [n_normal, n_atencao, n_critico]
+        self._nave = [0, 0, 0]
+
+    def atualizar(self, escopo, parametro, status, valor=None):
+        """Registra o status de uma leitura. Retorna (status_do_escopo, status_da_nave)."""
+        nivel = NIVEL_STATUS[status]
+        chave = (escopo, parametro)
+        contagens = self._por_escopo.get(escopo)
+        if contagens is None:
+            contagens = self._por_escopo[escopo] = [0, 0, 0]
+        anterior = self._celulas.get(chave)
+        if anterior is not None:
+            contagens[anterior] -= 1
+            self._nave[anterior] -= 1
+        contagens[nivel] += 1
+        self._nave[nivel] += 1
+        self._celulas[chave] = nivel
+        self._valores[chave] = valor
+        return _status_das_contagens(contagens), _status_das_contagens(self._nave)
+
+    def atualizar_leitura(self, escopo, parametro, valor):
+        """Classifica um valor lido pelo sensor (com os limites do tripulante) e registra o status resultante."""
+        regra = self._regras.get((escopo, parametro))
+        if regra is None:
+            regra = self._regras[(escopo, parametro)] = self._catalogo.limites_de(escopo, parametro)
+        limites = regra[0]
+        # Caminho rápido: a maioria das leituras está na faixa normal
+        status = STATUS_NORMAL if limites[0] <= valor <= limites[1] else _classificar_valor(valor, limites, regra[1])
+        return self.atualizar(escopo, parametro, status, valor)
+
+    def status_nave(self):
+        return _status_das_contagens(self._nave)
+
+    def status_escopo(self, escopo):
+        contagens = self._por_escopo.get(escopo)
+        return _status_das_contagens(contagens) if contagens else STATUS_NORMAL
+
+    def contagens(self, escopo=None):
+        """{status: quantidade} do escopo informado ou, sem escopo, da nave."""
+        contagens = self._nave if escopo is None else self._por_escopo.get(escopo, (0, 0, 0))
+        return dict(zip((STATUS_NORMAL, STATUS_ATENCAO, STATUS_CRITICO), contagens))
+
+    def status_tripulantes(self):
+        """{tripulante: status_geral} de todos os escopos que não são a cabine."""
+        return {escopo: _status_das_contagens(contagens)
+                for escopo, contagens in self._por_escopo.items() if escopo != ESCOPO_CABINE}
+
+    def valor(self, escopo, parametro):
+        return self._valores.get((escopo, parametro))
+
+
 # --- Funções Principais do Módulo ---
 
-def monitorar_condicoes_atuais():
+def monitorar_condicoes_atuais(disparar_alarme=True, barramento=None, instante_s=0.0, agregador=None, catalogo=None):
     """
     Executa uma única verificação completa das condições vitais e ambientais,
     retornando dicionários com os status detalhados e uma lista de alarmes.
+    Com disparar_alarme=False (execução sem console), os alarmes só são retornados.
+    Com um barramento, as leituras ambientais são publicadas em um único lote.
+    Com um AgregadorStatus, cada leitura também é registrada nele, para que
+    atualizações parciais posteriores partam do estado desta varredura.
+    O catálogo (padrão: CATALOGO_TRIPULACAO) define a tripulação, os parâmetros
+    e a linha de base e os limites de cada tripulante.
     """
+    catalogo = catalogo or CATALOGO_TRIPULACAO
+    inicio = time.perf_counter() if modulo_metricas.ATIVO else 0.0
     status_vital_tripulantes = {}
     status_ambiente_cabine = {}
     alarmes_ativos = []
     status_geral_nave = STATUS_NORMAL # Começa normal, piora se algo for detectado
 
     # Monitorar Ambiente
-    for nome_param, info_param in PARAMETROS_MONITORADOS.items():
-        if info_param["unidade"] in ["psi", "%", "ppm", "°C"] and nome_param != "Temperatura Corporal":
-            valor = _simular_leitura_sensor(info_param)
-            status = _verificar_status_parametro(valor, info_param)
-            status_ambiente_cabine[nome_param] = {"valor": valor, "status": status, "unidade": info_param["unidade"]}
-            if status == STATUS_CRITICO:
-                alarmes_ativos.append(f"Ambiente: {nome_param} {status} ({valor} {info_param['unidade']})")
-                status_geral_nave = STATUS_CRITICO
-            elif status == STATUS_ATENCAO and status_geral_nave == STATUS_NORMAL:
-                status_geral_nave = STATUS_ATENCAO
-
-    # Monitorar Tripulantes
-    for tripulante_id in TRIPULANTES_IDS:
+    for nome_param in catalogo.ambiente:
+        info_param = catalogo.parametros[nome_param]
+        valor = _simular_leitura_sensor(info_param)
+        status = _verificar_status_parametro(valor, info_param)
+        status_ambiente_cabine[nome_param] = {"valor": valor, "status": status, "unidade": info_param["unidade"]}
+        if agregador is not None:
+            agregador.atualizar(ESCOPO_CABINE, nome_param, status, valor)
+        if status == STATUS_CRITICO:
+            alarmes_ativos.append(f"Ambiente: {nome_param} {status} ({valor} {info_param['unidade']})")
+            status_geral_nave = STATUS_CRITICO
+        elif status == STATUS_ATENCAO and status_geral_nave == STATUS_NORMAL:
+            status_geral_nave = STATUS_ATENCAO
+
+    # Monitorar Tripulantes: cada leitura usa a linha do tripulante nas colunas do catálogo
+    colunas_vitais = catalogo.colunas_vitais()
+    for linha, tripulante_id in enumerate(catalogo.ids):
         status_tripulante = {}
         status_geral_tripulante = STATUS_NORMAL
-        for nome_param, info_param in PARAMETROS_MONITORADOS.items():
-             # Filtra apenas parâmetros vitais
-             if info_param["unidade"] not in ["psi", "%", "ppm"] and nome_param != "Temperatura Ar Cabine" and nome_param != "Umidade Relativa Cabine":
-                valor = _simular_leitura_sensor(info_param)
-                status = _verificar_status_parametro(valor, info_param)
-                status_tripulante[nome_param] = {"valor": valor, "status": status, "unidade": info_param["unidade"]}
-                if status == STATUS_CRITICO:
-                    alarmes_ativos.append(f"{tripulante_id}: {nome_param} {status} ({valor} {info_param['unidade']})")
-                    status_geral_tripulante = STATUS_CRITICO
-                    status_geral_nave = STATUS_CRITICO # Status crítico de um tripulante afeta a nave
-                elif status == STATUS_ATENCAO and status_geral_tripulante == STATUS_NORMAL:
-                    status_geral_tripulante = STATUS_ATENCAO
-                    if status_geral_nave == STATUS_NORMAL: # Atenção de um tripulante eleva o status da nave para Atenção
-                         status_geral_nave = STATUS_ATENCAO
+        for nome_param, unidade, sentido, casas, medias, desvios, limites_coluna in colunas_vitais:
+            limites = limites_coluna[linha]
+            valor = _sortear_valor(medias[linha], desvios[linha], limites, casas)
+            status = _classificar_valor(valor, limites, sentido)
+            status_tripulante[nome_param] = {"valor": valor, "status": status, "unidade": unidade}
+            if agregador is not None:
+                agregador.atualizar(tripulante_id, nome_param, status, valor)
+            if status == STATUS_CRITICO:
+                alarmes_ativos.append(f"{tripulante_id}: {nome_param} {status} ({valor} {unidade})")
+                status_geral_tripulante = STATUS_CRITICO
+                status_geral_nave = STATUS_CRITICO # Status crítico de um tripulante afeta a nave
+            elif status == STATUS_ATENCAO and status_geral_tripulante == STATUS_NORMAL:
+                status_geral_tripulante = STATUS_ATENCAO
+                if status_geral_nave == STATUS_NORMAL: # Atenção de um tripulante eleva o status da nave para Atenção
+                     status_geral_nave = STATUS_ATENCAO
 
         status_vital_tripulantes[tripulante_id] = {"status_geral": status_geral_tripulante, "detalhes": status_tripulante}
 
 
+    if barramento is not None:
+        barramento.publicar_lote(TOPICO_LEITURAS_AMBIENTE, tuple(
+            LeituraAmbiente(nome, dado["valor"], dado["unidade"], dado["status"], instante_s)
+            for nome, dado in status_ambiente_cabine.items()))
+
+    if modulo_metricas.ATIVO:
+        leituras = len(status_ambiente_cabine) + sum(len(t["detalhes"]) for t in status_vital_tripulantes.values())
+        METRICA_VERIFICACOES.inc()
+        METRICA_LEITURAS.inc(leituras)
+        METRICA_ALARMES.inc(len(alarmes_ativos))
+        METRICA_STATUS_NAVE.definir(NIVEL_STATUS[status_geral_nave])
+        METRICA_LATENCIA_VERIFICACAO.observar(time.perf_counter() - inicio)
+
     # Dispara o alarme consolidado se houver algum CRÍTICO
-    if any(a.endswith(f"{STATUS_CRITICO})") or f" {STATUS_CRITICO} (" in a for a in alarmes_ativos):
+    if disparar_alarme and any(a.endswith(f"{STATUS_CRITICO})") or f" {STATUS_CRITICO} (" in a for a in alarmes_ativos):
         _disparar_alarme(alarmes_ativos)
 
     return status_geral_nave, status_vital_tripulantes, status_ambiente_cabine, alarmes_ativos
@@ -189,8 +302,10 @@ def exibir_relatorio_monitoramento(status_nave, status_tripulantes, status_ambie
     print("----------------------------------------------------------------")
 
 
-def iniciar_monitoramento_periodico(intervalo_segundos=30):
-    """Inicia o ciclo de monitoramento que roda periodicamente."""
+def iniciar_monitoramento_periodico(intervalo_segundos=30, relogio=None):
+    """Inicia o ciclo de monitoramento que roda periodicamente.
+       A espera entre ciclos passa pelo relógio de simulação (padrão: tempo real)."""
+    relogio = relogio or modulo_relogio_simulacao.RELOGIO_PADRAO
     print(f"\n=== INICIANDO MONITORAMENTO PERIÓDICO (Intervalo: {intervalo_segundos}s) ===")
     print("Pressione Ctrl+C para encerrar o monitoramento.")
     try:
@@ -207,7 +322,7 @@ def iniciar_monitoramento_periodico(intervalo_segundos=30):
 
             # Espera para o próximo ciclo
             print(f"Próxima verificação em {intervalo_segundos} segundos...")
-            time.sleep(intervalo_segundos)
+            relogio.dormir(intervalo_segundos)
 
     except KeyboardInterrupt:
         print("\n\n=== MONITORAMENTO PERIÓDICO ENCERRADO PELO USUÁRIO ===")
@@ -215,6 +330,22 @@ def iniciar_monitoramento_periodico(intervalo_segundos=30):
         print(f"\n\n!!! ERRO CRÍTICO NO LOOP DE MONITORAMENTO: {e} !!!")
         print("=== MONITORAMENTO ENCERRADO ===")
 
+def agendar_monitoramento(escalonador, intervalo_segundos=30, ao_verificar=None, barramento=None):
+    """
+    Agenda verificações periódicas no escalonador de eventos compartilhado, sem
+    console: ao_verificar(status_nave, status_tripulantes, status_ambiente,
+    alarmes, instante_s) recebe cada resultado. Com um barramento, as leituras
+    ambientais são publicadas nele. Retorna o evento periódico.
+    """
+    def _verificar():
+        instante_s = escalonador.relogio.agora()
+        status_n, status_t, status_a, alarmes = monitorar_condicoes_atuais(
+            disparar_alarme=False, barramento=barramento, instante_s=instante_s)
+        if ao_verificar is not None:
+            ao_verificar(status_n, status_t, status_a, alarmes, instante_s)
+
+    return escalonador.agendar_periodico(intervalo_segundos, _verificar)
+
 # --- Bloco de Execução Principal (para teste) ---
 if __name__ == "__main__":
     # Inicia o monitoramento contínuo com intervalo de 20 segundos
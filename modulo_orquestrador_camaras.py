@@ -0,0 +1,313 @@
+import asyncio
+import heapq
+import itertools
+import random
+from collections import namedtuple
+
+import modulo_pressurizacao
+
+# -----------------------------------------------------------------------------
+# Orquestrador de Múltiplas Câmaras de Ar da Aurora I
+# -----------------------------------------------------------------------------
+# Executa vários ciclos de câmara de ar ao mesmo tempo (asyncio), disputando
+# uma capacidade de bombeamento compartilhada (kW). Solicitações entram numa
+# fila por prioridade (retorno de EVA antes de carga) e cada ciclo reporta
+# o tempo de espera e a latência até a conclusão.
+#
+# As durações vêm do modelo físico de 'modulo_pressurizacao'. Com o relógio
+# virtual (padrão), o tempo simulado avança direto para o próximo evento, então
+# um dia inteiro de operações é avaliado em frações de segundo.
+# -----------------------------------------------------------------------------
+
+# --- Prioridades (menor valor = atendido primeiro) ---
+PRIORIDADES = {
+    "EVA_RETORNO": 0, # Tripulação voltando de atividade extraveicular
+    "EVA_SAIDA": 1,
+    "CARGA": 2,
+}
+
+CAPACIDADE_BOMBAS_PADRAO_KW = 12.0
+POTENCIA_BOMBA_PADRAO_KW = 6.0 # Consumo de uma bomba de vácuo durante a despressurização
+
+SolicitacaoCiclo = namedtuple("SolicitacaoCiclo", ["id", "tipo", "chegada_s", "tempo_espera_zero_s"],
+                              defaults=(0.0, 60.0))
+
+ResultadoCiclo = namedtuple("ResultadoCiclo", [
+    "id", "tipo", "camara",
+    "t_solicitacao_s", "t_inicio_s", "t_conclusao_s",
+    "espera_s",   # Da solicitação até a bomba começar a despressurizar
+    "latencia_s", # Da solicitação até a câmara repressurizada
+])
+
+
+# --- Relógios ---
+
+class RelogioVirtual:
+    """
+    Tempo simulado para corrotinas asyncio. Cada tarefa se registra; quando
+    todas estão bloqueadas (dormindo ou aguardando recurso), o relógio salta
+    para o próximo instante agendado, sem espera real.
+    """
+
+    def __init__(self):
+        self._agora = 0.0
+        self._agenda = [] # heap (instante, sequência, future)
+        self._seq = itertools.count()
+        self._ativas = 0
+        self._bloqueadas = 0
+
+    def agora(self):
+        return self._agora
+
+    def registrar(self):
+        self._ativas += 1
+
+    def encerrar(self):
+        self._ativas -= 1
+        self._talvez_avancar()
+
+    def bloquear(self):
+        self._bloqueadas += 1
+        self._talvez_avancar()
+
+    def desbloquear(self):
+        self._bloqueadas -= 1
+
+    async def dormir(self, segundos):
+        espera = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._agenda, (self._agora + max(0.0, segundos), next(self._seq), espera))
+        self.bloquear()
+        await espera
+
+    def _talvez_avancar(self):
+        if self._ativas == 0 or self._bloqueadas < self._ativas:
+            return
+        if not self._agenda:
+            raise RuntimeError("Impasse no orquestrador: todas as tarefas aguardam recursos.")
+        instante = self._agenda[0][0]
+        self._agora = instante
+        while self._agenda and self._agenda[0][0] == instante:
+            _, _, espera = heapq.heappop(self._agenda)
+            self.desbloquear()
+            espera.set_result(None)
+
+
+class RelogioTempoReal:
+    """Tempo de parede com fator de escala (0.01 = cem vezes mais rápido)."""
+
+    def __init__(self, escala_tempo=1.0):
+        if escala_tempo <= 0:
+            raise ValueError("Escala de tempo real deve ser > 0 (use RelogioVirtual para 'sem espera').")
+        self.escala_tempo = escala_tempo
+        self._inicio = None
+
+    def agora(self):
+        loop = asyncio.get_running_loop()
+        if self._inicio is None:
+            self._inicio = loop.time()
+        return (loop.time() - self._inicio) / self.escala_tempo
+
+    def registrar(self): pass
+    def encerrar(self): pass
+    def bloquear(self): pass
+    def desbloquear(self): pass
+
+    async def dormir(self, segundos):
+        await asyncio.sleep(max(0.0, segundos) * self.escala_tempo)
+
+
+# --- Recurso Compartilhado com Fila por Prioridade ---
+
+class RecursoPrioritario:
+    """Capacidade compartilhada (kW de bombeamento, câmaras livres...) atendida
+    estritamente por prioridade e, em empate, por ordem de chegada."""
+
+    def __init__(self, relogio, capacidade):
+        self._relogio = relogio
+        self.capacidade = capacidade
+        self.livre = capacidade
+        self._fila = [] # heap (prioridade, sequência, demanda, future)
+        self._seq = itertools.count()
+
+    async def adquirir(self, demanda, prioridade):
+        if demanda > self.capacidade:
+            raise ValueError(f"Demanda {demanda} excede a capacidade total {self.capacidade}.")
+        if not self._fila and self.livre >= demanda:
+            self.livre -= demanda
+            return
+        vez = asyncio.get_running_loop().create_future()
+        entrada = (prioridade, next(self._seq), demanda, vez)
+        heapq.heappush(self._fila, entrada)
+        self._relogio.bloquear()
+        try:
+            await vez
+        except asyncio.CancelledError:
+            if vez.done() and not vez.cancelled():
+                # Cancelada depois de atendida: devolve a capacidade já reservada
+                self.liberar(demanda)
+            else:
+                # Cancelada na fila: sai do heap e deixa de contar como bloqueada
+                self._fila.remove(entrada)
+                heapq.heapify(self._fila)
+                self._relogio.desbloquear()
+                self._atender()
+            raise
+
+    def liberar(self, demanda):
+        self.livre += demanda
+        self._atender()
+
+    def _atender(self):
+        while self._fila and self._fila[0][2] <= self.livre:
+            _, _, demanda_fila, vez = heapq.heappop(self._fila)
+            self.livre -= demanda_fila
+            self._relogio.desbloquear()
+            vez.set_result(None)
+
+
+# --- Orquestrador ---
+
+class OrquestradorCamaras:
+    """Executa ciclos concorrentes em várias câmaras com bombeamento compartilhado."""
+
+    def __init__(self, camaras=None, capacidade_bombas_kw=CAPACIDADE_BOMBAS_PADRAO_KW,
+                 potencia_bomba_kw=POTENCIA_BOMBA_PADRAO_KW, pressao_interna_psi=15.0,
+                 pressao_externa_psi=0.0, relogio=None):
+        # camaras: dicionário nome -> ModeloCamaraAr (padrão: 4 câmaras iguais)
+        self.camaras = camaras or {f"Camara_{i+1}": modulo_pressurizacao.ModeloCamaraAr() for i in range(4)}
+        self.capacidade_bombas_kw = capacidade_bombas_kw
+        self.potencia_bomba_kw = potencia_bomba_kw
+        self.pressao_interna_psi = pressao_interna_psi
+        self.pressao_externa_psi = pressao_externa_psi
+        self.relogio = relogio or RelogioVirtual()
+
+    def _duracoes_fases(self, modelo, tempo_espera_zero_s):
+        perfil = modulo_pressurizacao.gerar_perfil_pressao(
+            modelo, self.pressao_interna_psi, self.pressao_externa_psi, tempo_espera_zero_s)
+        fim_1, fim_2, fim_3 = perfil.fim_fases_s
+        return fim_1, fim_2 - fim_1, fim_3 - fim_2
+
+    async def executar(self, solicitacoes):
+        """Executa todas as solicitações e retorna os resultados por ordem de conclusão."""
+        relogio = self.relogio
+        bombas = RecursoPrioritario(relogio, self.capacidade_bombas_kw)
+        vagas_camaras = RecursoPrioritario(relogio, len(self.camaras))
+        camaras_livres = list(self.camaras)
+        resultados = []
+
+        async def _ciclo(solicitacao):
+            prioridade = PRIORIDADES.get(solicitacao.tipo, max(PRIORIDADES.values()) + 1)
+            try:
+                await relogio.dormir(solicitacao.chegada_s - relogio.agora())
+                t_solicitacao = relogio.agora()
+
+                await vagas_camaras.adquirir(1, prioridade)
+                camara = camaras_livres.pop()
+                try:
+                    duracao_1, duracao_2, duracao_3 = self._duracoes_fases(
+                        self.camaras[camara], solicitacao.tempo_espera_zero_s)
+                    # Só a despressurização usa a bomba; a repressurização equaliza com o habitat
+                    await bombas.adquirir(self.potencia_bomba_kw, prioridade)
+                    t_inicio = relogio.agora()
+                    try:
+                        await relogio.dormir(duracao_1)
+                    finally:
+                        bombas.liberar(self.potencia_bomba_kw)
+                    await relogio.dormir(duracao_2 + duracao_3)
+                finally:
+                    camaras_livres.append(camara)
+                    vagas_camaras.liberar(1)
+
+                t_conclusao = relogio.agora()
+                resultados.append(ResultadoCiclo(
+                    solicitacao.id, solicitacao.tipo, camara, t_solicitacao, t_inicio, t_conclusao,
+                    t_inicio - t_solicitacao, t_conclusao - t_solicitacao))
+            finally:
+                relogio.encerrar()
+
+        for _ in solicitacoes:
+            relogio.registrar() # Registra todas antes de começar, para o relógio não saltar cedo
+        await asyncio.gather(*(_ciclo(solicitacao) for solicitacao in solicitacoes))
+        return resultados
+
+
+# --- Relatórios ---
+
+def _percentil(valores_ordenados, fracao):
+    if not valores_ordenados:
+        return 0.0
+    indice = min(len(valores_ordenados) - 1, int(round(fracao * (len(valores_ordenados) - 1))))
+    return valores_ordenados[indice]
+
+
+def resumir_resultados(resultados):
+    """Estatísticas de espera e latência por tipo de ciclo, e vazão de EVA por hora."""
+    resumo = {}
+    por_tipo = {}
+    for resultado in resultados:
+        por_tipo.setdefault(resultado.tipo, []).append(resultado)
+    for tipo, itens in sorted(por_tipo.items(), key=lambda par: PRIORIDADES.get(par[0], 99)):
+        esperas = sorted(r.espera_s for r in itens)
+        latencias = sorted(r.latencia_s for r in itens)
+        resumo[tipo] = {
+            "ciclos": len(itens),
+            "espera_media_s": sum(esperas) / len(esperas),
+            "espera_p95_s": _percentil(esperas, 0.95),
+            "espera_max_s": esperas[-1],
+            "latencia_media_s": sum(latencias) / len(latencias),
+            "latencia_p95_s": _percentil(latencias, 0.95),
+        }
+
+    if resultados:
+        duracao_cenario = max(r.t_conclusao_s for r in resultados) - min(r.t_solicitacao_s for r in resultados)
+        ciclos_eva = sum(1 for r in resultados if r.tipo.startswith("EVA"))
+        resumo["duracao_cenario_s"] = duracao_cenario
+        resumo["vazao_eva_por_hora"] = ciclos_eva / (duracao_cenario / 3600.0) if duracao_cenario > 0 else 0.0
+    return resumo
+
+
+def executar_cenario(solicitacoes, **opcoes_orquestrador):
+    """Atalho síncrono: executa o cenário e retorna (resultados, resumo)."""
+    orquestrador = OrquestradorCamaras(**opcoes_orquestrador)
+    resultados = asyncio.run(orquestrador.executar(solicitacoes))
+    return resultados, resumir_resultados(resultados)
+
+
+def gerar_solicitacoes(quantidades, janela_s=24 * 3600.0, tempo_espera_zero_s=60.0, semente=None):
+    """Gera solicitações com chegadas uniformes na janela. quantidades: tipo -> n."""
+    sorteio = random.Random(semente)
+    ids = itertools.count(1)
+    solicitacoes = [
+        SolicitacaoCiclo(next(ids), tipo, sorteio.uniform(0.0, janela_s), tempo_espera_zero_s)
+        for tipo, quantidade in quantidades.items() for _ in range(quantidade)
+    ]
+    return sorted(solicitacoes, key=lambda s: s.chegada_s)
+
+
+def exibir_resumo(resumo):
+    print("\n--- RESUMO DA ORQUESTRAÇÃO DAS CÂMARAS DE AR ---")
+    for tipo in PRIORIDADES:
+        if tipo in resumo:
+            dados = resumo[tipo]
+            print(f"  {tipo:<12}: {dados['ciclos']:>5} ciclos | espera média {dados['espera_media_s']:8.1f}s"
+                  f" (p95 {dados['espera_p95_s']:8.1f}s) | latência média {dados['latencia_media_s']:8.1f}s"
+                  f" (p95 {dados['latencia_p95_s']:8.1f}s)")
+    if "duracao_cenario_s" in resumo:
+        print(f"  Duração do cenário: {resumo['duracao_cenario_s'] / 3600:.1f} h | "
+              f"Vazão de EVA: {resumo['vazao_eva_por_hora']:.2f} ciclos/h")
+    print("-------------------------------------------------")
+
+
+# --- Bloco de Execução Principal (para teste) ---
+if __name__ == "__main__":
+    import time
+    try:
+        cenario = gerar_solicitacoes({"EVA_RETORNO": 150, "EVA_SAIDA": 150, "CARGA": 300}, semente=42)
+        inicio = time.perf_counter()
+        _, resumo_cenario = executar_cenario(cenario, capacidade_bombas_kw=12.0)
+        print(f"{len(cenario)} ciclos simulados em {time.perf_counter() - inicio:.3f}s (relógio virtual).")
+        exibir_resumo(resumo_cenario)
+    except KeyboardInterrupt:
+        print("\n\nOrquestração interrompida pelo usuário.")
+    except Exception as e:
+        print(f"\nOcorreu um erro inesperado na orquestração: {e}")
@@ -0,0 +1,375 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+# Painel Ao Vivo da Missão Aurora I (HTTP + WebSocket)
+# -----------------------------------------------------------------------------
+# Servidor asyncio local que mostra, em tempo real e só para leitura, o estado
+# do painel de voo, do monitoramento, do diagnóstico e da câmara de ar:
+# - GET /        página HTML que se conecta ao WebSocket e mostra os campos;
+# - GET /estado  fotografia completa do estado em JSON;
+# - GET /ws      WebSocket: uma fotografia ao conectar e, depois, só os campos
+#                que mudaram, agrupados por quadro (FRAME_S).
+# A simulação só grava campos num dicionário (sob uma trava); a montagem e o
+# envio dos quadros ficam no laço do servidor. Cada quadro é codificado UMA vez
+# e os mesmos bytes vão para todos os espectadores. Um espectador lento não
+# atrasa os demais: seus quadros são pulados e ele recebe uma fotografia
+# completa quando voltar a acompanhar.
+#
+# Uso:
+#   python modulo_painel_ao_vivo.py [porta] [--escala S]   (servidor + missão)
+#   python modulo_painel_ao_vivo.py cliente [porta] [N]     (N clientes de teste)
+# -----------------------------------------------------------------------------
+
+HOST_PAINEL = "127.0.0.1" # Só local: não há autenticação
+PORTA_PAINEL_PADRAO = 8765
+FRAME_S = 0.1                        # Um quadro de atualização a cada 100 ms
+LIMITE_BUFFER_ESPECTADOR = 256 * 1024 # Bytes pendentes antes de pular quadros
+ESCALA_PADRAO = 0.01                 # Segundos reais por segundo de missão (100x)
+
+GUID_WEBSOCKET = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11" # RFC 6455
+OPCODE_TEXTO, OPCODE_FECHAR, OPCODE_PING, OPCODE_PONG = 0x1, 0x8, 0x9, 0xA
+HOSTS_LOCAIS = ("127.0.0.1", "localhost", "::1")
+
+
+class EstadoMissao:
+    """
+    Estado ao vivo em um dicionário plano (campo -> valor), com registro dos
+    campos alterados desde o último quadro. Seguro entre threads: a simulação
+    escreve, o servidor coleta.
+    """
+
+    def __init__(self):
+        self._campos = {}
+        self._alterados = {}
+        self._trava = threading.Lock()
+        self.versao = 0 # Número de quadros com alterações já coletados
+
+    def atualizar(self, campos):
+        """Grava os campos; só os que mudaram de valor entram no próximo quadro."""
+        with self._trava:
+            atuais = self._campos
+            for campo, valor in campos.items():
+                if atuais.get(campo, self) != valor: # 'self' como sentinela de ausente
+                    atuais[campo] = valor
+                    self._alterados[campo] = valor
+
+    def coletar_alteracoes(self):
+        """Retorna (versao, alterações desde a última coleta) ou (versao, None)."""
+        with self._trava:
+            if not self._alterados:
+                return self.versao, None
+            alterados, self._alterados = self._alterados, {}
+            self.versao += 1
+            return self.versao, alterados
+
+    def fotografia(self):
+        with self._trava:
+            return self.versao, dict(self._campos)
+
+
+# --- Protocolo WebSocket (RFC 6455, só o necessário) ---
+
+def _chave_aceite(chave_cliente):
+    resumo = hashlib.sha1((chave_cliente + GUID_WEBSOCKET).encode("ascii")).digest()
+    return base64.b64encode(resumo).decode("ascii")
+
+
+def _quadro_websocket(dados, opcode=OPCODE_TEXTO, mascara=None):
+    """Monta um quadro final. Servidor envia sem máscara; cliente, com máscara."""
+    tamanho = len(dados)
+    bit_mascara = 0x80 if mascara else 0
+    if tamanho < 126:
+        cabecalho = bytes((0x80 | opcode, bit_mascara | tamanho))
+    elif tamanho < 65536:
+        cabecalho = bytes((0x80 | opcode, bit_mascara | 126)) + tamanho.to_bytes(2, "big")
+    else:
+        cabecalho = bytes((0x80 | opcode, bit_mascara | 127)) + tamanho.to_bytes(8, "big")
+    if mascara:
+        dados = bytes(b ^ mascara[i % 4] for i, b in enumerate(dados))
+        return cabecalho + mascara + dados
+    return cabecalho + dados
+
+
+async def _ler_quadro_websocket(leitor):
+    """Lê um quadro e retorna (opcode, dados), já sem máscara."""
+    b0, b1 = await leitor.readexactly(2)
+    opcode = b0 & 0x0F
+    tamanho = b1 & 0x7F
+    if tamanho == 126:
+        tamanho = int.from_bytes(await leitor.readexactly(2), "big")
+    elif tamanho == 127:
+        tamanho = int.from_bytes(await leitor.readexactly(8), "big")
+    mascara = await leitor.readexactly(4) if b1 & 0x80 else None
+    dados = await leitor.readexactly(tamanho)
+    if mascara:
+        dados = bytes(b ^ mascara[i % 4] for i, b in enumerate(dados))
+    return opcode, dados
+
+
+async def _ler_requisicao_http(leitor):
+    """Retorna (metodo, caminho, cabeçalhos em minúsculas)."""
+    linha = (await leitor.readline()).decode("latin-1").strip()
+    metodo, caminho, _ = (linha.split(" ", 2) + ["", ""])[:3]
+    cabecalhos = {}
+    while True:
+        linha = (await leitor.readline()).decode("latin-1")
+        if linha in ("\r\n", "\n", ""):
+            break
+        nome, _, valor = linha.partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    return metodo, caminho, cabecalhos
+
+
+# --- Servidor ---
+
+PAGINA_HTML = """<!DOCTYPE html>
+<html lang="pt-BR"><head><meta charset="utf-8"><title>Aurora I - Painel Ao Vivo</title>
+<style>body{font-family:monospace;background:#111;color:#ddd}td{padding:2px 12px}
+.CRÍTICO{color:#f55}.ALERTA,.ATENÇÃO{color:#fc3}.mudou{background:#234}</style></head>
+<body><h2>AURORA I - PAINEL AO VIVO (somente leitura)</h2><div id="info">conectando...</div>
+<table id="t"></table><script>
+const linhas = {}, t = document.getElementById("t");
+function mostrar(campo, valor) {
+  let l = linhas[campo];
+  if (!l) { l = t.insertRow(); l.insertCell().textContent = campo; l.insertCell(); linhas[campo] = l;
+            [...t.rows].sort((a, b) => a.cells[0].textContent.localeCompare(b.cells[0].textContent))
+              .forEach(r => t.appendChild(r)); }
+  const c = l.cells[1]; c.textContent = valor; c.className = "mudou " + valor;
+  setTimeout(() => c.classList.remove("mudou"), 300);
+}
+const ws = new WebSocket("ws://" + location.host + "/ws");
+ws.onmessage = e => { const m = JSON.parse(e.data);
+  document.getElementById("info").textContent = m.tipo + " #" + m.versao;
+  for (const [k, v] of Object.entries(m.campos)) mostrar(k, v); };
+ws.onclose = () => document.getElementById("info").textContent = "desconectado";
+</script></body></html>
+"""
+
+
+class _Espectador:
+    __slots__ = ("escritor", "atrasado")
+
+    def __init__(self, escritor):
+        self.escritor = escritor
+        self.atrasado = False # Pulou quadros: precisa de uma fotografia completa
+
+
+class ServidorPainelAoVivo:
+    """Servidor HTTP/WebSocket somente leitura do estado da missão."""
+
+    def __init__(self, estado, host=HOST_PAINEL, porta=PORTA_PAINEL_PADRAO, frame_s=FRAME_S):
+        self.estado = estado
+        self.host = host
+        self.porta = porta
+        self.frame_s = frame_s
+        self.espectadores = set()
+        self.quadros_enviados = 0
+        self.quadros_pulados = 0
+        self._servidor = None
+        self._tarefa_quadros = None
+
+    @staticmethod
+    def _mensagem(tipo, versao, campos):
+        texto = json.dumps({"tipo": tipo, "versao": versao, "campos": campos}, ensure_ascii=False)
+        return _quadro_websocket(texto.encode("utf-8"))
+
+    async def iniciar(self):
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.porta = self._servidor.sockets[0].getsockname()[1] # Porta real (se 0)
+        self._tarefa_quadros = asyncio.create_task(self._laco_quadros())
+        return self
+
+    async def encerrar(self):
+        if self._tarefa_quadros is not None:
+            self._tarefa_quadros.cancel()
+        for espectador in list(self.espectadores):
+            espectador.escritor.close()
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+
+    async def _laco_quadros(self):
+        """A cada quadro: coleta as alterações, codifica uma vez e envia a todos."""
+        while True:
+            await asyncio.sleep(self.frame_s)
+            versao, alterados = self.estado.coletar_alteracoes()
+            if alterados is None or not self.espectadores:
+                continue
+            quadro = self._mensagem("delta", versao, alterados)
+            for espectador in list(self.espectadores):
+                transporte = espectador.escritor.transport
+                if transporte.is_closing():
+                    continue
+                if transporte.get_write_buffer_size() > LIMITE_BUFFER_ESPECTADOR:
+                    espectador.atrasado = True # Não acumula mais: pula este quadro
+                    self.quadros_pulados += 1
+                elif espectador.atrasado:
+                    espectador.atrasado = False # Voltou a acompanhar: fotografia completa
+                    espectador.escritor.write(self._mensagem("snapshot", *self.estado.fotografia()))
+                    self.quadros_enviados += 1
+                else:
+                    espectador.escritor.write(quadro)
+                    self.quadros_enviados += 1
+
+    async def _atender(self, leitor, escritor):
+        try:
+            metodo, caminho, cabecalhos = await _ler_requisicao_http(leitor)
+            caminho = caminho.split("?", 1)[0]
+            if metodo != "GET":
+                await self._responder(escritor, 405, "text/plain", b"Somente leitura (GET).")
+            elif caminho == "/ws" and cabecalhos.get("upgrade", "").lower() == "websocket":
+                await self._sessao_websocket(leitor, escritor, cabecalhos)
+            elif caminho == "/estado":
+                versao, campos = self.estado.fotografia()
+                corpo = json.dumps({"versao": versao, "campos": campos}, ensure_ascii=False).encode("utf-8")
+                await self._responder(escritor, 200, "application/json; charset=utf-8", corpo)
+            elif caminho == "/":
+                await self._responder(escritor, 200, "text/html; charset=utf-8", PAGINA_HTML.encode("utf-8"))
+            else:
+                await self._responder(escritor, 404, "text/plain", b"Use /, /estado ou /ws.")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+    @staticmethod
+    async def _responder(escritor, codigo, tipo, corpo):
+        motivos = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+        escritor.write(f"HTTP/1.1 {codigo} {motivos[codigo]}\r\nContent-Type: {tipo}\r\n"
+                       f"Content-Length: {len(corpo)}\r\nConnection: close\r\n\r\n".encode("ascii") + corpo)
+        await escritor.drain()
+
+    async def _sessao_websocket(self, leitor, escritor, cabecalhos):
+        chave = cabecalhos.get("sec-websocket-key")
+        if not chave:
+            await self._responder(escritor, 400, "text/plain; charset=utf-8", "Handshake WebSocket inválido.".encode("utf-8"))
+            return
+        escritor.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                        f"Sec-WebSocket-Accept: {_chave_aceite(chave)}\r\n\r\n").encode("ascii"))
+        escritor.write(self._mensagem("snapshot", *self.estado.fotografia()))
+        await escritor.drain()
+        espectador = _Espectador(escritor)
+        self.espectadores.add(espectador)
+        try:
+            while True: # Espectadores só leem: tratamos apenas ping e fechamento
+                opcode, dados = await _ler_quadro_websocket(leitor)
+                if opcode == OPCODE_FECHAR:
+                    escritor.write(_quadro_websocket(b"", OPCODE_FECHAR))
+                    break
+                if opcode == OPCODE_PING:
+                    escritor.write(_quadro_websocket(dados, OPCODE_PONG))
+        finally:
+            self.espectadores.discard(espectador)
+
+
+# --- Missão em Segundo Plano ---
+
+def iniciar_missao_em_segundo_plano(estado, horas=24.0 * 365, escala_tempo=ESCALA_PADRAO):
+    """Roda o dia de missão (relógio escalado) numa thread, alimentando 'estado'."""
+    import modulo_missao
+    import modulo_relogio_simulacao
+
+    def _executar():
+        modulo_missao.simular_dia_missao(horas * 3600.0, modulo_relogio_simulacao.MODO_ESCALADO,
+                                         escala_tempo, ao_atualizar=estado.atualizar)
+
+    thread = threading.Thread(target=_executar, name="missao-ao-vivo", daemon=True)
+    thread.start()
+    return thread
+
+
+async def servir_painel(porta=PORTA_PAINEL_PADRAO, escala_tempo=ESCALA_PADRAO):
+    estado = EstadoMissao()
+    servidor = await ServidorPainelAoVivo(estado, porta=porta).iniciar()
+    iniciar_missao_em_segundo_plano(estado, escala_tempo=escala_tempo)
+    print(f"Painel ao vivo em http://{HOST_PAINEL}:{servidor.porta}/ (Ctrl+C para encerrar)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servidor.encerrar()
+
+
+# --- Cliente de Teste (somente local) ---
+
+async def cliente_teste(porta=PORTA_PAINEL_PADRAO, duracao_s=3.0, host=HOST_PAINEL):
+    """
+    Conecta ao WebSocket, aplica fotografia + alterações a uma cópia local do
+    estado e retorna (estado_local, mensagens_recebidas, versao).
+    Recusa hosts que não sejam locais.
+    """
+    if host not in HOSTS_LOCAIS:
+        raise ValueError(f"O cliente de teste só conecta em hosts locais, não em '{host}'.")
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    chave = base64.b64encode(os.urandom(16)).decode("ascii")
+    escritor.write((f"GET /ws HTTP/1.1\r\nHost: {host}:{porta}\r\nUpgrade: websocket\r\n"
+                    f"Connection: Upgrade\r\nSec-WebSocket-Key: {chave}\r\n"
+                    "Sec-WebSocket-Version: 13\r\n\r\n").encode("ascii"))
+    resposta = (await leitor.readuntil(b"\r\n\r\n")).decode("latin-1")
+    if " 101 " not in resposta.split("\r\n", 1)[0] or _chave_aceite(chave) not in resposta:
+        raise ConnectionError("Handshake WebSocket recusado pelo servidor.")
+
+    estado_local, mensagens, versao = {}, 0, 0
+    limite = time.monotonic() + duracao_s
+    try:
+        while True:
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                break
+            try:
+                opcode, dados = await asyncio.wait_for(_ler_quadro_websocket(leitor), restante)
+            except asyncio.TimeoutError:
+                break
+            if opcode != OPCODE_TEXTO:
+                continue
+            mensagem = json.loads(dados)
+            if mensagem["tipo"] == "snapshot":
+                estado_local = dict(mensagem["campos"])
+            else:
+                estado_local.update(mensagem["campos"])
+            versao = mensagem["versao"]
+            mensagens += 1
+    finally:
+        escritor.write(_quadro_websocket(b"", OPCODE_FECHAR, mascara=os.urandom(4)))
+        escritor.close()
+    return estado_local, mensagens, versao
+
+
+async def executar_clientes_teste(porta=PORTA_PAINEL_PADRAO, quantidade=1, duracao_s=3.0):
+    resultados = await asyncio.gather(*(cliente_teste(porta, duracao_s) for _ in range(quantidade)))
+    for i, (estado_local, mensagens, versao) in enumerate(resultados, start=1):
+        print(f"Cliente {i:02d}: {mensagens} mensagens, versão {versao}, {len(estado_local)} campos")
+    if resultados:
+        estado_local = resultados[0][0]
+        for campo in sorted(estado_local)[:12]:
+            print(f"  {campo:<40} = {estado_local[campo]}")
+    return resultados
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    try:
+        if argumentos and argumentos[0] == "cliente":
+            porta = int(argumentos[1]) if len(argumentos) > 1 else PORTA_PAINEL_PADRAO
+            quantidade = int(argumentos[2]) if len(argumentos) > 2 else 1
+            asyncio.run(executar_clientes_teste(porta, quantidade))
+        else:
+            escala = ESCALA_PADRAO
+            if "--escala" in argumentos:
+                indice = argumentos.index("--escala")
+                escala = float(argumentos[indice + 1])
+                del argumentos[indice:indice + 2]
+            porta = int(argumentos[0]) if argumentos else PORTA_PAINEL_PADRAO
+            asyncio.run(servir_painel(porta, escala))
+    except KeyboardInterrupt:
+        print("\n\nPainel ao vivo encerrado pelo usuário.")
+    except (OSError, ValueError) as e:
+        print(f"\nErro no painel ao vivo: {e}")
+        sys.exit(1)
@@ -1,14 +1,24 @@
 import time
 import sys
 import math
-import random
+import functools
 import datetime # Importado para uso no _adicionar_log
+from collections import deque, namedtuple
+
+import modulo_relogio_simulacao
+import modulo_metricas
+import modulo_aleatorio
+import modulo_eventos_voo
+from modulo_barramento_telemetria import TOPICO_EVENTOS_VOO, EventoVoo
 
 # --- Constantes da Simulação e da Nave ---
 DISTANCIA_INICIAL_MARTE_KM = 225_000_000
 VELOCIDADE_MAX_COMANDO_KMH = 80_000    # Limite normal
 VELOCIDADE_INICIAL_KMH = 15_000
 
+# Log de eventos: mantém só as entradas mais recentes (o voo pode durar milhões de passos)
+LIMITE_LOG_EVENTOS = 1000
+
 # Capacidade e Consumo (UAC)
 CAPACIDADE_TOTAL_UAC = 100_000.0       # Capacidade total de combustível (UAC)
 # Fator de custo para MUDAR velocidade (manobra) - Mantido baixo para permitir ajustes frequentes
@@ -39,6 +49,8 @@ FATOR_CONSUMO_HORARIO_ECO_UAC = 0.0001
 PROBABILIDADE_EVENTO_POR_PASSO = 0.07 # 7% de chance de evento por passo
 # (Aumentar para 0.10 ou mais para testes de eventos)
 
+ALEATORIO = modulo_aleatorio.fluxo("painel_comando") # Sorteios dos eventos de voo
+
 # --- Controle da Simulação de Tempo ---
 INTERVALO_REAL_S = 5 # Intervalo real entre simulações (em segundos)
 # (Aumentar para 10s ou mais para testes de eventos)
@@ -49,24 +61,45 @@ HORAS_SIMULADAS_POR_INTERVALO = 240 # 10 dias (240h) por intervalo de 5s
 LARGURA_GAUGE = 20
 # Largura do gauge de combustível e progresso (em caracteres)
 
+# --- Métricas (custo só com modulo_metricas.ATIVO) ---
+METRICA_PASSOS = modulo_metricas.contador(
+    "aurora_painel_passos_total", "Passos de voo simulados.")
+METRICA_HORAS_VOO = modulo_metricas.contador(
+    "aurora_painel_horas_simuladas_total", "Horas de voo simuladas.")
+METRICA_EVENTOS = modulo_metricas.contador(
+    "aurora_painel_eventos_total", "Eventos aleatórios ocorridos durante o voo.")
+METRICA_LATENCIA_PASSO = modulo_metricas.histograma(
+    "aurora_painel_passo_segundos", "Duração (tempo de parede) de um passo de voo.")
+METRICA_COMBUSTIVEL = modulo_metricas.medidor(
+    "aurora_painel_combustivel_uac", "Combustível restante (UAC).")
+METRICA_DISTANCIA = modulo_metricas.medidor(
+    "aurora_painel_distancia_marte_km", "Distância restante até Marte (km).")
+METRICA_VELOCIDADE = modulo_metricas.medidor(
+    "aurora_painel_velocidade_kmh", "Velocidade atual (km/h).")
+
 # --- Classe Principal ---
 class PainelComandosNave:
     """Gerencia o estado e as interações do painel de comandos da espaçonave."""
 
-    def __init__(self):
+    def __init__(self, relogio=None, exibir_logs=True, barramento=None):
         self.combustivel_uac = float(CAPACIDADE_TOTAL_UAC)
         self.distancia_marte_km = float(DISTANCIA_INICIAL_MARTE_KM)
         self.velocidade_atual_kmh = float(VELOCIDADE_INICIAL_KMH)
         self.em_viagem = True
-        self.log_eventos = []
+        self.log_eventos = deque(maxlen=LIMITE_LOG_EVENTOS) # Descarta as entradas mais antigas
         self.modo_eco_ativo = False
+        # Relógio de simulação usado na pausa entre passos (padrão: tempo real)
+        self.relogio = relogio or modulo_relogio_simulacao.RELOGIO_PADRAO
+        self.exibir_logs = exibir_logs # False para execução sem console (ex.: escalonador)
+        self.barramento = barramento # Se houver, os eventos de voo são publicados nele
 
     def _adicionar_log(self, mensagem):
         timestamp = datetime.datetime.now().strftime("%d/%m/%y %H:%M:%S") # Formato: dd/mm/aa HH:MM:SS
         # Adiciona o timestamp à mensagem e armazena no log
         log_completo = f"[{timestamp}] {mensagem}"
         self.log_eventos.append(log_completo)
-        print(f"LOG: {mensagem}") # Mostra apenas a mensagem no console para brevidade
+        if self.exibir_logs:
+            print(f"LOG: {mensagem}") # Mostra apenas a mensagem no console para brevidade
 
     def get_combustivel_percentual(self):
         return max(0.0, min(100.0, (self.combustivel_uac / CAPACIDADE_TOTAL_UAC) * 100.0)) # Retorna percentual de combustível
@@ -163,28 +196,74 @@ class PainelComandosNave:
             self._adicionar_log(f"Falha Manobra: Combustível insuficiente. Necessário: {custo_manobra:.2f} UAC.")
             return False # Manobra falhou por falta de combustível
 
+    def prever(self, velocidade_kmh, eco=None):
+        """Projeta ETA, combustível na chegada e risco de pane seca para uma
+           velocidade candidata, sem gastar combustível nem alterar o painel.
+           eco=None usa o modo atual. Retorna uma ProjecaoChegada.
+           Velocidade negativa ou NaN levanta ValueError."""
+        eco = self.modo_eco_ativo if eco is None else bool(eco)
+        return projetar_chegada(self.distancia_marte_km, self.combustivel_uac, self.velocidade_atual_kmh,
+                                float(velocidade_kmh), eco)
+
+    def _exibir_projecao(self, projecao):
+        print("\n" + "-" * 55)
+        print(f" PREVISÃO: {int(projecao.velocidade_kmh):,} km/h | Modo Econômico "
+              f"{'ATIVADO' if projecao.eco else 'DESATIVADO'}")
+        print(f" Custo da manobra           : {projecao.custo_manobra_uac:.2f} UAC")
+        if projecao.situacao == SITUACAO_MANOBRA_IMPOSSIVEL:
+            print(" !!! Manobra impossível: combustível insuficiente !!!")
+        elif projecao.situacao == SITUACAO_CHEGA:
+            dias, horas = int(projecao.eta_horas // 24), int(projecao.eta_horas % 24)
+            print(f" ETA (Estimativa)           : {dias} dias, {horas} horas")
+            print(f" Combustível na chegada     : {projecao.combustivel_chegada_pct:.2f}% "
+                  f"({int(projecao.combustivel_chegada_uac):,} UAC)")
+            print(f" Risco de pane seca         : {projecao.risco_pane * 100.0:.1f}% (por eventos aleatórios)")
+        elif projecao.situacao == SITUACAO_PARADA:
+            print(" A nave não chega a Marte parada (risco de não chegar: 100%).")
+        else:
+            dias = int(projecao.horas_ate_pane // 24)
+            print(f" !!! Pane seca em ~{dias} dias, antes da chegada !!!")
+        print("-" * 55)
+
+    # --- Efeitos dos Eventos (ligados ao catálogo pela tabela EFEITOS_EVENTO) ---
+    # Cada tratador aplica um efeito e retorna o valor usado na mensagem do evento.
+
+    def _efeito_combustivel(self, parametros):
+        perda_comb = ALEATORIO.uniform(*parametros["perda_uac"])
+        comb_anterior = self.combustivel_uac
+        self.combustivel_uac = max(0.0, self.combustivel_uac - perda_comb)
+        return comb_anterior - self.combustivel_uac # Perda real
+
+    def _efeito_velocidade(self, parametros):
+        limite_atual = VELOCIDADE_MAX_ECO_KMH if self.modo_eco_ativo else VELOCIDADE_MAX_COMANDO_KMH
+        velocidade_anterior = self.velocidade_atual_kmh
+        variacao = ALEATORIO.uniform(*parametros["variacao_kmh"])
+        self.velocidade_atual_kmh = max(0.0, min(float(limite_atual), velocidade_anterior + variacao))
+        return self.velocidade_atual_kmh - velocidade_anterior # Variação real
+
+    def _efeito_distancia(self, parametros):
+        distancia_anterior = self.distancia_marte_km
+        self.distancia_marte_km = max(0.0, distancia_anterior + ALEATORIO.uniform(*parametros["variacao_km"]))
+        return self.distancia_marte_km - distancia_anterior
+
+    def _efeito_subsistema(self, parametros):
+        return ALEATORIO.choice(parametros["sistemas"]) # Sistema afetado (nome)
+
     def _processar_eventos_aleatorios(self):
         """Verifica e processa eventos aleatórios. Retorna a msg do evento ou None."""
         evento_msg = None
         # Verifica se deve tentar um evento (só se estiver em viagem)
-        if self.em_viagem and random.random() < PROBABILIDADE_EVENTO_POR_PASSO:
-            tipo_evento = random.choice(['micrometeorito', 'falha_menor', 'tempestade_solar'])
-
-            if tipo_evento == 'micrometeorito':
-                perda_comb = random.uniform(50, 250)
-                comb_anterior = self.combustivel_uac
-                self.combustivel_uac = max(0.0, self.combustivel_uac - perda_comb)
-                perda_real = comb_anterior - self.combustivel_uac
-                evento_msg = f"EVENTO: Impacto de micrometeorito! Perda de {perda_real:.2f} UAC."
-            elif tipo_evento == 'falha_menor':
-                 sistemas_exemplo = ["Sensor Navegação", "Bomba Refrigerante", "Regulador Tensão", "Antena Baixo Ganho", "Filtro CO2", "Interface Diagnóstico"]
-                 sistema_afetado = random.choice(sistemas_exemplo)
-                 evento_msg = f"EVENTO: Anomalia menor: {sistema_afetado}. Recomenda-se diagnóstico."
-            elif tipo_evento == 'tempestade_solar':
-                 evento_msg = "EVENTO: Tempestade solar! Monitore comunicações e radiação."
-
-            if evento_msg:
-                self._adicionar_log(evento_msg) # Loga o evento ocorrido
+        if self.em_viagem and ALEATORIO.random() < PROBABILIDADE_EVENTO_POR_PASSO:
+            evento = CATALOGO_EVENTOS.sortear(ALEATORIO.random()) # O(1), qualquer tamanho de catálogo
+            resultados = {nome: tratador(self, parametros) for nome, tratador, parametros in evento.efeitos}
+            evento_msg = evento.mensagem.format_map(resultados)
+            sistema_afetado = resultados.pop(EFEITO_SUBSISTEMA, None)
+            valor_evento = next(iter(resultados.values()), None) # Grandeza do primeiro efeito numérico
+
+            self._adicionar_log(evento_msg) # Loga o evento ocorrido
+            if self.barramento is not None: # Permite reações direcionadas (ex.: diagnóstico do casco)
+                self.barramento.publicar(TOPICO_EVENTOS_VOO, EventoVoo(
+                    evento.id, evento_msg, sistema_afetado, valor_evento, self.relogio.agora()))
 
         return evento_msg # Retorna a mensagem para quem chamou decidir se pausa
 
@@ -192,6 +271,7 @@ class PainelComandosNave:
         """Simula voo, consumo, distância e eventos. Retorna msg de evento, se houver."""
         if not self.em_viagem: return None
         if self.combustivel_uac <= 0 and self.velocidade_atual_kmh <= 0: return None # Já parado sem combustível
+        inicio = time.perf_counter() if modulo_metricas.ATIVO else 0.0
 
         # Verifica se acabou o combustível ANTES de calcular consumo/distância
         if self.combustivel_uac <= 0:
@@ -200,19 +280,8 @@ class PainelComandosNave:
                 self.velocidade_atual_kmh = 0
             return None # Não consome nem se move mais
 
-        # 1. Consumo Operacional
-        consumo_neste_passo = 0
-        fator_consumo_usado = 0
-        if self.modo_eco_ativo:
-            # Lógica de consumo ECO (usar a alternativa configurada - Fixa ou Proporcional)
-            # ... (cálculo usando constantes _ECO_) ...
-            if CONSUMO_FIXO_POR_HORA_ECO_UAC is not None: consumo_neste_passo = CONSUMO_FIXO_POR_HORA_ECO_UAC * horas_a_simular
-            elif FATOR_CONSUMO_HORARIO_ECO_UAC is not None: consumo_neste_passo = self.velocidade_atual_kmh * FATOR_CONSUMO_HORARIO_ECO_UAC * horas_a_simular
-        else:
-            # Lógica de consumo Normal (usar a alternativa configurada - Fixa ou Proporcional)
-            # ... (cálculo usando constantes normais) ...
-             if CONSUMO_FIXO_POR_HORA_UAC is not None: consumo_neste_passo = CONSUMO_FIXO_POR_HORA_UAC * horas_a_simular
-             elif FATOR_CONSUMO_HORARIO_UAC is not None: consumo_neste_passo = self.velocidade_atual_kmh * FATOR_CONSUMO_HORARIO_UAC * horas_a_simular
+        # 1. Consumo Operacional (modelo normal ou ECO, fixo ou proporcional: ver _consumo_por_hora)
+        consumo_neste_passo = _consumo_por_hora(self.velocidade_atual_kmh, self.modo_eco_ativo) * horas_a_simular
 
         combustivel_anterior = self.combustivel_uac
         self.combustivel_uac = max(0.0, self.combustivel_uac - consumo_neste_passo) # Garante que combustível não fique negativo
@@ -238,6 +307,16 @@ class PainelComandosNave:
             self.velocidade_atual_kmh = 0
             self.em_viagem = False # Finaliza a viagem
 
+        if modulo_metricas.ATIVO:
+            METRICA_PASSOS.inc()
+            METRICA_HORAS_VOO.inc(horas_a_simular)
+            if mensagem_evento:
+                METRICA_EVENTOS.inc()
+            METRICA_COMBUSTIVEL.definir(self.combustivel_uac)
+            METRICA_DISTANCIA.definir(self.distancia_marte_km)
+            METRICA_VELOCIDADE.definir(self.velocidade_atual_kmh)
+            METRICA_LATENCIA_PASSO.observar(time.perf_counter() - inicio)
+
         # Retorna a mensagem do evento para o loop principal decidir sobre a pausa
         return mensagem_evento # Retorna o evento que ocorreu neste passo
 
@@ -264,7 +343,7 @@ class PainelComandosNave:
 
                 # --- Processamento de Entrada e Simulação ---
                 print(f"\nPróxima atualização em {INTERVALO_REAL_S}s. Simulando {HORAS_SIMULADAS_POR_INTERVALO}h.")
-                prompt = f"Comandos: [Velocidade], 'impulso N', 'eco on/off', 'sair': "
+                prompt = f"Comandos: [Velocidade], 'prever V [eco on/off]', 'impulso N', 'eco on/off', 'sair': "
                 entrada = input(prompt).strip().lower()
 
                 executou_impulso = False
@@ -288,6 +367,25 @@ class PainelComandosNave:
                     else: self._adicionar_log("Modo Econômico já desativado.")
                     if self.em_viagem: mensagem_evento_passo = self.simular_passagem_tempo(HORAS_SIMULADAS_POR_INTERVALO)
                 
+                # --- Processamento de Comando: Prever (não gasta combustível nem tempo) ---
+                elif entrada.startswith('prever '):
+                    partes = entrada.split()
+                    eco_candidato = {"on": True, "off": False}.get(partes[-1]) if len(partes) == 4 and partes[2] == 'eco' else None
+                    if len(partes) == 2 or eco_candidato is not None:
+                        try:
+                            velocidade_prevista = float(partes[1])
+                        except ValueError:
+                            velocidade_prevista = math.nan
+                        if math.isnan(velocidade_prevista):
+                            self._adicionar_log(f"Erro: Velocidade inválida em 'prever V'.")
+                        elif velocidade_prevista < 0: # Mesma regra do comando de velocidade
+                            self._adicionar_log("Erro: Velocidade não pode ser negativa.")
+                        else:
+                            self._exibir_projecao(self.prever(velocidade_prevista, eco_candidato))
+                            input("    Pressione Enter para continuar...")
+                    else: self._adicionar_log("Erro: Comando 'prever V [eco on/off]' inválido.")
+                    continue # Sem passo de simulação nem espera
+
                 # --- Processamento de Comando: Impulso ---
                 elif entrada.startswith('impulso '):
                     # ... (parsing de N) ...
@@ -342,7 +440,7 @@ class PainelComandosNave:
                 # --- Pausa Temporizada Normal ---
                 # Pausa real só se ainda em viagem, não executou impulso e não pausou por evento
                 if self.em_viagem and not executou_impulso and not houve_pausa_evento:
-                    time.sleep(INTERVALO_REAL_S)
+                    self.relogio.dormir(INTERVALO_REAL_S)
 
     # --- Fim do Loop Principal ---
 
@@ -355,6 +453,202 @@ class PainelComandosNave:
             print("=" * 55)
 
 
+# --- Catálogo de Eventos de Voo ---
+# Nome do efeito no arquivo -> tratador. O catálogo liga cada efeito ao seu
+# tratador na carga; durante o voo não há desvio por nome de evento.
+EFEITO_SUBSISTEMA = "subsistema"
+EFEITOS_EVENTO = {
+    "combustivel": PainelComandosNave._efeito_combustivel,
+    "velocidade": PainelComandosNave._efeito_velocidade,
+    "distancia": PainelComandosNave._efeito_distancia,
+    EFEITO_SUBSISTEMA: PainelComandosNave._efeito_subsistema,
+}
+CATALOGO_EVENTOS = modulo_eventos_voo.carregar_catalogo(EFEITOS_EVENTO)
+
+
+# --- Modelo de Consumo e Projeção de Chegada ("prever V") ---
+
+def _consumo_por_hora(velocidade_kmh, eco):
+    """Consumo operacional (UAC/h) na velocidade dada, no modo normal ou ECO."""
+    if eco:
+        if CONSUMO_FIXO_POR_HORA_ECO_UAC is not None: return CONSUMO_FIXO_POR_HORA_ECO_UAC
+        if FATOR_CONSUMO_HORARIO_ECO_UAC is not None: return velocidade_kmh * FATOR_CONSUMO_HORARIO_ECO_UAC
+    else:
+        if CONSUMO_FIXO_POR_HORA_UAC is not None: return CONSUMO_FIXO_POR_HORA_UAC
+        if FATOR_CONSUMO_HORARIO_UAC is not None: return velocidade_kmh * FATOR_CONSUMO_HORARIO_UAC
+    return 0.0
+
+
+PASSO_GRADE_PROJECAO_KMH = 10 # Resolução da grade de consumo usada pelas projeções
+
+# Situação projetada: chega, não chega por estar parada, não tem combustível para a
+# manobra, ou tem pane seca antes da chegada
+SITUACAO_CHEGA = "chega"
+SITUACAO_PARADA = "parada"
+SITUACAO_MANOBRA_IMPOSSIVEL = "manobra_impossivel"
+SITUACAO_PANE_SECA = "pane_seca"
+
+# Resultado de uma projeção. eta_horas e combustivel_chegada_* são None se a nave não
+# chega (ver 'situacao'). horas_ate_pane são as horas até esgotar o combustível (None se
+# ele basta ou não é consumido). risco_pane é a probabilidade de NÃO chegar: nas
+# situações em que a nave não chega de qualquer forma (inclusive parada), vale 1.0.
+ProjecaoChegada = namedtuple("ProjecaoChegada", [
+    "velocidade_kmh", "eco", "manobra_possivel", "custo_manobra_uac", "chega", "eta_horas",
+    "combustivel_chegada_uac", "combustivel_chegada_pct", "horas_ate_pane", "risco_pane", "situacao"])
+
+
+@functools.lru_cache(maxsize=2)
+def _grade_consumo(eco):
+    """Consumo (UAC/h) pré-calculado de 0 até a velocidade máxima do modo, a
+       cada PASSO_GRADE_PROJECAO_KMH. Os dois modelos do painel são lineares na
+       velocidade, então a interpolação na grade reproduz o valor exato."""
+    limite = VELOCIDADE_MAX_ECO_KMH if eco else VELOCIDADE_MAX_COMANDO_KMH
+    pontos = int(math.ceil(limite / PASSO_GRADE_PROJECAO_KMH)) + 1
+    return tuple(_consumo_por_hora(i * PASSO_GRADE_PROJECAO_KMH, eco) for i in range(pontos))
+
+
+def _consumo_na_grade(velocidade_kmh, eco):
+    grade = _grade_consumo(eco)
+    posicao = velocidade_kmh / PASSO_GRADE_PROJECAO_KMH
+    i = min(int(posicao), len(grade) - 2)
+    return grade[i] + (grade[i + 1] - grade[i]) * (posicao - i)
+
+
+@functools.lru_cache(maxsize=1)
+def _perda_eventos_por_passo():
+    """Média e variância da perda de combustível por passo de voo causada por
+       eventos aleatórios, a partir dos pesos e faixas do catálogo."""
+    peso_total = sum(evento.peso for evento in CATALOGO_EVENTOS)
+    momento_1 = momento_2 = 0.0 # E[X] e E[X²] da perda, dado que ocorreu um evento
+    for evento in CATALOGO_EVENTOS:
+        for nome, _, parametros in evento.efeitos:
+            if nome == "combustivel":
+                a, b = parametros["perda_uac"]
+                momento_1 += evento.peso / peso_total * (a + b) / 2.0
+                momento_2 += evento.peso / peso_total * (a * a + a * b + b * b) / 3.0
+    p = PROBABILIDADE_EVENTO_POR_PASSO
+    return p * momento_1, p * momento_2 - (p * momento_1) ** 2
+
+
+@functools.lru_cache(maxsize=4096)
+def projetar_chegada(distancia_km, combustivel_uac, velocidade_atual_kmh, velocidade_kmh, eco,
+                     horas_por_passo=HORAS_SIMULADAS_POR_INTERVALO):
+    """
+    Projeta a chegada mantendo 'velocidade_kmh' (limitada como no comando de
+    velocidade) no modo 'eco', sem alterar nenhum painel. Usa a grade de
+    consumo pré-calculada e fica em cache por parâmetros: consultas repetidas
+    durante o planejamento são gratuitas. Como simular_passagem_tempo, o
+    consumo é contado em passos inteiros de 'horas_por_passo' (inclusive o
+    passo da chegada): a nave chega se ainda tem combustível ao começar o
+    último passo. risco_pane é a probabilidade (aproximação normal) de as
+    perdas por eventos nos passos anteriores esgotarem essa reserva.
+    Velocidade negativa ou NaN levanta ValueError, como no comando de velocidade.
+    """
+    velocidade = float(velocidade_kmh)
+    if math.isnan(velocidade):
+        raise ValueError("Velocidade inválida.")
+    if velocidade < 0:
+        raise ValueError("Velocidade não pode ser negativa.")
+    limite = VELOCIDADE_MAX_ECO_KMH if eco else VELOCIDADE_MAX_COMANDO_KMH
+    velocidade = min(velocidade, float(limite))
+    custo_manobra = abs(velocidade - velocidade_atual_kmh) * FATOR_CUSTO_MANOBRA_UAC
+    manobra_possivel = custo_manobra <= combustivel_uac
+    combustivel = combustivel_uac - custo_manobra if manobra_possivel else combustivel_uac
+    consumo_hora = _consumo_na_grade(velocidade, eco)
+
+    if distancia_km <= 0: # Já chegou
+        return ProjecaoChegada(velocidade, eco, manobra_possivel, custo_manobra, True, 0.0, combustivel,
+                               combustivel / CAPACIDADE_TOTAL_UAC * 100.0, None, 0.0, SITUACAO_CHEGA)
+    consumo_passo = consumo_hora * horas_por_passo
+    # Horas até a pane em passos inteiros: o passo em que o combustível zera é consumido inteiro
+    horas_combustivel = math.ceil(combustivel / consumo_passo) * horas_por_passo if consumo_passo > 0 else None
+    if not manobra_possivel: # Sem combustível para a manobra
+        return ProjecaoChegada(velocidade, eco, False, custo_manobra, False, None, None, None,
+                               horas_combustivel, 1.0, SITUACAO_MANOBRA_IMPOSSIVEL)
+    if velocidade <= 0: # Parada: nunca chega, o que conta como risco 1.0
+        return ProjecaoChegada(velocidade, eco, True, custo_manobra, False, None, None, None,
+                               horas_combustivel, 1.0, SITUACAO_PARADA)
+
+    eta_horas = distancia_km / velocidade
+    passos = math.ceil(eta_horas / horas_por_passo)
+    reserva_ultimo_passo = combustivel - (passos - 1) * consumo_passo # Combustível ao começar o último passo
+    if reserva_ultimo_passo <= 0 and consumo_passo > 0: # Pane seca antes da chegada, mesmo sem eventos
+        return ProjecaoChegada(velocidade, eco, True, custo_manobra, False, None, None, None, horas_combustivel, 1.0,
+                               SITUACAO_PANE_SECA)
+    combustivel_chegada = max(0.0, combustivel - passos * consumo_passo)
+
+    media_passo, variancia_passo = _perda_eventos_por_passo()
+    passos_com_risco = passos - 1 # Perdas no passo da chegada não impedem a chegada
+    media, desvio = passos_com_risco * media_passo, math.sqrt(passos_com_risco * variancia_passo)
+    if desvio > 0:
+        risco = 0.5 * math.erfc((reserva_ultimo_passo - media) / (desvio * math.sqrt(2.0))) # P(perdas > reserva)
+    else:
+        risco = 1.0 if media >= reserva_ultimo_passo else 0.0
+    return ProjecaoChegada(velocidade, eco, True, custo_manobra, True, passos * horas_por_passo, combustivel_chegada,
+                           combustivel_chegada / CAPACIDADE_TOTAL_UAC * 100.0, None, risco, SITUACAO_CHEGA)
+
+
+def comparar_projecao_com_voo(velocidade_kmh, eco=False):
+    """
+    Confere a projeção com um voo real em passos, sem eventos aleatórios: um
+    painel novo manobra para 'velocidade_kmh' e voa até chegar ou parar.
+    Retorna (projecao, painel_ao_final) para comparar combustível e chegada.
+    """
+    global PROBABILIDADE_EVENTO_POR_PASSO
+    painel = PainelComandosNave(relogio=modulo_relogio_simulacao.RelogioSimulacao(modulo_relogio_simulacao.MODO_RAPIDO),
+                                exibir_logs=False)
+    painel.modo_eco_ativo = bool(eco)
+    projecao = painel.prever(velocidade_kmh)
+    probabilidade_original = PROBABILIDADE_EVENTO_POR_PASSO
+    PROBABILIDADE_EVENTO_POR_PASSO = 0.0
+    try:
+        painel.tentar_definir_velocidade(str(velocidade_kmh))
+        while painel.em_viagem and (painel.combustivel_uac > 0 or painel.velocidade_atual_kmh > 0):
+            painel.simular_passagem_tempo(HORAS_SIMULADAS_POR_INTERVALO)
+    finally:
+        PROBABILIDADE_EVENTO_POR_PASSO = probabilidade_original
+    return projecao, painel
+
+
+VELOCIDADES_CONFERENCIA_KMH = (20_000, 50_000, 80_000)
+
+
+def conferir_projecoes(velocidades=VELOCIDADES_CONFERENCIA_KMH, eco=False, tolerancia_uac=1e-6):
+    """Lista de (velocidade, combustível projetado, combustível real, confere) de
+       comparar_projecao_com_voo para cada velocidade."""
+    resultados = []
+    for velocidade in velocidades:
+        projecao, painel = comparar_projecao_com_voo(velocidade, eco)
+        chegou = not painel.em_viagem and painel.distancia_marte_km <= 0
+        projetado = projecao.combustivel_chegada_uac if projecao.chega else None
+        real = painel.combustivel_uac if chegou else None
+        confere = projecao.chega == chegou and (
+            not chegou or abs(projetado - real) <= tolerancia_uac)
+        resultados.append((velocidade, projetado, real, confere))
+    return resultados
+
+
+# --- Voo Orientado a Eventos ---
+
+def agendar_voo(escalonador, painel, intervalo_s=3600.0, ao_evento=None):
+    """
+    Agenda passos de voo periódicos no escalonador de eventos compartilhado.
+    Cada passo simula exatamente 'intervalo_s' de missão (em horas de voo),
+    mantendo o painel consistente com o tempo dos demais subsistemas.
+    ao_evento(mensagem, instante_s) recebe os eventos aleatórios. Os passos
+    param quando a viagem termina. Retorna o evento periódico.
+    """
+    horas_por_passo = intervalo_s / 3600.0
+
+    def _passo():
+        mensagem = painel.simular_passagem_tempo(horas_por_passo)
+        if mensagem and ao_evento is not None:
+            ao_evento(mensagem, escalonador.relogio.agora())
+        return painel.em_viagem # False encerra a repetição
+
+    return escalonador.agendar_periodico(intervalo_s, _passo)
+
+
 # --- Bloco de Execução Principal (para teste autônomo) ---
 if __name__ == "__main__":
      print("--- Testando Módulo Painel de Comandos Independentemente ---")
@@ -365,5 +659,13 @@ if __name__ == "__main__":
      CONSUMO_FIXO_POR_HORA_ECO_UAC = 2.0
      print(f"INFO: Testando com consumo FIXO (Normal={CONSUMO_FIXO_POR_HORA_UAC} UAC/h, Eco={CONSUMO_FIXO_POR_HORA_ECO_UAC} UAC/h)")
 
+     # Conferência da projeção 'prever V' contra um voo em passos, sem eventos
+     formatar = lambda uac: "não chega" if uac is None else f"{uac:,.2f} UAC"
+     for modo_eco in (False, True):
+         velocidades_teste = (5_000, 10_000) if modo_eco else VELOCIDADES_CONFERENCIA_KMH
+         for vel, projetado, real, confere in conferir_projecoes(velocidades_teste, modo_eco):
+             print(f"  prever {vel:>6,} km/h eco {'on ' if modo_eco else 'off'}: projetado {formatar(projetado):>14} | "
+                   f"voo {formatar(real):>14} [{'OK' if confere else 'DIVERGE'}]")
+
      painel_teste = PainelComandosNave()
      painel_teste.iniciar_interface()
\ No newline at end of file
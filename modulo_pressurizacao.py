@@ -1,18 +1,246 @@
-import time
 import sys # Usado para forçar a atualização da saída no terminal (efeito visual)
+import math
+import functools
+from collections import namedtuple
+
+import modulo_relogio_simulacao
+import modulo_aleatorio
+from modulo_barramento_telemetria import TOPICO_LEITURAS_AMBIENTE
+
+try: # NumPy é opcional: apenas acelera o cálculo vetorizado dos perfis
+    import numpy as np
+except ImportError:
+    np = None
+
+ALEATORIO = modulo_aleatorio.fluxo("pressurizacao") # Ruído dos sensores de pressão
 
 # --- Constantes de Status ---
 STATUS_OK = "OPERACIONAL"
 STATUS_WARN = "ALERTA"
 STATUS_CRIT = "CRÍTICO"
 
+# --- Modelo Físico da Câmara de Ar ---
+# Despressurização: a bomba remove gás a uma vazão volumétrica S (m³/s) de uma
+# câmara de volume V (m³), enquanto um vazamento injeta gás a uma taxa q (psi/s):
+#     dP/dt = -(S/V)·P + q   =>   P(t) = P_eq + (P0 - P_eq)·exp(-t/τ),
+#     com τ = V/S e pressão de equilíbrio P_eq = q·τ.
+# Manutenção: câmara isolada da bomba; a pressão sobe linearmente com o vazamento.
+# Repressurização: válvula de equalização com o habitat, vazão de enchimento S_r:
+#     P(t) = P_int - (P_int - P_ini)·exp(-t/τ_r),  com τ_r = V/S_r.
+ModeloCamaraAr = namedtuple("ModeloCamaraAr", [
+    "volume_m3",                  # Volume interno da câmara
+    "vazao_bomba_m3_s",           # Vazão volumétrica da bomba de vácuo
+    "vazao_repressurizacao_m3_s", # Vazão da válvula de repressurização
+    "taxa_vazamento_psi_s",       # Entrada de gás por vazamento (câmara isolada)
+    "tolerancia_psi",             # Quão perto do alvo a fase é considerada concluída
+], defaults=(4.0, 0.1, 0.2, 0.0005, 0.05))
+
+# Perfil completo pressão x tempo de um ciclo. 'inicio_fases' guarda o índice da
+# primeira amostra de cada fase e 'fim_fases_s' o instante em que cada fase termina.
+PerfilPressao = namedtuple("PerfilPressao", ["tempos_s", "pressoes_psi", "inicio_fases", "fim_fases_s"])
+
+PASSO_AMOSTRA_PADRAO_S = 0.5 # Resolução temporal do perfil pré-calculado
+
+# --- Estimativa Contínua de Vazamento e Eficiência da Bomba ---
+# As amostras de pressão de cada fase alimentam regressões lineares em fluxo
+# (memória O(1), sem guardar o traço inteiro):
+# - Fase 1: eficiência da bomba. No modo exponencial, ajusta ln(P - P_ext) x t,
+#   cuja inclinação é -1/τ; no modo linear, a própria taxa de queda em psi/s.
+# - Fase 2: taxa de vazamento = inclinação de P x t com a câmara isolada.
+# - Fase 3: eficiência da repressurização, pelo mesmo método da fase 1.
+# Um ciclo é marcado como anormal assim que uma estimativa sai da faixa.
+FASE_DESPRESSURIZACAO = 1
+FASE_MANUTENCAO = 2
+FASE_REPRESSURIZACAO = 3
+
+LIMITE_VAZAMENTO_PADRAO_PSI_S = 0.002 # Acima disso o vazamento é considerado anormal
+EFICIENCIA_MINIMA_PADRAO = 0.8        # Fração mínima da vazão nominal
+AMOSTRAS_MINIMAS_ESTIMATIVA = 5       # Antes disso a estimativa não é avaliada
+CONFIANCA_ALERTA_SIGMAS = 3.0         # A faixa só é violada se a estimativa sair dela por 3 erros padrão
+
+
+class EstimadorRegressaoLinear:
+    """Mínimos quadrados em fluxo (y = a + b·x) com memória constante.
+    'fator_esquecimento' < 1 dá mais peso às amostras recentes."""
+
+    __slots__ = ("fator_esquecimento", "n", "peso", "media_x", "media_y", "sxx", "sxy", "syy")
+
+    def __init__(self, fator_esquecimento=1.0):
+        self.fator_esquecimento = fator_esquecimento
+        self.n = 0
+        self.peso = 0.0
+        self.media_x = 0.0
+        self.media_y = 0.0
+        self.sxx = 0.0
+        self.sxy = 0.0
+        self.syy = 0.0
+
+    def adicionar(self, x, y):
+        if self.fator_esquecimento < 1.0:
+            self.peso *= self.fator_esquecimento
+            self.sxx *= self.fator_esquecimento
+            self.sxy *= self.fator_esquecimento
+            self.syy *= self.fator_esquecimento
+        self.n += 1
+        self.peso += 1.0
+        dx = x - self.media_x
+        dy = y - self.media_y
+        self.media_x += dx / self.peso
+        self.media_y += dy / self.peso
+        self.sxx += dx * (x - self.media_x)
+        self.sxy += dx * (y - self.media_y)
+        self.syy += dy * (y - self.media_y)
+
+    @property
+    def inclinacao(self):
+        return self.sxy / self.sxx if self.sxx > 0 else None
+
+    @property
+    def erro_padrao_inclinacao(self):
+        """Erro padrão da inclinação (None com menos de 3 amostras)."""
+        if self.n < 3 or self.sxx <= 0:
+            return None
+        residuo = max(0.0, self.syy - self.sxy * self.sxy / self.sxx)
+        return math.sqrt(residuo / (self.peso - 2.0) / self.sxx) if self.peso > 2.0 else None
+
+    @property
+    def intercepto(self):
+        inclinacao = self.inclinacao
+        return None if inclinacao is None else self.media_y - inclinacao * self.media_x
+
+
+class MonitorCicloCamara:
+    """
+    Acompanha um ciclo amostra a amostra e mantém as estimativas correntes de
+    vazamento (psi/s) e de eficiência da bomba e da repressurização (fração do
+    nominal). registrar() devolve os alertas novos gerados por aquela amostra.
+    """
+
+    def __init__(self, pressao_interna_psi=15.0, pressao_externa_psi=0.0,
+                 tau_bomba_nominal_s=None, tau_repressurizacao_nominal_s=None,
+                 taxa_despressurizacao_nominal_psi_s=None, taxa_repressurizacao_nominal_psi_s=None,
+                 limite_vazamento_psi_s=LIMITE_VAZAMENTO_PADRAO_PSI_S,
+                 eficiencia_minima=EFICIENCIA_MINIMA_PADRAO,
+                 piso_log_psi=0.5, amostras_minimas=AMOSTRAS_MINIMAS_ESTIMATIVA,
+                 confianca_sigmas=CONFIANCA_ALERTA_SIGMAS):
+        # Informe τ (modo exponencial, modelo físico) OU a taxa em psi/s (modo linear)
+        self.pressao_interna_psi = pressao_interna_psi
+        self.pressao_externa_psi = pressao_externa_psi
+        self.nominais = {
+            FASE_DESPRESSURIZACAO: (tau_bomba_nominal_s, taxa_despressurizacao_nominal_psi_s),
+            FASE_REPRESSURIZACAO: (tau_repressurizacao_nominal_s, taxa_repressurizacao_nominal_psi_s),
+        }
+        self.limite_vazamento_psi_s = limite_vazamento_psi_s
+        self.eficiencia_minima = eficiencia_minima
+        self.piso_log_psi = piso_log_psi # Perto do alvo o ruído domina o logaritmo
+        self.amostras_minimas = amostras_minimas
+        self.confianca_sigmas = confianca_sigmas
+        self.regressoes = {fase: EstimadorRegressaoLinear() for fase in
+                           (FASE_DESPRESSURIZACAO, FASE_MANUTENCAO, FASE_REPRESSURIZACAO)}
+        self.alertas = []
+        self._alertados = set()
+
+    @classmethod
+    def para_modelo(cls, modelo, pressao_interna_psi=15.0, pressao_externa_psi=0.0, **opcoes):
+        """Monitor com valores nominais do modelo físico (ModeloCamaraAr)."""
+        return cls(pressao_interna_psi, pressao_externa_psi,
+                   tau_bomba_nominal_s=modelo.volume_m3 / modelo.vazao_bomba_m3_s,
+                   tau_repressurizacao_nominal_s=modelo.volume_m3 / modelo.vazao_repressurizacao_m3_s,
+                   **opcoes)
+
+    def registrar(self, fase, t_s, pressao_psi):
+        """Adiciona uma amostra (instante em s, pressão em psi) da fase indicada."""
+        regressao = self.regressoes[fase]
+        if fase == FASE_MANUTENCAO:
+            regressao.adicionar(t_s, pressao_psi)
+        else:
+            tau_nominal, _ = self.nominais[fase]
+            if tau_nominal is None: # Modo linear: a inclinação já é a taxa em psi/s
+                regressao.adicionar(t_s, pressao_psi)
+            else:
+                distancia = (pressao_psi - self.pressao_externa_psi if fase == FASE_DESPRESSURIZACAO
+                             else self.pressao_interna_psi - pressao_psi)
+                if distancia <= self.piso_log_psi:
+                    return []
+                regressao.adicionar(t_s, math.log(distancia))
+        return self._avaliar(fase)
+
+    def taxa_vazamento_psi_s(self):
+        regressao = self.regressoes[FASE_MANUTENCAO]
+        return regressao.inclinacao if regressao.n >= self.amostras_minimas else None
+
+    def _fator_eficiencia(self, fase):
+        """Converte a inclinação da regressão da fase em fração do nominal."""
+        tau_nominal, taxa_nominal = self.nominais[fase]
+        if tau_nominal is not None:
+            return -tau_nominal # (1/τ medido) / (1/τ nominal)
+        return 1.0 / taxa_nominal if taxa_nominal else None
+
+    def eficiencia(self, fase):
+        regressao = self.regressoes[fase]
+        inclinacao = regressao.inclinacao
+        fator = self._fator_eficiencia(fase)
+        if regressao.n < self.amostras_minimas or inclinacao is None or fator is None:
+            return None
+        return inclinacao * fator if fator < 0 else abs(inclinacao) * fator
+
+    def _margem(self, fase, fator=1.0):
+        """Incerteza da estimativa (em sigmas) na unidade da grandeza estimada."""
+        erro = self.regressoes[fase].erro_padrao_inclinacao
+        return self.confianca_sigmas * erro * abs(fator) if erro is not None else float("inf")
+
+    def _avaliar(self, fase):
+        novos = []
+        if fase == FASE_MANUTENCAO:
+            vazamento = self.taxa_vazamento_psi_s()
+            if vazamento is not None and vazamento - self._margem(fase) > self.limite_vazamento_psi_s:
+                novos.append(("vazamento", f"Vazamento anormal: {vazamento:.5f} psi/s "
+                                           f"(limite {self.limite_vazamento_psi_s:.5f} psi/s)."))
+        else:
+            eficiencia = self.eficiencia(fase)
+            if eficiencia is not None and \
+                    eficiencia + self._margem(fase, self._fator_eficiencia(fase)) < self.eficiencia_minima:
+                nome = "bomba" if fase == FASE_DESPRESSURIZACAO else "repressurizacao"
+                novos.append((nome, f"Eficiência da {'bomba' if nome == 'bomba' else 'repressurização'} baixa: "
+                                    f"{eficiencia:.0%} do nominal (mínimo {self.eficiencia_minima:.0%})."))
+        # Cada tipo de alerta dispara uma única vez por ciclo
+        mensagens = []
+        for chave, mensagem in novos:
+            if chave not in self._alertados:
+                self._alertados.add(chave)
+                mensagens.append(mensagem)
+        self.alertas.extend(mensagens)
+        return mensagens
+
+    @property
+    def ciclo_anormal(self):
+        return bool(self.alertas)
+
+
+def _ler_sensor_pressao(pressao_real_psi, ruido_psi):
+    """Leitura do transdutor de pressão da câmara, com ruído gaussiano."""
+    if ruido_psi <= 0:
+        return pressao_real_psi
+    return max(0.0, ALEATORIO.gauss(pressao_real_psi, ruido_psi))
+
+
+def _reportar_alertas(alertas):
+    for alerta in alertas:
+        print(f"\n! ALERTA DA CÂMARA DE AR: {alerta}")
+
 
 def simular_ciclo_pressurizacao(
     pressao_interna_psi=15.0,
     pressao_externa_psi=0.0,
     tempo_espera_zero_s=10.0, # Tempo em segundos para permanecer em 0 psi
     passo_psi=1.0,            # Quanto a pressão muda a cada passo
-    intervalo_passo_s=0.5     # Tempo em segundos entre cada passo da simulação
+    intervalo_passo_s=0.5,    # Tempo em segundos entre cada passo da simulação
+    modelo=None,              # ModeloCamaraAr: usa o modelo físico em vez dos passos lineares
+    escala_tempo=1.0,         # Só com 'modelo': 1.0 = tempo real, 0 = sem espera
+    taxa_vazamento_psi_s=0.0, # Entrada de gás durante a manutenção (câmara isolada)
+    ruido_sensor_psi=0.0,     # Desvio padrão do ruído do transdutor de pressão
+    monitor=None,             # MonitorCicloCamara (criado automaticamente se None)
+    relogio=None              # RelogioSimulacao compartilhado (padrão: tempo real)
 ):
     """
     Simula o ciclo completo de despressurização e repressurização
@@ -24,10 +252,36 @@ def simular_ciclo_pressurizacao(
         tempo_espera_zero_s (float): Duração em segundos para manter a pressão externa.
         passo_psi (float): A variação de pressão em cada etapa da simulação (em psi).
         intervalo_passo_s (float): O tempo de espera entre cada etapa (em segundos).
+        modelo (ModeloCamaraAr): Se informado, usa o perfil físico pré-calculado
+            (ver simular_ciclo_fisico) e ignora passo_psi/intervalo_passo_s.
+        escala_tempo (float): Fator de tempo da reprodução do modelo físico.
+        taxa_vazamento_psi_s (float): Vazamento simulado durante a fase 2 (em psi/s).
+        ruido_sensor_psi (float): Ruído das leituras de pressão amostradas (em psi).
+        monitor (MonitorCicloCamara): Recebe as amostras das três fases e estima,
+            em fluxo, vazamento e eficiência; alertas são exibidos na hora.
+        relogio (RelogioSimulacao): Relógio de simulação usado nas esperas
+            (tempo real, escalado ou sem espera). Com 'modelo', substitui 'escala_tempo'.
 
     Returns:
         bool: True se o ciclo completou normalmente, False se foi interrompido ou falhou.
     """
+    if modelo is not None:
+        return simular_ciclo_fisico(modelo, pressao_interna_psi, pressao_externa_psi,
+                                    tempo_espera_zero_s, escala_tempo, monitor=monitor,
+                                    ruido_sensor_psi=ruido_sensor_psi, relogio=relogio)
+
+    relogio = relogio or modulo_relogio_simulacao.RELOGIO_PADRAO
+
+    if monitor is None:
+        taxa_nominal = passo_psi / intervalo_passo_s if intervalo_passo_s > 0 else None
+        monitor = MonitorCicloCamara(pressao_interna_psi, pressao_externa_psi,
+                                     taxa_despressurizacao_nominal_psi_s=taxa_nominal,
+                                     taxa_repressurizacao_nominal_psi_s=taxa_nominal)
+    t_ciclo_s = 0.0 # Instante da amostra dentro do ciclo
+
+    def _amostrar(fase):
+        leitura = _ler_sensor_pressao(pressao_atual, ruido_sensor_psi)
+        _reportar_alertas(monitor.registrar(fase, t_ciclo_s, leitura))
 
     print("\n--- MÓDULO DE CONTROLE DE PRESSÃO DA CÂMARA DE AR ---")
     print(f"Iniciando ciclo: {pressao_interna_psi:.1f} PSI -> {pressao_externa_psi:.1f} PSI -> {pressao_interna_psi:.1f} PSI")
@@ -46,15 +300,18 @@ def simular_ciclo_pressurizacao(
             # A linha abaixo é a que foi corrigida:
             print(f" Pressão: {pressao_atual:.1f} PSI... Despressurizando", end='\r') # <-- CORRIGIDO
             sys.stdout.flush() # Garante que a linha seja atualizada imediatamente no console
+            _amostrar(FASE_DESPRESSURIZACAO)
 
             # Pausa para simular o tempo do passo
-            time.sleep(intervalo_passo_s)
+            relogio.dormir(intervalo_passo_s)
+            t_ciclo_s += intervalo_passo_s
 
             # Atualiza a pressão para o próximo passo
             pressao_atual = pressao_proximo_passo
 
         # Garante que a pressão final seja exatamente o alvo (0.0 psi) e limpa a linha
         pressao_atual = pressao_externa_psi
+        _amostrar(FASE_DESPRESSURIZACAO)
         # Os espaços no final limpam caracteres remanescentes de "Despressurizando"
         print(f" Pressão: {pressao_atual:.1f} PSI... Nível externo atingido.  ")
         print("[FASE 1] Despressurização concluída.")
@@ -62,9 +319,18 @@ def simular_ciclo_pressurizacao(
         # --- Fase 2: Manutenção em Pressão Externa (Vácuo Simulado) ---
         print(f"\n[FASE 2] Mantendo pressão em {pressao_externa_psi:.1f} PSI por {tempo_espera_zero_s:.1f} segundos.")
         print("         (Simulando período de atividade externa ou interface com vácuo)")
-        # Pausa para simular o tempo de espera
-        time.sleep(tempo_espera_zero_s)
+        # Amostra a pressão durante a espera: com a câmara isolada, o vazamento aparece como subida lenta
+        intervalo_amostra_s = intervalo_passo_s if intervalo_passo_s > 0 else tempo_espera_zero_s
+        num_amostras = max(1, math.ceil(tempo_espera_zero_s / intervalo_amostra_s)) if tempo_espera_zero_s > 0 else 0
+        for i in range(num_amostras):
+            dt = min(intervalo_amostra_s, tempo_espera_zero_s - i * intervalo_amostra_s)
+            relogio.dormir(dt)
+            t_ciclo_s += dt
+            pressao_atual = min(pressao_interna_psi, pressao_atual + taxa_vazamento_psi_s * dt)
+            _amostrar(FASE_MANUTENCAO)
         print("[FASE 2] Tempo de manutenção concluído.")
+        if taxa_vazamento_psi_s > 0:
+            print(f"         Pressão ao fim da manutenção: {pressao_atual:.3f} PSI")
 
         # --- Fase 3: Repressurização ---
         print("\n[FASE 3] Iniciando repressurização...")
@@ -75,9 +341,11 @@ def simular_ciclo_pressurizacao(
              # Exibe a pressão atual (usando \r para sobrescrever a linha anterior)
             print(f" Pressão: {pressao_atual:.1f} PSI... Repressurizando ", end='\r') # Espaço extra opcional no fim
             sys.stdout.flush() # Garante que a linha seja atualizada imediatamente
+            _amostrar(FASE_REPRESSURIZACAO)
 
             # Pausa para simular o tempo do passo
-            time.sleep(intervalo_passo_s)
+            relogio.dormir(intervalo_passo_s)
+            t_ciclo_s += intervalo_passo_s
 
             # Atualiza a pressão para o próximo passo
             pressao_atual = pressao_proximo_passo
@@ -86,9 +354,13 @@ def simular_ciclo_pressurizacao(
         pressao_atual = pressao_interna_psi
         # Os espaços no final limpam caracteres remanescentes de "Repressurizando"
         print(f" Pressão: {pressao_atual:.1f} PSI... Nível interno atingido.   ")
+        _amostrar(FASE_REPRESSURIZACAO)
         print("[FASE 3] Repressurização concluída.")
 
-        print("\n--- CICLO DE PRESSURIZAÇÃO DA CÂMARA DE AR COMPLETO ---")
+        if monitor.ciclo_anormal:
+            print("\n--- CICLO COMPLETO, MARCADO COMO ANORMAL (verificar câmara de ar) ---")
+        else:
+            print("\n--- CICLO DE PRESSURIZAÇÃO DA CÂMARA DE AR COMPLETO ---")
         return True # Indica que o ciclo terminou com sucesso
 
     except KeyboardInterrupt:
@@ -103,6 +375,247 @@ def simular_ciclo_pressurizacao(
         print(f"  Última pressão registrada: {pressao_atual:.1f} PSI")
         return False # Indica que o ciclo falhou
 
+# --- Perfis Pré-Calculados (Modelo Físico) ---
+
+def _grade_tempo(duracao_s, passo_s):
+    """Instantes 0, passo, 2·passo, ... incluindo sempre o instante final."""
+    n = int(duracao_s / passo_s)
+    if np is not None:
+        grade = np.arange(n + 1) * passo_s
+        return grade if grade[-1] >= duracao_s else np.append(grade, duracao_s)
+    grade = [i * passo_s for i in range(n + 1)]
+    if grade[-1] < duracao_s:
+        grade.append(duracao_s)
+    return grade
+
+
+@functools.lru_cache(maxsize=4096)
+def gerar_perfil_pressao(modelo=ModeloCamaraAr(), pressao_interna_psi=15.0, pressao_externa_psi=0.0,
+                         tempo_espera_zero_s=10.0, passo_amostra_s=PASSO_AMOSTRA_PADRAO_S):
+    """
+    Calcula de uma só vez o perfil pressão x tempo do ciclo completo
+    (despressurização, manutenção e repressurização) a partir do modelo físico.
+    O resultado fica em cache por parâmetros e é somente leitura.
+
+    Raises:
+        ValueError: se o vazamento impede a bomba de atingir a pressão externa.
+    """
+    tau = modelo.volume_m3 / modelo.vazao_bomba_m3_s
+    tau_r = modelo.volume_m3 / modelo.vazao_repressurizacao_m3_s
+    vazamento = modelo.taxa_vazamento_psi_s
+    tolerancia = modelo.tolerancia_psi
+
+    # Fase 1: decaimento exponencial até a pressão externa (com tolerância)
+    pressao_equilibrio = pressao_externa_psi + vazamento * tau
+    alvo_despressurizacao = pressao_externa_psi + tolerancia
+    if pressao_equilibrio >= alvo_despressurizacao:
+        raise ValueError(f"Vazamento ({vazamento} psi/s) excede a capacidade da bomba: "
+                         f"equilíbrio em {pressao_equilibrio:.3f} PSI.")
+    if pressao_interna_psi > alvo_despressurizacao:
+        duracao_1 = tau * math.log((pressao_interna_psi - pressao_equilibrio) /
+                                   (alvo_despressurizacao - pressao_equilibrio))
+    else:
+        duracao_1 = 0.0
+    # Fase 2: câmara isolada, pressão sobe com o vazamento
+    duracao_2 = float(tempo_espera_zero_s)
+    # Fase 3: equalização exponencial com o habitat
+    pressao_fim_2 = min(pressao_interna_psi, pressao_externa_psi + tolerancia + vazamento * duracao_2) \
+        if duracao_1 > 0 else pressao_interna_psi
+    if pressao_fim_2 < pressao_interna_psi - tolerancia:
+        duracao_3 = tau_r * math.log((pressao_interna_psi - pressao_fim_2) / tolerancia)
+    else:
+        duracao_3 = 0.0
+
+    t_1 = _grade_tempo(duracao_1, passo_amostra_s)
+    t_2 = _grade_tempo(duracao_2, passo_amostra_s)[1:] # Sem repetir o instante de transição
+    t_3 = _grade_tempo(duracao_3, passo_amostra_s)[1:]
+    pressao_fim_1 = pressao_interna_psi if duracao_1 == 0 else alvo_despressurizacao
+
+    if np is not None:
+        p_1 = pressao_equilibrio + (pressao_interna_psi - pressao_equilibrio) * np.exp(-t_1 / tau)
+        p_2 = np.minimum(pressao_interna_psi, pressao_fim_1 + vazamento * t_2)
+        p_3 = pressao_interna_psi - (pressao_interna_psi - pressao_fim_2) * np.exp(-t_3 / tau_r)
+        tempos = np.concatenate((t_1, t_2 + duracao_1, t_3 + duracao_1 + duracao_2))
+        pressoes = np.concatenate((p_1, p_2, p_3))
+        tempos.flags.writeable = False # O perfil é compartilhado pelo cache
+        pressoes.flags.writeable = False
+    else:
+        p_1 = [pressao_equilibrio + (pressao_interna_psi - pressao_equilibrio) * math.exp(-t / tau) for t in t_1]
+        p_2 = [min(pressao_interna_psi, pressao_fim_1 + vazamento * t) for t in t_2]
+        p_3 = [pressao_interna_psi - (pressao_interna_psi - pressao_fim_2) * math.exp(-t / tau_r) for t in t_3]
+        tempos = tuple(t_1) + tuple(t + duracao_1 for t in t_2) + tuple(t + duracao_1 + duracao_2 for t in t_3)
+        pressoes = tuple(p_1) + tuple(p_2) + tuple(p_3)
+
+    inicio_fases = (0, len(t_1), len(t_1) + len(t_2))
+    fim_fases_s = (duracao_1, duracao_1 + duracao_2, duracao_1 + duracao_2 + duracao_3)
+    return PerfilPressao(tempos, pressoes, inicio_fases, fim_fases_s)
+
+
+def resumir_perfil(perfil):
+    """Durações de cada fase e pressão máxima atingida durante a manutenção."""
+    fim_1, fim_2, fim_3 = perfil.fim_fases_s
+    inicio_2, inicio_3 = perfil.inicio_fases[1], perfil.inicio_fases[2]
+    pressoes_2 = perfil.pressoes_psi[inicio_2:inicio_3]
+    return {
+        "duracao_despressurizacao_s": fim_1,
+        "duracao_manutencao_s": fim_2 - fim_1,
+        "duracao_repressurizacao_s": fim_3 - fim_2,
+        "duracao_total_s": fim_3,
+        "pressao_max_manutencao_psi": float(pressoes_2[-1]) if len(pressoes_2) else None, # Só sobe na fase 2
+    }
+
+
+def reproduzir_perfil(perfil, escala_tempo=1.0, exibir=True, monitor=None, ruido_sensor_psi=0.0, relogio=None):
+    """
+    Reproduz um perfil pré-calculado. 'escala_tempo' multiplica o tempo simulado:
+    1.0 = tempo real, 0.1 = dez vezes mais rápido, 0 = sem espera (execução em lote).
+    Com um 'relogio' compartilhado, as esperas passam por ele (e a escala é a dele).
+    Com 'monitor', cada amostra (com ruído de sensor opcional) alimenta a
+    estimativa de vazamento/eficiência e os alertas saem durante a reprodução.
+    Retorna a última pressão reproduzida.
+    """
+    if relogio is None:
+        relogio = modulo_relogio_simulacao.RelogioSimulacao(
+            modulo_relogio_simulacao.MODO_ESCALADO, escala_tempo) if escala_tempo > 0 else \
+            modulo_relogio_simulacao.RelogioSimulacao(modulo_relogio_simulacao.MODO_RAPIDO)
+    escala_tempo = relogio.escala_tempo
+    tempos, pressoes = perfil.tempos_s, perfil.pressoes_psi
+    if escala_tempo <= 0 and not exibir and monitor is None:
+        return float(pressoes[-1]) # Nada a reproduzir: o perfil já está calculado
+
+    fases = (
+        ("[FASE 1] Iniciando despressurização...", "Despressurizando", "[FASE 1] Despressurização concluída."),
+        ("[FASE 2] Mantendo câmara isolada (pressão externa).", "Mantendo       ", "[FASE 2] Tempo de manutenção concluído."),
+        ("[FASE 3] Iniciando repressurização...", "Repressurizando ", "[FASE 3] Repressurização concluída."),
+    )
+    limites = perfil.inicio_fases + (len(tempos),)
+    t_anterior = 0.0
+    for fase, (cabecalho, acao, conclusao) in enumerate(fases):
+        if exibir:
+            print(f"\n{cabecalho}")
+        for i in range(limites[fase], limites[fase + 1]):
+            if monitor is not None:
+                alertas = monitor.registrar(fase + 1, tempos[i], _ler_sensor_pressao(pressoes[i], ruido_sensor_psi))
+                if exibir:
+                    _reportar_alertas(alertas)
+            relogio.dormir(tempos[i] - t_anterior)
+            if escala_tempo > 0:
+                if exibir:
+                    print(f" Pressão: {pressoes[i]:.2f} PSI (t={tempos[i]:.0f}s)... {acao}", end='\r')
+                    sys.stdout.flush()
+            t_anterior = tempos[i]
+        if exibir:
+            ultima = pressoes[limites[fase + 1] - 1] if limites[fase + 1] > 0 else 0.0
+            print(f" Pressão: {ultima:.2f} PSI (t={perfil.fim_fases_s[fase]:.0f}s)            ")
+            print(conclusao)
+    return float(pressoes[-1])
+
+
+def simular_ciclo_fisico(
+    modelo=ModeloCamaraAr(),
+    pressao_interna_psi=15.0,
+    pressao_externa_psi=0.0,
+    tempo_espera_zero_s=10.0,
+    escala_tempo=1.0,
+    exibir=True,
+    monitor=None,
+    ruido_sensor_psi=0.0,
+    relogio=None
+):
+    """
+    Executa um ciclo da câmara de ar usando o modelo físico: o perfil é
+    calculado (ou obtido do cache) e reproduzido na escala de tempo pedida,
+    com as amostras de pressão alimentando o monitor de vazamento/eficiência.
+
+    Returns:
+        bool: True se o ciclo completou normalmente, False se foi interrompido ou falhou.
+    """
+    pressao_atual = pressao_interna_psi
+    try:
+        perfil = gerar_perfil_pressao(modelo, pressao_interna_psi, pressao_externa_psi, tempo_espera_zero_s)
+        if exibir:
+            resumo = resumir_perfil(perfil)
+            print("\n--- MÓDULO DE CONTROLE DE PRESSÃO DA CÂMARA DE AR (MODELO FÍSICO) ---")
+            print(f"Ciclo: {pressao_interna_psi:.1f} PSI -> {pressao_externa_psi:.1f} PSI -> {pressao_interna_psi:.1f} PSI"
+                  f" | Duração simulada: {resumo['duracao_total_s']:.0f}s"
+                  f" | Escala de tempo: {relogio.escala_tempo if relogio else escala_tempo}")
+        if monitor is None:
+            monitor = MonitorCicloCamara.para_modelo(modelo, pressao_interna_psi, pressao_externa_psi)
+        pressao_atual = reproduzir_perfil(perfil, escala_tempo, exibir, monitor, ruido_sensor_psi, relogio)
+        if exibir:
+            if monitor.ciclo_anormal:
+                print("\n--- CICLO COMPLETO, MARCADO COMO ANORMAL (verificar câmara de ar) ---")
+            else:
+                print("\n--- CICLO DE PRESSURIZAÇÃO DA CÂMARA DE AR COMPLETO ---")
+        return True
+
+    except KeyboardInterrupt:
+        print("\n\n! ALERTA: Ciclo de pressurização interrompido manualmente pelo usuário!")
+        return False
+
+    except Exception as e:
+        print(f"\n\n! ERRO CRÍTICO no sistema de pressurização: {e}")
+        print(f"  Última pressão registrada: {pressao_atual:.1f} PSI")
+        return False
+
+
+def avaliar_ciclos(modelos, pressao_interna_psi=15.0, pressao_externa_psi=0.0, tempo_espera_zero_s=10.0):
+    """
+    Avalia muitos ciclos em lote, sem reprodução em tempo real.
+    Retorna um resumo por modelo; modelos inviáveis trazem a chave 'erro'.
+    """
+    resultados = []
+    for modelo in modelos:
+        try:
+            perfil = gerar_perfil_pressao(modelo, pressao_interna_psi, pressao_externa_psi, tempo_espera_zero_s)
+            resultados.append(resumir_perfil(perfil))
+        except ValueError as e:
+            resultados.append({"erro": str(e)})
+    return resultados
+
+def agendar_ciclo_camara(escalonador, modelo=ModeloCamaraAr(), pressao_interna_psi=15.0,
+                         pressao_externa_psi=0.0, tempo_espera_zero_s=10.0, ao_concluir_fase=None):
+    """
+    Agenda um ciclo da câmara de ar no escalonador de eventos compartilhado,
+    a partir do instante atual do relógio. Só o fim de cada fase vira evento
+    (o perfil já está calculado), então o ciclo não custa nada entre fases.
+    ao_concluir_fase(fase, instante_s, pressao_psi) é chamado ao fim de cada fase.
+    Retorna o perfil do ciclo.
+    """
+    perfil = gerar_perfil_pressao(modelo, pressao_interna_psi, pressao_externa_psi, tempo_espera_zero_s)
+    if ao_concluir_fase is not None:
+        inicio = escalonador.relogio.agora()
+        fins_indices = perfil.inicio_fases[1:] + (len(perfil.tempos_s),)
+        for fase, (fim_s, fim_indice) in enumerate(zip(perfil.fim_fases_s, fins_indices), start=1):
+            pressao_fim = float(perfil.pressoes_psi[fim_indice - 1]) if fim_indice > 0 else pressao_interna_psi
+            escalonador.agendar_em(inicio + fim_s, ao_concluir_fase, fase, inicio + fim_s, pressao_fim)
+    return perfil
+
+# --- Pressão da Cabine Vinda do Monitoramento ---
+
+PARAMETRO_PRESSAO_CABINE = "Pressao Cabine" # Nome usado pelo monitoramento ambiental
+
+
+class PressaoCabineAtual:
+    """
+    Acompanha, pelo barramento de telemetria, a pressão da cabine medida pelo
+    monitoramento, usada como alvo da repressurização. O buffer é pequeno de
+    propósito: só as leituras mais recentes importam, as antigas são descartadas.
+    """
+
+    def __init__(self, barramento, pressao_padrao_psi=15.0, capacidade=64):
+        self.pressao_psi = pressao_padrao_psi
+        self.instante_s = None # Instante da leitura usada (None = valor padrão)
+        self._assinatura = barramento.assinar(TOPICO_LEITURAS_AMBIENTE, capacidade)
+
+    def atualizar(self):
+        """Consome as leituras pendentes e retorna a pressão mais recente."""
+        for leitura in self._assinatura.mensagens():
+            if leitura.parametro == PARAMETRO_PRESSAO_CABINE:
+                self.pressao_psi = float(leitura.valor)
+                self.instante_s = leitura.instante_s
+        return self.pressao_psi
+
 # --- Bloco de Execução Principal (para teste autônomo do módulo) ---
 # Este código só roda se você executar este arquivo diretamente (python modulo_pressurizacao.py)
 if __name__ == "__main__":
@@ -0,0 +1,471 @@
+import asyncio
+import itertools
+import json
+import os
+import sys
+
+import modulo_diagnostico as diag
+import modulo_aleatorio
+
+# -----------------------------------------------------------------------------
+# Provedores de Verificação para o Diagnóstico da Aurora I
+# -----------------------------------------------------------------------------
+# Um provedor responde "qual o status deste subsistema?" de forma assíncrona.
+# Assim o diagnóstico pode apontar para fontes reais de verificação:
+# - ProvedorSimulado:       sorteio aleatório (o comportamento padrão)
+# - ProvedorTelemetriaTCP:  emulador de telemetria via TCP, com pool de conexões
+#                           e pipelining (várias requisições em voo por conexão)
+# - ProvedorTelemetriaUDP:  mesmo protocolo via UDP, um único socket
+# - ProvedorDiretorio:      arquivos deixados em um diretório ("file-drop")
+# - ProvedorSubprocesso:    um comando externo (sonda) por verificação
+#
+# Protocolo de telemetria (TCP e UDP): uma mensagem JSON por linha/datagrama.
+#   requisição: {"id": 17, "subsistema": "casco"}
+#   resposta:   {"id": 17, "status": "OPERACIONAL"}
+# As respostas podem chegar fora de ordem; o "id" associa cada uma à sua requisição.
+# -----------------------------------------------------------------------------
+
+# Sorteios do provedor simulado e do emulador de telemetria
+ALEATORIO = modulo_aleatorio.fluxo("provedores_diagnostico")
+
+HOST_TELEMETRIA_PADRAO = "127.0.0.1"
+PORTA_TELEMETRIA_PADRAO = 47800
+
+STATUS_VALIDOS = (diag.STATUS_OPERACIONAL, diag.STATUS_ALERTA, diag.STATUS_CRITICO)
+
+
+def _status_valido(status):
+    """Normaliza o status recebido de uma fonte externa."""
+    status = str(status).strip().upper()
+    if status == "CRITICO": # Aceita a grafia sem acento
+        status = diag.STATUS_CRITICO
+    return status if status in STATUS_VALIDOS else diag.STATUS_DESCONHECIDO
+
+
+# --- Interface Base ---
+
+class ProvedorVerificacao:
+    """Interface dos provedores de verificação (use com 'async with')."""
+
+    async def abrir(self):
+        """Prepara recursos (conexões, sockets). Opcional."""
+
+    async def fechar(self):
+        """Libera recursos. Opcional."""
+
+    async def verificar(self, entrada):
+        """Retorna o status do subsistema descrito pela entrada do registro."""
+        raise NotImplementedError
+
+    async def __aenter__(self):
+        await self.abrir()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.fechar()
+
+
+class ProvedorSimulado(ProvedorVerificacao):
+    """Sorteio aleatório com as probabilidades e atrasos do registro (padrão)."""
+
+    async def verificar(self, entrada):
+        resultado_random = ALEATORIO.random()
+        await asyncio.sleep(ALEATORIO.uniform(*entrada["atraso_s"]))
+        return diag._sortear_status(entrada, resultado_random)
+
+
+# --- Telemetria TCP (pool de conexões + pipelining) ---
+
+class _ConexaoTelemetria:
+    """Uma conexão TCP com várias requisições em voo ao mesmo tempo."""
+
+    def __init__(self, host, porta, max_pipeline):
+        self.host = host
+        self.porta = porta
+        self.pendentes = {} # id da requisição -> future da resposta
+        self._vagas = asyncio.Semaphore(max_pipeline)
+        self._ids = itertools.count(1)
+        self._leitor = None
+        self._escritor = None
+        self._tarefa_leitura = None
+        self._perdida = False # Servidor encerrou a conexão (EOF/erro): deve ser reaberta
+
+    @property
+    def aberta(self):
+        return self._escritor is not None and not self._perdida and not self._escritor.is_closing()
+
+    @property
+    def em_voo(self):
+        return len(self.pendentes)
+
+    async def abrir(self):
+        self._leitor, self._escritor = await asyncio.open_connection(self.host, self.porta)
+        self._perdida = False
+        self._tarefa_leitura = asyncio.create_task(self._ler_respostas())
+
+    async def fechar(self):
+        if self._escritor is not None:
+            self._escritor.close()
+            try:
+                await self._escritor.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        if self._tarefa_leitura is not None:
+            self._tarefa_leitura.cancel()
+        self._falhar_pendentes(ConnectionError("Conexão de telemetria encerrada."))
+
+    async def requisitar(self, id_subsistema, timeout_s):
+        async with self._vagas:
+            if not self.aberta: # Não escreve numa conexão morta: falha já, sem esperar o timeout
+                raise ConnectionError("Conexão de telemetria fechada.")
+            id_req = next(self._ids)
+            resposta = asyncio.get_running_loop().create_future()
+            self.pendentes[id_req] = resposta
+            linha = json.dumps({"id": id_req, "subsistema": id_subsistema}) + "\n"
+            self._escritor.write(linha.encode("utf-8"))
+            try:
+                await self._escritor.drain()
+                return await asyncio.wait_for(resposta, timeout_s)
+            finally:
+                self.pendentes.pop(id_req, None)
+
+    async def _ler_respostas(self):
+        try:
+            while True:
+                linha = await self._leitor.readline()
+                if not linha:
+                    break
+                try:
+                    mensagem = json.loads(linha)
+                    resposta = self.pendentes.get(mensagem["id"])
+                except (ValueError, KeyError, TypeError):
+                    continue # Linha malformada: ignora
+                if resposta is not None and not resposta.done():
+                    resposta.set_result(mensagem.get("status"))
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            # Marca e fecha a conexão: _conexao_livre reabre na próxima requisição
+            self._perdida = True
+            if self._escritor is not None:
+                self._escritor.close()
+            self._falhar_pendentes(ConnectionError("Conexão de telemetria perdida."))
+
+    def _falhar_pendentes(self, erro):
+        for resposta in self.pendentes.values():
+            if not resposta.done():
+                resposta.set_exception(erro)
+
+
+class ProvedorTelemetriaTCP(ProvedorVerificacao):
+    """Consulta um emulador de telemetria por TCP, distribuindo as requisições
+    entre poucas conexões persistentes (a menos ocupada recebe a próxima)."""
+
+    def __init__(self, host=HOST_TELEMETRIA_PADRAO, porta=PORTA_TELEMETRIA_PADRAO,
+                 conexoes=4, max_pipeline=64, timeout_s=5.0):
+        self.host = host
+        self.porta = porta
+        self.conexoes = conexoes
+        self.max_pipeline = max_pipeline
+        self.timeout_s = timeout_s
+        self._pool = []
+        self._abrindo = None
+
+    async def abrir(self):
+        # Criados aqui para ficarem ligados ao loop de eventos em execução
+        self._pool = [_ConexaoTelemetria(self.host, self.porta, self.max_pipeline) for _ in range(self.conexoes)]
+        self._abrindo = asyncio.Lock()
+        # Falhas aqui não são fatais: a conexão é refeita sob demanda em verificar()
+        await asyncio.gather(*(conexao.abrir() for conexao in self._pool), return_exceptions=True)
+
+    async def fechar(self):
+        await asyncio.gather(*(conexao.fechar() for conexao in self._pool))
+
+    async def _conexao_livre(self):
+        conexao = min(self._pool, key=lambda c: c.em_voo)
+        if not conexao.aberta:
+            async with self._abrindo: # Reconecta sob demanda se a conexão caiu
+                if not conexao.aberta:
+                    await conexao.abrir()
+        return conexao
+
+    async def verificar(self, entrada):
+        try:
+            conexao = await self._conexao_livre()
+            return _status_valido(await conexao.requisitar(entrada["id"], self.timeout_s))
+        except (ConnectionError, OSError, asyncio.TimeoutError):
+            return diag.STATUS_DESCONHECIDO
+
+
+# --- Telemetria UDP ---
+
+class _ProtocoloClienteUDP(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.pendentes = {}
+
+    def datagram_received(self, dados, endereco):
+        try:
+            mensagem = json.loads(dados)
+            resposta = self.pendentes.get(mensagem["id"])
+        except (ValueError, KeyError, TypeError):
+            return
+        if resposta is not None and not resposta.done():
+            resposta.set_result(mensagem.get("status"))
+
+
+class ProvedorTelemetriaUDP(ProvedorVerificacao):
+    """Consulta o emulador por UDP. Datagrama perdido vira status DESCONHECIDO."""
+
+    def __init__(self, host=HOST_TELEMETRIA_PADRAO, porta=PORTA_TELEMETRIA_PADRAO, timeout_s=2.0):
+        self.endereco = (host, porta)
+        self.timeout_s = timeout_s
+        self._ids = itertools.count(1)
+        self._transporte = None
+        self._protocolo = None
+
+    async def abrir(self):
+        loop = asyncio.get_running_loop()
+        self._transporte, self._protocolo = await loop.create_datagram_endpoint(
+            _ProtocoloClienteUDP, remote_addr=self.endereco)
+
+    async def fechar(self):
+        if self._transporte is not None:
+            self._transporte.close()
+
+    async def verificar(self, entrada):
+        id_req = next(self._ids)
+        resposta = asyncio.get_running_loop().create_future()
+        self._protocolo.pendentes[id_req] = resposta
+        try:
+            self._transporte.sendto(json.dumps({"id": id_req, "subsistema": entrada["id"]}).encode("utf-8"))
+            return _status_valido(await asyncio.wait_for(resposta, self.timeout_s))
+        except (OSError, asyncio.TimeoutError):
+            return diag.STATUS_DESCONHECIDO
+        finally:
+            self._protocolo.pendentes.pop(id_req, None)
+
+
+# --- Diretório de Arquivos (file-drop) ---
+
+class ProvedorDiretorio(ProvedorVerificacao):
+    """Lê o status de '<diretorio>/<id>.json' ({"status": ...}) ou '<id>.txt'.
+    Se 'espera_s' > 0, aguarda o arquivo aparecer, verificando a cada 'intervalo_s'."""
+
+    def __init__(self, diretorio, espera_s=0.0, intervalo_s=0.1):
+        self.diretorio = diretorio
+        self.espera_s = espera_s
+        self.intervalo_s = intervalo_s
+
+    def _ler_status(self, id_subsistema):
+        base = os.path.join(self.diretorio, id_subsistema)
+        try:
+            with open(base + ".json", encoding="utf-8") as arquivo:
+                return json.load(arquivo).get("status")
+        except FileNotFoundError:
+            pass
+        except (ValueError, AttributeError):
+            return None
+        try:
+            with open(base + ".txt", encoding="utf-8") as arquivo:
+                return arquivo.readline()
+        except FileNotFoundError:
+            return None
+
+    async def verificar(self, entrada):
+        loop = asyncio.get_running_loop()
+        prazo = loop.time() + self.espera_s
+        while True:
+            status = await asyncio.to_thread(self._ler_status, entrada["id"])
+            if status is not None or loop.time() >= prazo:
+                return _status_valido(status) if status is not None else diag.STATUS_DESCONHECIDO
+            await asyncio.sleep(self.intervalo_s)
+
+
+# --- Sonda por Subprocesso ---
+
+class ProvedorSubprocesso(ProvedorVerificacao):
+    """Executa um comando por verificação. '{id}' nos argumentos é trocado pelo id.
+    A primeira linha da saída, se for um status válido, é usada; senão, o código
+    de saída: 0 = OPERACIONAL, 1 = ALERTA, 2 = CRÍTICO, outros = DESCONHECIDO."""
+
+    CODIGOS_SAIDA = {0: diag.STATUS_OPERACIONAL, 1: diag.STATUS_ALERTA, 2: diag.STATUS_CRITICO}
+
+    def __init__(self, comando, max_processos=8, timeout_s=10.0):
+        self.comando = list(comando)
+        self.max_processos = max_processos
+        self.timeout_s = timeout_s
+        self._vagas = None
+
+    async def abrir(self):
+        self._vagas = asyncio.Semaphore(self.max_processos)
+
+    async def verificar(self, entrada):
+        argumentos = [arg.replace("{id}", entrada["id"]) for arg in self.comando]
+        async with self._vagas:
+            try:
+                processo = await asyncio.create_subprocess_exec(
+                    *argumentos, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+            except OSError:
+                return diag.STATUS_DESCONHECIDO
+            try:
+                saida, _ = await asyncio.wait_for(processo.communicate(), self.timeout_s)
+            except asyncio.TimeoutError:
+                processo.kill()
+                await processo.wait()
+                return diag.STATUS_DESCONHECIDO
+
+        primeira_linha = saida.decode("utf-8", "replace").splitlines()[:1]
+        if primeira_linha and _status_valido(primeira_linha[0]) != diag.STATUS_DESCONHECIDO:
+            return _status_valido(primeira_linha[0])
+        return self.CODIGOS_SAIDA.get(processo.returncode, diag.STATUS_DESCONHECIDO)
+
+
+# --- Execução do Diagnóstico com um Provedor ---
+
+async def diagnosticar_com_provedor(entradas, provedor, max_em_voo=256, ao_concluir=None):
+    """
+    Verifica todas as entradas com o provedor, com até 'max_em_voo' verificações
+    simultâneas. Chama ao_concluir(entrada, status) a cada resultado e retorna
+    o dicionário id -> status.
+    """
+    vagas = asyncio.Semaphore(max_em_voo)
+    resultados = {}
+
+    async def _verificar_uma(entrada):
+        async with vagas:
+            try:
+                status = await provedor.verificar(entrada)
+            except Exception: # Provedor com defeito não derruba o diagnóstico inteiro
+                status = diag.STATUS_DESCONHECIDO
+        resultados[entrada["id"]] = status
+        if ao_concluir:
+            ao_concluir(entrada, status)
+
+    async with provedor:
+        await asyncio.gather(*(_verificar_uma(entrada) for entrada in entradas))
+    return resultados
+
+
+# --- Servidor Local de Telemetria (substituto para testes) ---
+
+class _ProtocoloServidorUDP(asyncio.DatagramProtocol):
+    def __init__(self, responder):
+        self._responder = responder
+        self.transporte = None
+        self._loop = None
+        # O laço guarda as tarefas só por referência fraca: sem este conjunto, uma
+        # resposta pendente poderia ser coletada pelo GC antes de terminar
+        self._tarefas = set()
+
+    def connection_made(self, transporte):
+        self.transporte = transporte
+        self._loop = asyncio.get_running_loop()
+
+    def datagram_received(self, dados, endereco):
+        tarefa = self._loop.create_task(self._responder_udp(dados, endereco))
+        self._tarefas.add(tarefa)
+        tarefa.add_done_callback(self._tarefas.discard)
+
+    async def _responder_udp(self, dados, endereco):
+        resposta = await self._responder(dados)
+        if resposta is not None:
+            self.transporte.sendto(resposta, endereco)
+
+
+async def iniciar_servidor_telemetria(host=HOST_TELEMETRIA_PADRAO, porta=PORTA_TELEMETRIA_PADRAO,
+                                      atraso_s=(0.01, 0.05), registro=None, udp=True):
+    """
+    Inicia o emulador local de telemetria (TCP e, opcionalmente, UDP na mesma porta).
+    Cada requisição é respondida após um atraso aleatório, fora de ordem, com um
+    status sorteado pelas probabilidades do registro. Retorna (servidor_tcp, transporte_udp).
+    """
+    registro = registro or diag.REGISTRO
+
+    async def _responder(dados):
+        try:
+            mensagem = json.loads(dados)
+            id_req, id_sub = mensagem["id"], mensagem["subsistema"]
+        except (ValueError, KeyError, TypeError):
+            return None
+        await asyncio.sleep(ALEATORIO.uniform(*atraso_s))
+        entrada = registro.por_id.get(id_sub)
+        status = diag._sortear_status(entrada, ALEATORIO.random()) if entrada else diag.STATUS_DESCONHECIDO
+        return (json.dumps({"id": id_req, "status": status}, ensure_ascii=False) + "\n").encode("utf-8")
+
+    async def _atender_conexao(leitor, escritor):
+        tarefas = set()
+
+        async def _responder_tcp(linha):
+            resposta = await _responder(linha)
+            if resposta is not None and not escritor.is_closing():
+                escritor.write(resposta)
+
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                tarefa = asyncio.create_task(_responder_tcp(linha)) # Pipelining: não espera a anterior
+                tarefas.add(tarefa)
+                tarefa.add_done_callback(tarefas.discard)
+            if tarefas:
+                await asyncio.gather(*tarefas, return_exceptions=True)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            escritor.close()
+
+    servidor = await asyncio.start_server(_atender_conexao, host, porta)
+    transporte_udp = None
+    if udp:
+        loop = asyncio.get_running_loop()
+        transporte_udp, _ = await loop.create_datagram_endpoint(
+            lambda: _ProtocoloServidorUDP(_responder), local_addr=(host, porta))
+    return servidor, transporte_udp
+
+
+async def _demonstrar_provedores(porta):
+    """Sobe o emulador local e roda o diagnóstico via TCP e via UDP."""
+    servidor, transporte_udp = await iniciar_servidor_telemetria(porta=porta)
+    try:
+        entradas = list(diag.REGISTRO)
+        for provedor in (ProvedorTelemetriaTCP(porta=porta, conexoes=2), ProvedorTelemetriaUDP(porta=porta)):
+            inicio = asyncio.get_running_loop().time()
+            resultados = await diagnosticar_com_provedor(entradas, provedor)
+            duracao = asyncio.get_running_loop().time() - inicio
+            contagem = {}
+            for status in resultados.values():
+                contagem[status] = contagem.get(status, 0) + 1
+            print(f"{type(provedor).__name__}: {len(resultados)} verificações em {duracao:.3f}s -> {contagem}")
+    finally:
+        servidor.close()
+        await servidor.wait_closed()
+        if transporte_udp is not None:
+            transporte_udp.close()
+
+
+# --- Bloco de Execução Principal (para teste) ---
+# python modulo_provedores_diagnostico.py servidor [porta]  -> só o emulador de telemetria
+# python modulo_provedores_diagnostico.py [porta]           -> emulador + diagnóstico de teste
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    modo_servidor = bool(argumentos) and argumentos[0] == "servidor"
+    if modo_servidor:
+        argumentos = argumentos[1:]
+    porta_escolhida = int(argumentos[0]) if argumentos else PORTA_TELEMETRIA_PADRAO
+
+    async def _servir_para_sempre():
+        servidor, _ = await iniciar_servidor_telemetria(porta=porta_escolhida)
+        print(f"Emulador de telemetria ouvindo em {HOST_TELEMETRIA_PADRAO}:{porta_escolhida} (TCP/UDP). Ctrl+C encerra.")
+        async with servidor:
+            await servidor.serve_forever()
+
+    try:
+        if modo_servidor:
+            asyncio.run(_servir_para_sempre())
+        else:
+            asyncio.run(_demonstrar_provedores(porta_escolhida))
+    except KeyboardInterrupt:
+        print("\nEmulador de telemetria encerrado pelo usuário.")
+    except Exception as e:
+        print(f"\nOcorreu um erro inesperado nos provedores de diagnóstico: {e}")
@@ -0,0 +1,146 @@
+import heapq
+import itertools
+import time
+
+# -----------------------------------------------------------------------------
+# Relógio de Simulação e Escalonador de Eventos da Aurora I
+# -----------------------------------------------------------------------------
+# Tempo comum a todos os subsistemas. O tempo simulado (segundos de missão)
+# só avança pelo relógio; o modo decide quanto tempo REAL isso custa:
+# - MODO_TEMPO_REAL: 1 segundo simulado = 1 segundo real (comportamento original)
+# - MODO_ESCALADO:   1 segundo simulado = 'escala_tempo' segundos reais
+# - MODO_RAPIDO:     sem espera real; um dia de missão roda em milissegundos
+# Como o tempo simulado é sempre o mesmo nos três modos, os subsistemas ficam
+# consistentes entre si, seja qual for a velocidade da execução.
+# -----------------------------------------------------------------------------
+
+MODO_TEMPO_REAL = "real"
+MODO_ESCALADO = "escalado"
+MODO_RAPIDO = "rapido"
+
+
+class RelogioSimulacao:
+    """Relógio compartilhado: guarda o tempo simulado e controla a espera real."""
+
+    def __init__(self, modo=MODO_TEMPO_REAL, escala_tempo=1.0, inicio_s=0.0):
+        if modo == MODO_TEMPO_REAL:
+            escala_tempo = 1.0
+        elif modo == MODO_RAPIDO:
+            escala_tempo = 0.0
+        elif modo == MODO_ESCALADO:
+            if escala_tempo <= 0:
+                raise ValueError("No modo escalado, 'escala_tempo' deve ser > 0.")
+        else:
+            raise ValueError(f"Modo de relógio desconhecido: '{modo}'.")
+        self.modo = modo
+        self.escala_tempo = float(escala_tempo) # Segundos reais por segundo simulado
+        self._agora = float(inicio_s)
+        self._ancora = None # (tempo simulado, tempo real) para ritmar o escalonador sem deriva
+
+    def agora(self):
+        """Tempo simulado atual, em segundos de missão."""
+        return self._agora
+
+    def dormir(self, segundos):
+        """Avança o tempo simulado, esperando o tempo real correspondente ao modo.
+           Substitui time.sleep() nos laços dos subsistemas."""
+        segundos = max(0.0, segundos)
+        if self.escala_tempo > 0:
+            time.sleep(segundos * self.escala_tempo)
+        self._agora += segundos
+        self._ancora = None # Uma espera avulsa (ex.: após input()) reinicia o ritmo
+
+    def avancar_para(self, instante_s):
+        """Avança até um instante simulado. Usado pelo escalonador: a espera real
+           é medida a partir de uma âncora, então atrasos não se acumulam."""
+        if instante_s <= self._agora:
+            return
+        if self.escala_tempo > 0:
+            if self._ancora is None:
+                self._ancora = (self._agora, time.perf_counter())
+            sim_ancora, real_ancora = self._ancora
+            espera = real_ancora + (instante_s - sim_ancora) * self.escala_tempo - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+        self._agora = instante_s
+
+
+# Relógio usado pelos módulos quando nenhum outro é informado (tempo real)
+RELOGIO_PADRAO = RelogioSimulacao(MODO_TEMPO_REAL)
+
+
+class Evento:
+    """Evento agendado. cancelar() impede a execução (e as repetições)."""
+
+    __slots__ = ("instante_s", "callback", "argumentos", "intervalo_s", "cancelado")
+
+    def __init__(self, instante_s, callback, argumentos, intervalo_s=None):
+        self.instante_s = instante_s
+        self.callback = callback
+        self.argumentos = argumentos
+        self.intervalo_s = intervalo_s
+        self.cancelado = False
+
+    def cancelar(self):
+        self.cancelado = True
+
+
+class EscalonadorEventos:
+    """
+    Fila de prioridade de eventos em tempo simulado. Eventos no mesmo instante
+    saem por prioridade (menor primeiro) e depois por ordem de agendamento.
+    """
+
+    def __init__(self, relogio=None):
+        self.relogio = relogio or RelogioSimulacao(MODO_RAPIDO)
+        self._fila = [] # heap (instante, prioridade, sequência, evento)
+        self._seq = itertools.count()
+        self.eventos_executados = 0
+
+    def __len__(self):
+        return len(self._fila)
+
+    def _inserir(self, evento, prioridade):
+        heapq.heappush(self._fila, (evento.instante_s, prioridade, next(self._seq), evento))
+        return evento
+
+    def agendar_em(self, instante_s, callback, *argumentos, prioridade=0):
+        """Agenda callback(*argumentos) para um instante simulado absoluto."""
+        return self._inserir(Evento(max(instante_s, self.relogio.agora()), callback, argumentos), prioridade)
+
+    def agendar(self, atraso_s, callback, *argumentos, prioridade=0):
+        """Agenda callback(*argumentos) para daqui a 'atraso_s' segundos simulados."""
+        return self.agendar_em(self.relogio.agora() + atraso_s, callback, *argumentos, prioridade=prioridade)
+
+    def agendar_periodico(self, intervalo_s, callback, *argumentos, inicio_s=None, prioridade=0):
+        """Agenda callback(*argumentos) a cada 'intervalo_s'. Se o callback
+           retornar False, a repetição termina."""
+        if intervalo_s <= 0:
+            raise ValueError("O intervalo de um evento periódico deve ser > 0.")
+        instante = self.relogio.agora() + intervalo_s if inicio_s is None else inicio_s
+        return self._inserir(Evento(instante, callback, argumentos, intervalo_s), prioridade)
+
+    def executar(self, ate_s=None, max_eventos=None):
+        """
+        Executa os eventos em ordem de tempo simulado até a fila esvaziar, até o
+        instante 'ate_s' (o relógio termina exatamente nele) ou até 'max_eventos'.
+        Retorna o número de eventos executados nesta chamada.
+        """
+        executados = 0
+        while self._fila and (max_eventos is None or executados < max_eventos):
+            instante, prioridade, _, evento = self._fila[0]
+            if ate_s is not None and instante > ate_s:
+                break
+            heapq.heappop(self._fila)
+            if evento.cancelado:
+                continue
+            self.relogio.avancar_para(instante)
+            resultado = evento.callback(*evento.argumentos)
+            executados += 1
+            if evento.intervalo_s is not None and resultado is not False and not evento.cancelado:
+                evento.instante_s = instante + evento.intervalo_s
+                self._inserir(evento, prioridade)
+        if ate_s is not None and (max_eventos is None or executados < max_eventos):
+            self.relogio.avancar_para(ate_s)
+        self.eventos_executados += executados
+        return executados
@@ -0,0 +1,194 @@
+import os
+import sys
+import json
+from collections import namedtuple
+
+# -----------------------------------------------------------------------------
+# Catálogo da Tripulação e dos Parâmetros Monitorados da Aurora I
+# -----------------------------------------------------------------------------
+# A tripulação e os parâmetros monitorados vêm de um arquivo (JSON ou TOML),
+# não do código:
+# - cada parâmetro declara o escopo ("vital": um por tripulante; "cabine": um
+#   para a nave), a unidade, os limites, a simulação (média, desvio), as casas
+#   decimais e o sentido do alarme ("ambos", "baixo" como SpO2, "alto" como
+#   CO2). Nada disso é deduzido da unidade;
+# - cada tripulante pode ter a sua linha de base ("sim") e os seus limites
+#   ("limites") por parâmetro vital; o que não declarar usa os do parâmetro.
+#
+# O catálogo é guardado em COLUNAS: para cada parâmetro vital, uma lista de
+# médias, uma de desvios e uma de limites, alinhadas a 'ids'. O monitoramento
+# lê a coluna na linha do tripulante; a busca por id é um dicionário (O(1)).
+#
+# Exemplo de entrada:
+#   {"id": "Astronauta_03", "sim": {"Frequencia Cardiaca": [56, 6]},
+#    "limites": {"Frequencia Cardiaca": [45, 100, 40, 110, 35, 120]}}
+# Limites: (normal_min, normal_max, atencao_min, atencao_max, critico_min, critico_max)
+# -----------------------------------------------------------------------------
+
+ARQUIVO_TRIPULACAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tripulacao.json")
+
+ESCOPO_VITAL = "vital"
+ESCOPO_AMBIENTE = "cabine"
+ESCOPOS_VALIDOS = (ESCOPO_VITAL, ESCOPO_AMBIENTE)
+
+SENTIDO_AMBOS = "ambos" # Alarme abaixo e acima da faixa normal
+SENTIDO_BAIXO = "baixo" # Só abaixo (ex.: SpO2)
+SENTIDO_ALTO = "alto"   # Só acima (ex.: CO2)
+SENTIDOS_VALIDOS = (SENTIDO_AMBOS, SENTIDO_BAIXO, SENTIDO_ALTO)
+
+# Coluna de um parâmetro vital: 'medias', 'desvios' e 'limites' são listas alinhadas a CatalogoTripulacao.ids
+ColunaVital = namedtuple("ColunaVital", ["parametro", "unidade", "sentido", "casas_decimais",
+                                         "medias", "desvios", "limites"])
+
+
+def _limites(valor, origem):
+    try:
+        limites = tuple(float(v) for v in valor)
+    except (TypeError, ValueError):
+        limites = ()
+    if len(limites) != 6:
+        raise ValueError(f"Limites de {origem} devem ter 6 valores numéricos: {valor!r}")
+    return limites
+
+
+def _simulacao(valor, origem):
+    try:
+        media, desvio = (float(v) for v in valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"Simulação de {origem} deve ser [média, desvio]: {valor!r}")
+    if desvio < 0:
+        raise ValueError(f"Desvio padrão de {origem} deve ser >= 0.")
+    return media, desvio
+
+
+class CatalogoTripulacao:
+    """Tripulação e parâmetros monitorados, com linhas de base e limites em colunas."""
+
+    def __init__(self, parametros, tripulacao):
+        self.parametros = {}  # nome -> definição padrão (unidade, escopo, sentido, casas, limites, sim)
+        for item in parametros:
+            definicao = self._normalizar_parametro(item)
+            if definicao["id"] in self.parametros:
+                raise ValueError(f"Parâmetro duplicado no catálogo: '{definicao['id']}'.")
+            self.parametros[definicao["id"]] = definicao
+        self.vitais = tuple(nome for nome, d in self.parametros.items() if d["escopo"] == ESCOPO_VITAL)
+        self.ambiente = tuple(nome for nome, d in self.parametros.items() if d["escopo"] == ESCOPO_AMBIENTE)
+
+        ids = []
+        self.indice = {} # id -> linha nas colunas
+        # Colunas: parâmetro vital -> lista alinhada a 'ids'. Os valores padrão são
+        # o mesmo objeto em todas as linhas sem sobrescrita (custo de memória de uma referência)
+        self.medias = {nome: [] for nome in self.vitais}
+        self.desvios = {nome: [] for nome in self.vitais}
+        self.limites = {nome: [] for nome in self.vitais}
+        for item in tripulacao:
+            self._adicionar_tripulante(item, ids)
+        self.ids = tuple(ids)
+
+        self._colunas_vitais = tuple(
+            ColunaVital(nome, self.parametros[nome]["unidade"], self.parametros[nome]["sentido"],
+                        self.parametros[nome]["casas_decimais"], self.medias[nome], self.desvios[nome], self.limites[nome])
+            for nome in self.vitais)
+
+    @staticmethod
+    def _normalizar_parametro(item):
+        try:
+            nome = str(item["id"])
+        except (KeyError, TypeError):
+            raise ValueError(f"Entrada de parâmetro inválida (sem 'id'): {item!r}")
+        escopo = str(item.get("escopo", "")).lower()
+        if escopo not in ESCOPOS_VALIDOS:
+            raise ValueError(f"Escopo '{escopo}' inválido para '{nome}'. Válidos: {', '.join(ESCOPOS_VALIDOS)}.")
+        sentido = str(item.get("sentido", SENTIDO_AMBOS)).lower()
+        if sentido not in SENTIDOS_VALIDOS:
+            raise ValueError(f"Sentido '{sentido}' inválido para '{nome}'. Válidos: {', '.join(SENTIDOS_VALIDOS)}.")
+        return {
+            "id": nome,
+            "escopo": escopo,
+            "unidade": str(item.get("unidade", "")),
+            "sentido": sentido,
+            "casas_decimais": int(item.get("casas_decimais", 0)),
+            "limites": _limites(item.get("limites"), f"'{nome}'"),
+            "sim": _simulacao(item.get("sim"), f"'{nome}'"),
+        }
+
+    def _adicionar_tripulante(self, item, ids):
+        try:
+            id_tripulante = str(item["id"])
+        except (KeyError, TypeError):
+            raise ValueError(f"Entrada de tripulante inválida (sem 'id'): {item!r}")
+        if id_tripulante in self.indice:
+            raise ValueError(f"Tripulante duplicado no catálogo: '{id_tripulante}'.")
+        simulacao = dict(item.get("sim", {}))
+        limites = dict(item.get("limites", {}))
+        fora_do_escopo = [nome for nome in (*simulacao, *limites) if nome not in self.medias]
+        if fora_do_escopo:
+            raise ValueError(f"Tripulante '{id_tripulante}' sobrescreve parâmetros que não são vitais: "
+                             f"{', '.join(sorted(set(fora_do_escopo)))}.")
+
+        self.indice[id_tripulante] = len(ids)
+        ids.append(id_tripulante)
+        for nome in self.vitais:
+            padrao = self.parametros[nome]
+            origem = f"'{nome}' de '{id_tripulante}'"
+            media, desvio = _simulacao(simulacao[nome], origem) if nome in simulacao else padrao["sim"]
+            self.medias[nome].append(media)
+            self.desvios[nome].append(desvio)
+            self.limites[nome].append(_limites(limites[nome], origem) if nome in limites else padrao["limites"])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, id_tripulante):
+        return id_tripulante in self.indice
+
+    def colunas_vitais(self):
+        """Colunas de cada parâmetro vital, prontas para o laço do monitoramento."""
+        return self._colunas_vitais
+
+    def linha_base(self, id_tripulante, parametro):
+        """(média, desvio) simulados do parâmetro vital para o tripulante (O(1))."""
+        linha = self.indice[id_tripulante]
+        return self.medias[parametro][linha], self.desvios[parametro][linha]
+
+    def limites_de(self, escopo, parametro):
+        """(limites, sentido) que classificam uma leitura. Para um tripulante e um
+           parâmetro vital, os limites dele; nos demais casos, os do parâmetro."""
+        definicao = self.parametros[parametro]
+        linha = self.indice.get(escopo)
+        if linha is None or definicao["escopo"] != ESCOPO_VITAL:
+            return definicao["limites"], definicao["sentido"]
+        return self.limites[parametro][linha], definicao["sentido"]
+
+
+def carregar_catalogo(caminho=ARQUIVO_TRIPULACAO):
+    """Carrega o catálogo de tripulação e parâmetros de um arquivo JSON ou TOML."""
+    if caminho.lower().endswith(".toml"):
+        try:
+            import tomllib # Disponível a partir do Python 3.11
+        except ImportError:
+            raise ValueError("Leitura de TOML requer Python 3.11+ (tomllib). Use um arquivo JSON.")
+        with open(caminho, "rb") as arquivo:
+            dados = tomllib.load(arquivo)
+    else:
+        with open(caminho, encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+    return CatalogoTripulacao(dados.get("parametros", []), dados.get("tripulacao", []))
+
+
+# --- Bloco de Execução Principal (para teste) ---
+if __name__ == "__main__":
+    try:
+        catalogo = carregar_catalogo(sys.argv[1] if len(sys.argv) > 1 else ARQUIVO_TRIPULACAO)
+        print(f"\n--- CATÁLOGO DA TRIPULAÇÃO ({len(catalogo)} tripulantes) ---")
+        print(f"  Vitais (por tripulante): {', '.join(catalogo.vitais)}")
+        print(f"  Cabine (nave):           {', '.join(catalogo.ambiente)}")
+        for id_tripulante in catalogo.ids:
+            proprios = [f"{nome} {media:g}±{desvio:g}" for nome in catalogo.vitais
+                        for media, desvio in (catalogo.linha_base(id_tripulante, nome),)
+                        if (media, desvio) != catalogo.parametros[nome]["sim"]]
+            print(f"  {id_tripulante}: {'; '.join(proprios) or 'linha de base padrão'}")
+    except KeyboardInterrupt:
+        print("\n\nTeste do catálogo interrompido pelo usuário.")
+    except Exception as e:
+        print(f"\nOcorreu um erro inesperado: {e}")
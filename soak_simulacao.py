@@ -0,0 +1,244 @@
+# -----------------------------------------------------------------------------
+# Teste de Longa Duração (Soak) dos Laços Contínuos da Aurora I
+# -----------------------------------------------------------------------------
+# Os laços contínuos devem rodar pela missão inteira sem crescer na memória.
+# Este teste executa cada um sem console e em tempo acelerado (relógio rápido,
+# input() roteirizado, stdout descartado, alarme sonoro desligado):
+# - monitoramento: iniciar_monitoramento_periodico (uma iteração por ciclo);
+# - painel: PainelComandosNave.iniciar_interface (um passo por comando; a nave
+#   é reabastecida e reposicionada a cada passo para nunca chegar);
+# - diagnostico: executar_diagnostico_completo repetido.
+# Depois de um aquecimento, amostra o RSS e a memória rastreada pelo
+# tracemalloc em intervalos. O crescimento por iteração é medido na segunda
+# metade da janela: buffers limitados (ex.: o log do painel) enchem na primeira
+# e param; um vazamento continua crescendo. Mostra os pontos de alocação que
+# mais cresceram nessa metade e falha (código 1) se passar do orçamento.
+#
+# Uso:
+#   python soak_simulacao.py [--iteracoes N] [--filtro TEXTO]
+#                            [--orcamento-bytes B] [--amostras K]
+# -----------------------------------------------------------------------------
+
+import argparse
+import builtins
+import contextlib
+import os
+import sys
+import time
+import tracemalloc
+
+import modulo_aleatorio
+import modulo_relogio_simulacao
+
+SEMENTE_PADRAO = 2031
+ITERACOES_PADRAO = 200_000
+AQUECIMENTO_MINIMO = 2_000
+AMOSTRAS_PADRAO = 10
+ORCAMENTO_PADRAO_BYTES_POR_ITERACAO = 4.0 # Um objeto vazado por iteração já passa disso
+PONTOS_ALOCACAO_EXIBIDOS = 5
+
+
+def _rss_bytes():
+    """Memória residente atual do processo (Linux: /proc; senão, o pico via resource)."""
+    try:
+        with open("/proc/self/statm") as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+        except ImportError:
+            return 0
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico if sys.platform == "darwin" else pico * 1024 # macOS em bytes, Linux em KB
+
+
+class MedidorSoak:
+    """Conta iterações, amostra a memória e tira a referência no meio da janela medida."""
+
+    def __init__(self, iteracoes, amostras=AMOSTRAS_PADRAO):
+        self.iteracoes = iteracoes
+        self.aquecimento = max(AQUECIMENTO_MINIMO, iteracoes // 20)
+        self.intervalo = max(1, iteracoes // amostras)
+        self.meio = iteracoes // 2
+        self.executadas = 0
+        self.amostras = []  # (iteração, rss_bytes, rastreado_bytes)
+        self.referencia = None
+        self.amostra_meio = None
+        self.final = None
+
+    def _amostrar(self):
+        self.amostras.append((self.executadas - self.aquecimento, _rss_bytes(), tracemalloc.get_traced_memory()[0]))
+
+    def iteracao(self):
+        """Registra uma iteração. Retorna True quando o teste deve parar."""
+        self.executadas += 1
+        medidas = self.executadas - self.aquecimento
+        if medidas == self.meio:
+            rastreado = tracemalloc.get_traced_memory()[0]
+            self.referencia = tracemalloc.take_snapshot()
+            # RSS lido depois da referência: a própria snapshot não conta como crescimento do laço
+            self.amostra_meio = (medidas, _rss_bytes(), rastreado)
+        if medidas >= 0 and medidas % self.intervalo == 0:
+            self._amostrar()
+        if medidas >= self.iteracoes:
+            if self.amostras[-1][0] != medidas:
+                self._amostrar()
+            self.final = tracemalloc.take_snapshot()
+            return True
+        return False
+
+
+@contextlib.contextmanager
+def _sem_console(responder_comando):
+    """Descarta o stdout (sem acumular), desliga o alarme sonoro e responde
+       input(): o prompt de comandos do painel vai para responder_comando()."""
+    import modulo_monitoramento_vital as vital
+    input_original, alarme_original = builtins.input, vital._disparar_alarme
+
+    def _input(prompt=""):
+        return responder_comando() if prompt.startswith("Comandos") else ""
+
+    builtins.input = _input
+    vital._disparar_alarme = lambda mensagens: None
+    try:
+        with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+            yield
+    finally:
+        builtins.input = input_original
+        vital._disparar_alarme = alarme_original
+
+
+class _RelogioSoak(modulo_relogio_simulacao.RelogioSimulacao):
+    """Relógio rápido que conta cada espera como uma iteração do laço."""
+
+    def __init__(self, medidor):
+        super().__init__(modulo_relogio_simulacao.MODO_RAPIDO)
+        self.medidor = medidor
+
+    def dormir(self, segundos):
+        super().dormir(segundos)
+        if self.medidor.iteracao():
+            raise KeyboardInterrupt # O laço de monitoramento encerra de forma limpa
+
+
+# --- Laços Testados ---
+
+def soak_monitoramento(medidor):
+    import modulo_monitoramento_vital as vital
+    with _sem_console(lambda: "sair"):
+        vital.iniciar_monitoramento_periodico(intervalo_segundos=30, relogio=_RelogioSoak(medidor))
+
+
+def soak_painel(medidor):
+    import modulo_painel_comando as painel_mod
+    relogio = modulo_relogio_simulacao.RelogioSimulacao(modulo_relogio_simulacao.MODO_RAPIDO)
+    painel = painel_mod.PainelComandosNave(relogio=relogio, exibir_logs=False)
+
+    def _comando():
+        if medidor.iteracao():
+            return "sair"
+        # Mantém a viagem em curso indefinidamente: o laço, não a chegada, é o que se testa
+        painel.combustivel_uac = painel_mod.CAPACIDADE_TOTAL_UAC
+        painel.distancia_marte_km = painel_mod.DISTANCIA_INICIAL_MARTE_KM
+        return ""
+
+    with _sem_console(_comando):
+        painel.iniciar_interface()
+
+
+def soak_diagnostico(medidor):
+    import modulo_diagnostico as diag
+    relogio = modulo_relogio_simulacao.RelogioSimulacao(modulo_relogio_simulacao.MODO_RAPIDO)
+    with _sem_console(lambda: "sair"):
+        while not medidor.iteracao():
+            diag.executar_diagnostico_completo(relogio=relogio)
+
+
+CASOS_SOAK = {
+    "monitoramento": soak_monitoramento,
+    "painel": soak_painel,
+    "diagnostico": soak_diagnostico,
+}
+
+
+# --- Execução e Relatório ---
+
+def executar_soak(nome, iteracoes=ITERACOES_PADRAO, orcamento_bytes=ORCAMENTO_PADRAO_BYTES_POR_ITERACAO,
+                  amostras=AMOSTRAS_PADRAO, semente=SEMENTE_PADRAO):
+    """Executa um caso e retorna um dicionário com as amostras, o crescimento
+       por iteração e os pontos de alocação que mais cresceram."""
+    modulo_aleatorio.semear(semente)
+    medidor = MedidorSoak(iteracoes, amostras)
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    try:
+        CASOS_SOAK[nome](medidor)
+    finally:
+        duracao = time.perf_counter() - inicio
+        if medidor.final is None and medidor.referencia is not None:
+            medidor.final = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    if medidor.final is None or medidor.amostra_meio is None:
+        raise RuntimeError(f"O laço '{nome}' terminou antes do meio da janela medida "
+                           f"({medidor.executadas} iterações).")
+    medidas, rss_final, rastreado_final = medidor.amostras[-1]
+    meio, rss_meio, rastreado_meio = medidor.amostra_meio
+    janela = max(1, medidas - meio)
+    crescimento = (rastreado_final - rastreado_meio) / janela
+    diferencas = [d for d in medidor.final.compare_to(medidor.referencia, "lineno") if d.size_diff > 0]
+    return {
+        "nome": nome,
+        "iteracoes": medidas,
+        "duracao_s": duracao,
+        "amostras": medidor.amostras,
+        "bytes_por_iteracao": crescimento,
+        "rss_bytes_por_iteracao": (rss_final - rss_meio) / janela,
+        "orcamento_bytes": orcamento_bytes,
+        "aprovado": crescimento <= orcamento_bytes,
+        "maiores_crescimentos": diferencas[:PONTOS_ALOCACAO_EXIBIDOS],
+    }
+
+
+def exibir_relatorio(resultado):
+    print(f"\n--- SOAK: {resultado['nome']} ({resultado['iteracoes']:,} iterações medidas, "
+          f"{resultado['duracao_s']:.1f}s) ---")
+    print(f"  {'iteração':>10} | {'RSS (MB)':>9} | {'tracemalloc (KB)':>16}")
+    for iteracao, rss, rastreado in resultado["amostras"]:
+        print(f"  {iteracao:>10,} | {rss / 2**20:>9.1f} | {rastreado / 1024:>16.1f}")
+    print(f"  Crescimento na 2ª metade: {resultado['bytes_por_iteracao']:+.3f} B/iteração (tracemalloc), "
+          f"{resultado['rss_bytes_por_iteracao']:+.3f} B/iteração (RSS)")
+    if resultado["maiores_crescimentos"]:
+        print("  Pontos de alocação que mais cresceram na 2ª metade:")
+        for diferenca in resultado["maiores_crescimentos"]:
+            quadro = diferenca.traceback[0]
+            print(f"    {os.path.basename(quadro.filename)}:{quadro.lineno:<5} "
+                  f"{diferenca.size_diff / 1024:+10.1f} KB ({diferenca.count_diff:+,} blocos)")
+    marcador = "[ OK ]" if resultado["aprovado"] else "[FALHA]"
+    print(f"{marcador} Orçamento: {resultado['orcamento_bytes']:.1f} B/iteração")
+    print("-----------------------------------------")
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Teste de longa duração dos laços contínuos da Aurora I.")
+    parser.add_argument("--iteracoes", type=int, default=ITERACOES_PADRAO, help="Iterações medidas por laço.")
+    parser.add_argument("--filtro", default=None, help="Executa só os laços cujo nome contém este texto.")
+    parser.add_argument("--orcamento-bytes", type=float, default=ORCAMENTO_PADRAO_BYTES_POR_ITERACAO,
+                        help="Crescimento máximo (bytes rastreados por iteração) antes de falhar.")
+    parser.add_argument("--amostras", type=int, default=AMOSTRAS_PADRAO, help="Amostras de memória por laço.")
+    opcoes = parser.parse_args()
+    try:
+        aprovados = True
+        for nome_caso in CASOS_SOAK:
+            if opcoes.filtro and opcoes.filtro not in nome_caso:
+                continue
+            resultado_caso = executar_soak(nome_caso, opcoes.iteracoes, opcoes.orcamento_bytes, opcoes.amostras)
+            exibir_relatorio(resultado_caso)
+            aprovados = aprovados and resultado_caso["aprovado"]
+        sys.exit(0 if aprovados else 1)
+    except KeyboardInterrupt:
+        print("\n\nTeste de longa duração interrompido pelo usuário.")
+    except (OSError, RuntimeError) as e:
+        print(f"\nErro no teste de longa duração: {e}")
+        sys.exit(1)